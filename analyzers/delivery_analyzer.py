@@ -1,19 +1,20 @@
-import pandas as pd
-import plotly.graph_objects as go
 import logging
 
+from analyzers.product_table import ProductTable
+
 
 class DeliveryAnalyzer:
     def __init__(self, products_df):
-        """배송 타입 분석기 초기화"""
-        self.products_df = products_df
+        """배송 타입 분석기 초기화
 
-        # delivery_type 컬럼이 없거나 비어있으면 기본값 설정
-        if "delivery_type" not in self.products_df.columns:
-            logging.warning(
-                "delivery_type 컬럼이 없습니다. '일반배송'으로 기본값 설정합니다."
-            )
-            self.products_df["delivery_type"] = "일반배송"
+        Args:
+            products_df (pd.DataFrame | ProductTable): CoupangParser를 통해 파싱된
+                상품 데이터프레임 또는 다른 분석기와 공유하는 ProductTable
+        """
+        # 호출한 쪽의 DataFrame은 수정하지 않음
+        # (delivery_type이 없거나 비어 있으면 테이블에서 '일반배송'으로 정리됨)
+        self.table = ProductTable.of(products_df)
+        self.products_df = self.table.frame
 
         self.stats = self._calculate_delivery_stats()
 
@@ -24,7 +25,7 @@ class DeliveryAnalyzer:
 
         stats = {
             "counts": delivery_counts.to_dict(),
-            "percentages": (delivery_counts / total * 100).to_dict(),
+            "percentages": (delivery_counts / total * 100).to_dict() if total else {},
             "total": total,
         }
 
@@ -33,6 +34,8 @@ class DeliveryAnalyzer:
 
     def create_delivery_pie_chart(self):
         """배송 타입 비율 스택 막대 그래프 생성 (텍스트 없이)"""
+        import plotly.graph_objects as go
+
         if self.stats["total"] == 0:
             logging.warning("분석할 데이터가 없습니다.")
             return None
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+import logging
+import threading
+
+from analyzers.stats_engine import data_fingerprint
+
+# 보관할 최대 그림 수와 전체 데이터 점 수 (대량 모드 그림 크기 한도)
+FIGURE_CACHE_MAX_ENTRIES = 64
+FIGURE_CACHE_MAX_POINTS = 2_000_000
+
+# 그림 크기를 셀 때 보는 trace 배열 속성
+_POINT_ATTRIBUTES = ("x", "y", "values")
+
+
+def frame_fingerprint(df):
+    """DataFrame 전체 컬럼 내용의 지문 (그림 캐시 키)"""
+    return data_fingerprint(df, columns=tuple(df.columns))
+
+
+def figure_key(name, fingerprint=None, **params):
+    """그림 캐시 키 (차트 이름, 데이터 지문, 차트 파라미터)"""
+    return (name, fingerprint, tuple(sorted(params.items())))
+
+
+def figure_points(figure):
+    """그림의 데이터 점 수 (trace별 x/y/values 중 가장 긴 배열 길이의 합)"""
+    points = 0
+    for trace in figure.data:
+        lengths = [0]
+        for attribute in _POINT_ATTRIBUTES:
+            try:
+                values = trace[attribute]
+            except (KeyError, ValueError):
+                continue
+            if values is not None:
+                lengths.append(len(values))
+        points += max(lengths)
+    return points
+
+
+class FigureCache:
+    """Plotly 그림(go.Figure) 객체 캐시 (데이터 지문 + 차트 파라미터 키, LRU)
+
+    Streamlit이 다시 실행될 때마다 같은 데이터로 그림을 새로 만들지 않도록,
+    처음 만든 go.Figure 객체를 그대로 보관해 두고 이후에는 같은 객체를
+    돌려줍니다. st.plotly_chart는 go.Figure를 받으면 검증된 것으로 보고
+    to_dict()만 하므로, JSON/dict로 보관했다가 넘길 때처럼 그림 전체를 다시
+    검증하지 않습니다. 보관한 그림은 여러 세션이 공유하므로 꺼낸 뒤 수정하면
+    안 됩니다. 그림 수와 전체 데이터 점 수가 한도를 넘으면 가장 오래 쓰지 않은
+    그림부터 버립니다.
+    """
+
+    def __init__(
+        self,
+        max_entries=FIGURE_CACHE_MAX_ENTRIES,
+        max_points=FIGURE_CACHE_MAX_POINTS,
+    ):
+        """FigureCache 초기화
+
+        Args:
+            max_entries (int): 보관할 최대 그림 수
+            max_points (int): 보관한 그림들의 전체 데이터 점 수 한도
+        """
+        self.max_entries = max_entries
+        self.max_points = max_points
+        self._entries = OrderedDict()  # 키 → (그림, 데이터 점 수)
+        self._points = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """캐시된 그림 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, figure):
+        """그림을 저장하고 그대로 반환"""
+        points = figure_points(figure)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._points -= previous[1]
+            self._entries[key] = (figure, points)
+            self._points += points
+            self._evict()
+        return figure
+
+    def _evict(self):
+        """한도를 넘으면 가장 오래 쓰지 않은 그림부터 제거"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._points > self.max_points
+        ):
+            key, (_, points) = self._entries.popitem(last=False)
+            self._points -= points
+            logging.info(f"그림 캐시 제거: {key[0]} ({points}개 점)")
+
+    def get_or_build(self, key, build):
+        """캐시된 그림 반환, 없으면 build()로 만들어 저장
+
+        build()가 None을 반환하면(그릴 데이터 없음) 캐시하지 않고 None을 반환합니다.
+        """
+        figure = self.get(key)
+        if figure is None:
+            figure = build()
+            if figure is None:
+                return None
+            self.put(key, figure)
+        return figure
+
+    def stats(self):
+        """캐시 상태 (그림 수, 데이터 점 수, 적중/미적중)"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "points": self._points,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._points = 0
@@ -1,27 +1,21 @@
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 import logging
 
+from analyzers.product_table import ProductTable
+from analyzers.rank_chart import create_rank_bar_chart
+
 
 class PriceAnalyzer:
     def __init__(self, products_df):
         """PriceAnalyzer 초기화
 
         Args:
-            products_df (pd.DataFrame): CoupangParser를 통해 파싱된 상품 데이터프레임
+            products_df (pd.DataFrame | ProductTable): CoupangParser를 통해 파싱된
+                상품 데이터프레임 또는 다른 분석기와 공유하는 ProductTable
         """
-        self.products_df = products_df.copy()
-        # 'price' 컬럼이 없거나 비어있는 경우, 0으로 채워진 컬럼 생성
-        if (
-            "price" not in self.products_df.columns
-            or self.products_df["price"].isnull().all()
-        ):
-            self.products_df["price"] = 0
-        else:
-            # NaN 값을 0으로 채우고 정수형으로 변환
-            self.products_df["price"] = self.products_df["price"].fillna(0).astype(int)
+        # 정리된 공유 테이블을 복사하지 않고 사용 (가격 결측은 0으로 정리되어 있음)
+        self.table = ProductTable.of(products_df)
+        self.products_df = self.table.frame
+        self.stats_engine = self.table.stats_engine
 
         # --- 디버깅 로그 추가 ---
         logging.info(
@@ -30,20 +24,10 @@ class PriceAnalyzer:
         # --------------------
 
     def analyze_prices(self):
-        """가격 데이터 종합 분석"""
-        # 가격이 0보다 큰 유효한 데이터만 필터링
-        prices = self.products_df["price"][self.products_df["price"] > 0].dropna()
-
-        # 분석할 가격 데이터가 없는 경우 None 반환
-        if prices.empty:
-            return {
-                "basic_stats": self._calculate_basic_stats(prices),
-                "price_distribution": self._analyze_price_distribution(prices),
-            }
-
+        """가격 데이터 종합 분석 (통계는 StatsEngine에서 메모이즈)"""
         analysis = {
-            "basic_stats": self._calculate_basic_stats(prices),
-            "price_distribution": self._analyze_price_distribution(prices),
+            "basic_stats": self._calculate_basic_stats(),
+            "price_distribution": self._analyze_price_distribution(),
             # 'rocket_vs_normal': self._compare_rocket_prices(), # 다음 단계에서 구현
             # 'seller_analysis': self._analyze_by_seller(), # 다음 단계에서 구현
             # 'discount_analysis': self._analyze_discounts() # 다음 단계에서 구현
@@ -51,94 +35,36 @@ class PriceAnalyzer:
 
         return analysis
 
-    def _calculate_basic_stats(self, prices):
-        """기본 통계 계산"""
-        if prices.empty:
-            return {
-                "count": 0,
-                "mean": 0,
-                "median": 0,
-                "std": 0,
-                "min": 0,
-                "max": 0,
-                "q25": 0,
-                "q75": 0,
-            }
-
-        return {
-            "count": len(prices),
-            "mean": prices.mean(),
-            "median": prices.median(),
-            "std": prices.std(),
-            "min": prices.min(),
-            "max": prices.max(),
-            "q25": prices.quantile(0.25),
-            "q75": prices.quantile(0.75),
-        }
-
-    def _analyze_price_distribution(self, prices):
-        """가격 분포 분석"""
-        if prices.empty:
-            return pd.Series(dtype=int)
-
-        # 가격 구간 설정
-        bins = [0, 10000, 30000, 50000, 100000, 200000, float("inf")]
-        labels = [
-            "1만원 미만",
-            "1-3만원",
-            "3-5만원",
-            "5-10만원",
-            "10-20만원",
-            "20만원 이상",
-        ]
-
-        price_ranges = pd.cut(
-            prices, bins=bins, labels=labels, right=False, include_lowest=True
-        )
-        distribution = price_ranges.value_counts().sort_index()
+    def _calculate_basic_stats(self):
+        """기본 통계 (가격이 0보다 큰 상품 기준)"""
+        stats = self.stats_engine.column_stats("price")
+        keys = ("count", "mean", "median", "std", "min", "max", "q25", "q75")
+        return {key: stats[key] for key in keys}
 
-        return distribution
+    def _analyze_price_distribution(self):
+        """가격 구간별 분포"""
+        return self.stats_engine.distribution("price")
 
     def create_product_price_bar_chart(self):
         """상품별 가격 막대 차트 생성"""
-        price_data = self.products_df[self.products_df["price"] > 0].copy()
+        import plotly.graph_objects as go
+
+        price_data = self.table.priced
         if price_data.empty:
             return go.Figure().update_layout(title="상품별 가격 정보 (데이터 없음)")
 
-        # 가격 기준 오름차순 정렬
-        price_data = price_data.sort_values(by="price", ascending=True).reset_index(
-            drop=True
-        )
-
-        stats = self.analyze_prices()["basic_stats"]
+        stats = self._calculate_basic_stats()
         median_price = stats["median"]  # 중간값 사용
         min_price = stats["min"]
         max_price = stats["max"]
 
-        # 색상 결정
-        colors = []
-        for price in price_data["price"]:
-            if price == min_price:
-                colors.append("blue")
-            elif price == max_price:
-                colors.append("red")
-            elif price == median_price:  # 중간값 비교
-                colors.append("green")
-            else:
-                colors.append("grey")
-
-        price_data["name"] = price_data["name"].str.wrap(20)  # 긴 상품명 줄바꿈
-
-        fig = go.Figure(
-            go.Bar(
-                x=price_data.index,  # X축을 고유한 인덱스로 변경
-                y=price_data["price"],
-                marker_color=colors,
-                text=price_data["price"].apply(lambda x: f"₩{x:,.0f}"),
-                textposition="auto",
-                customdata=price_data["name"],  # hovertemplate에서 사용할 데이터
-                hovertemplate="<b>%{customdata}</b><br>가격: %{y:,.0f}원<extra></extra>",
-            )
+        # 가격 오름차순, 상품 수가 많으면 WebGL 대량 모드로 자동 전환 (rank_chart 참고)
+        fig = create_rank_bar_chart(
+            price_data["price"],
+            price_data["name"],
+            stats,
+            text_format="₩{:,.0f}",
+            hover_label="가격: %{y:,.0f}원",
         )
 
         fig.update_layout(
@@ -155,9 +81,12 @@ class PriceAnalyzer:
 
     def create_price_boxplot(self):
         """가격 분포 Box Plot 생성"""
-        prices = self.products_df["price"][self.products_df["price"] > 0].dropna()
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        price_data = self.table.priced
 
-        if prices.empty:
+        if price_data.empty:
             return go.Figure().update_layout(
                 title="가격 분포 Box Plot (데이터 없음)",
                 height=200,
@@ -172,7 +101,7 @@ class PriceAnalyzer:
             )
 
         fig = px.box(
-            self.products_df[self.products_df["price"] > 0],
+            price_data,
             x="price",
             title="가격 분포 Box Plot",
             points="all",  # 모든 데이터 포인트 표시
@@ -0,0 +1,173 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from analyzers.stats_engine import StatsEngine, data_fingerprint
+from parsers.product_columns import DELIVERY_TYPES, NUMERIC_DTYPES, PRODUCT_COLUMNS
+
+# 배송 타입을 알 수 없는 상품의 기본값
+DEFAULT_DELIVERY_TYPE = "일반배송"
+
+# 캐시되는 필터 뷰 (이름 → 행 마스크)
+VIEW_FILTERS = {
+    "priced": lambda frame: frame["price"] > 0,
+    "reviewed": lambda frame: frame["review_count"] > 0,
+}
+
+
+def _normalize_numeric(series, dtype):
+    """숫자/불리언 컬럼을 결측 없는 압축 dtype으로 (이미 그렇다면 그대로)"""
+    if series.dtype == dtype and not series.hasnans:
+        return series
+    if dtype == np.bool_:
+        return series.fillna(False).astype(bool)
+    return pd.to_numeric(series, errors="coerce").fillna(0).astype(dtype)
+
+
+def _normalize_delivery(series):
+    """delivery_type을 DELIVERY_TYPES 카테고리로 (알 수 없는 값은 기본값)"""
+    if (
+        isinstance(series.dtype, pd.CategoricalDtype)
+        and list(series.cat.categories) == list(DELIVERY_TYPES)
+        and not series.hasnans
+    ):
+        return series
+    values = series.astype(object).where(series.isin(DELIVERY_TYPES))
+    return pd.Series(
+        pd.Categorical(
+            values.fillna(DEFAULT_DELIVERY_TYPE), categories=list(DELIVERY_TYPES)
+        ),
+        index=series.index,
+    )
+
+
+def _locked(values, rows):
+    """배열(rows가 주어지면 해당 행만)의 쓰기 불가 사본"""
+    values = values.copy() if rows is None else values[rows]
+    values.flags.writeable = False
+    return values
+
+
+def _read_only_frame(frame, rows=None):
+    """frame(rows가 주어지면 해당 행 위치만)을 쓰기 불가 배열로 다시 조립
+
+    numpy 컬럼과 카테고리 코드는 한 번 복사(또는 행 선택)해 쓰기 불가로 표시하므로,
+    공유된 값을 제자리에서 바꾸려 하면 ValueError가 납니다. 그 외 확장 dtype
+    (Arrow 문자열 등)은 그대로 둡니다.
+    """
+    columns = {}
+    for name in frame.columns:
+        series = frame[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = _locked(series.cat.codes.to_numpy(), rows)
+            columns[name] = pd.Categorical.from_codes(codes, dtype=series.dtype)
+        elif isinstance(series.dtype, np.dtype):
+            columns[name] = _locked(series.to_numpy(), rows)
+        else:
+            columns[name] = (series if rows is None else series.iloc[rows]).array
+    index = frame.index if rows is None else frame.index[rows]
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+class ProductTable:
+    """분석기들이 공유하는 읽기 전용 상품 테이블
+
+    PRODUCT_COLUMNS를 모두 갖추고 숫자 컬럼은 결측 없는 압축 dtype, delivery_type은
+    카테고리로 정리된 frame을 한 번만 만듭니다. 자주 쓰는 필터 결과(가격 있는
+    상품, 리뷰 있는 상품)와 통계 엔진은 테이블에 캐시되어 함께 사용됩니다.
+
+    읽기 전용 계약: 같은 테이블이 모든 분석기와 세션 상태에 공유되므로 컬럼
+    배열은 생성 시 한 번 복사해 쓰기 불가로 표시하고, frame/view는 호출마다 얕은
+    사본을 돌려줍니다. 값을 제자리에서 바꾸면 ValueError가 나고, 받은 사본에
+    컬럼을 추가/교체해도 다른 사용자에게는 보이지 않습니다. 값을 고쳐 써야 하면
+    frame.copy()로 복사한 뒤 수정합니다.
+    """
+
+    def __init__(self, products_df):
+        """ProductTable 초기화
+
+        Args:
+            products_df (pd.DataFrame): CoupangParser를 통해 파싱된 상품 데이터프레임
+        """
+        fixed = {}
+        for column in PRODUCT_COLUMNS:
+            if column in products_df.columns:
+                series = products_df[column]
+            else:
+                logging.warning(f"{column} 컬럼이 없습니다. 기본값으로 채웁니다.")
+                series = pd.Series(
+                    None, index=products_df.index, dtype=object, name=column
+                )
+            if column in NUMERIC_DTYPES:
+                normalized = _normalize_numeric(series, NUMERIC_DTYPES[column])
+            elif column == "delivery_type":
+                normalized = _normalize_delivery(series)
+            else:
+                normalized = series
+            if normalized is not series or column not in products_df.columns:
+                fixed[column] = normalized
+
+        frame = products_df.assign(**fixed) if fixed else products_df
+        # 원본 DataFrame과 배열을 공유하지 않는 쓰기 불가 사본 (한 번만 복사)
+        self._frame = _read_only_frame(frame)
+        self._views = {}
+        self._stats_engine = None
+        self._fingerprint = None
+        logging.info(
+            f"ProductTable 생성: {len(self._frame)}개 상품, "
+            f"정리한 컬럼 {sorted(fixed) or '없음'}"
+        )
+
+    @classmethod
+    def of(cls, products):
+        """ProductTable이면 그대로, DataFrame이면 새 테이블로"""
+        return products if isinstance(products, cls) else cls(products)
+
+    @property
+    def frame(self):
+        """전체 상품 (쓰기 불가 배열을 공유하는 얕은 사본)"""
+        return self._frame.copy(deep=False)
+
+    def __len__(self):
+        return len(self._frame)
+
+    @property
+    def empty(self):
+        return self._frame.empty
+
+    def view(self, name):
+        """VIEW_FILTERS의 필터를 적용한 행 (처음 요청할 때 한 번만 계산, 얕은 사본)"""
+        view = self._views.get(name)
+        if view is None:
+            frame = self._frame
+            rows = np.flatnonzero(VIEW_FILTERS[name](frame).to_numpy())
+            view = _read_only_frame(frame, rows)
+            self._views[name] = view
+        return view.copy(deep=False)
+
+    @property
+    def priced(self):
+        """가격이 0보다 큰 상품"""
+        return self.view("priced")
+
+    @property
+    def reviewed(self):
+        """리뷰가 1개 이상인 상품"""
+        return self.view("reviewed")
+
+    @property
+    def stats_engine(self):
+        """숫자 컬럼 통계 엔진 (데이터 버전별 메모이즈된 엔진 공유)"""
+        if self._stats_engine is None:
+            self._stats_engine = StatsEngine.for_frame(self._frame)
+        return self._stats_engine
+
+    @property
+    def fingerprint(self):
+        """전체 컬럼 내용의 지문 (그림 캐시 키, 처음 요청할 때 한 번 계산)"""
+        if self._fingerprint is None:
+            self._fingerprint = data_fingerprint(
+                self._frame, columns=tuple(self._frame.columns)
+            )
+        return self._fingerprint
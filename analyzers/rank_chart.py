@@ -0,0 +1,112 @@
+import logging
+
+import numpy as np
+
+# 상품 수가 이보다 많으면 WebGL 대량 모드 (막대/텍스트 라벨 대신 채운 선 + 강조 마커)
+LARGE_N_THRESHOLD = 300
+# 대량 모드에서 실제로 그리는 최대 점 수 (넘으면 순위를 균등 간격으로 샘플링)
+MAX_CHART_POINTS = 2000
+
+HIGHLIGHT_COLORS = {"min": "blue", "max": "red", "median": "green"}
+BASE_COLOR = "grey"
+
+
+def highlight_colors(values, min_value, max_value, median_value):
+    """최소/최대/중간값과 같은 값은 강조색, 나머지는 회색 (벡터 연산)"""
+    values = np.asarray(values)
+    return np.select(
+        [values == min_value, values == max_value, values == median_value],
+        [HIGHLIGHT_COLORS["min"], HIGHLIGHT_COLORS["max"], HIGHLIGHT_COLORS["median"]],
+        default=BASE_COLOR,
+    )
+
+
+def sample_ranks(n, max_points=MAX_CHART_POINTS):
+    """오름차순 정렬된 n개 중 그릴 순위 위치 (처음/중간/끝은 항상 포함)
+
+    정렬된 값은 분위수 함수이므로 순위를 균등 간격으로 뽑으면 곡선 모양이
+    유지됩니다.
+    """
+    if n <= max_points:
+        return np.arange(n)
+    positions = np.linspace(0, n - 1, max_points).round().astype(np.int64)
+    return np.union1d(positions, [0, (n - 1) // 2, n - 1])
+
+
+def create_rank_bar_chart(
+    values,
+    names,
+    stats,
+    text_format,
+    hover_label,
+    large_n_threshold=LARGE_N_THRESHOLD,
+    max_points=MAX_CHART_POINTS,
+):
+    """상품별 값을 오름차순으로 그린 차트 (가격/리뷰 수 공용)
+
+    상품 수가 large_n_threshold 이하이면 상품마다 막대와 값 라벨을 그리고,
+    넘으면 WebGL(Scattergl) 채운 선으로 그리되 max_points 이하로 샘플링하고
+    최소/중간/최대 상품만 강조 마커로 표시합니다.
+
+    Args:
+        values (pd.Series): 상품별 값 (정렬 전)
+        names (pd.Series): 같은 행 순서의 상품명 (그리는 상품만 꺼내 씀)
+        stats (dict): min/median/max를 포함한 기본 통계
+        text_format (str): 막대 라벨 포맷 (예: "₩{:,.0f}")
+        hover_label (str): 툴팁의 값 부분 (예: "가격: %{y:,.0f}원")
+    """
+    import plotly.graph_objects as go
+
+    # 차트에 필요한 값만 정렬 (DataFrame 전체를 정렬/복사하지 않음)
+    order = np.argsort(np.asarray(values), kind="stable")
+    sorted_values = np.asarray(values)[order]
+    n = len(sorted_values)
+    hovertemplate = "<b>%{customdata}</b><br>" + hover_label + "<extra></extra>"
+
+    if n <= large_n_threshold:
+        colors = highlight_colors(
+            sorted_values, stats["min"], stats["max"], stats["median"]
+        )
+        wrapped = names.iloc[order].str.wrap(20)  # 긴 상품명 줄바꿈
+        return go.Figure(
+            go.Bar(
+                x=np.arange(n),  # X축은 순위 (상품명이 같아도 막대가 합쳐지지 않도록)
+                y=sorted_values,
+                marker_color=colors,
+                text=[text_format.format(value) for value in sorted_values],
+                textposition="auto",
+                customdata=wrapped.to_numpy(dtype=object),  # hovertemplate에서 사용할 데이터
+                hovertemplate=hovertemplate,
+            )
+        )
+
+    positions = sample_ranks(n, max_points)
+    logging.info(f"대량 차트 모드: {n}개 상품 → {len(positions)}개 점 (WebGL)")
+    fig = go.Figure(
+        go.Scattergl(
+            x=positions,
+            y=sorted_values[positions],
+            mode="lines",
+            fill="tozeroy",
+            line=dict(color=BASE_COLOR, width=1),
+            customdata=names.iloc[order[positions]].to_numpy(dtype=object),
+            hovertemplate=hovertemplate,
+            showlegend=False,
+        )
+    )
+    # 최소/중간/최대 상품 위치 (정렬 순위)
+    highlights = {"min": 0, "median": (n - 1) // 2, "max": n - 1}
+    highlight_positions = list(highlights.values())
+    fig.add_trace(
+        go.Scattergl(
+            x=highlight_positions,
+            y=sorted_values[highlight_positions],
+            mode="markers",
+            marker=dict(color=[HIGHLIGHT_COLORS[key] for key in highlights], size=10),
+            customdata=names.iloc[order[highlight_positions]].to_numpy(dtype=object),
+            hovertemplate=hovertemplate,
+            showlegend=False,
+        )
+    )
+    return fig
+
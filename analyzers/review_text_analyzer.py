@@ -0,0 +1,349 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import chain
+import logging
+import multiprocessing
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 감성 사전 (어간 기준 부분 문자열 매칭, 긍정 어간은 부정어 뒤에서 제외)
+POSITIVE_WORDS = (
+    "좋",
+    "만족",
+    "최고",
+    "추천",
+    "편리",
+    "편해",
+    "편하",
+    "간편",
+    "튼튼",
+    "예쁘",
+    "예뻐",
+    "이쁘",
+    "이뻐",
+    "귀엽",
+    "귀여",
+    "깔끔",
+    "빠르",
+    "빨라",
+    "저렴",
+    "감사",
+    "훌륭",
+    "굿",
+    "강추",
+    "재구매",
+    "뛰어나",
+    "마음에 들",
+    "맘에 들",
+)
+NEGATIVE_WORDS = (
+    "별로",
+    "불만",
+    "실망",
+    "최악",
+    "불편",
+    "불량",
+    "환불",
+    "반품",
+    "아쉽",
+    "아쉬",
+    "비싸",
+    "느리",
+    "늦게",
+    "냄새",
+    "찢어졌",
+    "떨어졌",
+    "파손",
+    "엉망",
+    "후회",
+    "비추",
+)
+SENTIMENT_LABELS = ("긍정", "중립", "부정")
+
+# 바로 앞에 오면 긍정 어간을 긍정으로 세지 않는 부정 접두어/부사
+# ("불편해"의 "편해", "안 좋아요"의 "좋")
+NEGATION_PREFIXES = ("불", "안", "못")
+
+# 키워드에서 제외할 불용어 (간이 토크나이저 결과 기준)
+STOPWORDS = frozenset(
+    "너무 정말 진짜 그냥 이번 사용 제품 구매 생각 하나 조금 많이 아주 완전 "
+    "그리고 근데 그래서 하지만 있어요 있습니다 했어요 합니다 같아요 좋아요 "
+    "있는 없는 하는 해서 하고 에서 으로 이제 계속 처음 다시 바로 항상 "
+    "같아 같은 좋은 좋고 있고 있어서 되어 하게 "
+    "리뷰 상품 주문 받아 받았".split()
+)
+
+# 간이 토크나이저: 한글/영문 2글자 이상 단어 + 흔한 조사/어미 제거
+_WORD = re.compile(r"[가-힣]{2,}|[A-Za-z]{2,}")
+_SUFFIXES = tuple(
+    sorted(
+        (
+            "에서는 에서도 으로는 이에요 예요 에요 네요 어요 아요 해요 습니다 "
+            "입니다 에서 으로 에게 까지 부터 처럼 보다 하고 이랑 랑 "
+            "은 는 이 가 을 를 에 의 도 로 와 과 만 요"
+        ).split(),
+        key=len,
+        reverse=True,
+    )
+)
+_NEGATION_CLASS = "[" + "".join(NEGATION_PREFIXES) + "]"
+_POSITIVE_PATTERN = (
+    f"(?<!{_NEGATION_CLASS})(?<!{_NEGATION_CLASS} )"
+    f"(?:{'|'.join(map(re.escape, POSITIVE_WORDS))})"
+)
+_NEGATIVE_PATTERN = "|".join(map(re.escape, NEGATIVE_WORDS))
+_KONLPY_POS = frozenset(("Noun", "Adjective"))
+
+# 프로세스마다 한 번만 초기화하는 토크나이저 (JVM 기동 비용을 한 번만 지불)
+_TOKENIZER = None
+
+# 호출마다 새로 만들지 않고 재사용하는 토큰화 프로세스 풀 (워커 수가 바뀌면 교체)
+# Streamlit 작업 스레드에서 fork하지 않도록 spawn으로 시작
+_POOL = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=65536)
+def _strip_suffix(word):
+    """단어 끝의 조사/어미 제거 (메모이즈)"""
+    for suffix in _SUFFIXES:
+        if len(word) - len(suffix) >= 2 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def _simple_tokenize(text):
+    """순수 파이썬 토크나이저 (Java/konlpy가 없을 때 사용)"""
+    return [_strip_suffix(word) for word in _WORD.findall(text)]
+
+
+def _get_tokenizer():
+    """(이름, 토큰화 함수) 반환. konlpy Okt를 쓸 수 없으면 간이 토크나이저로 대체"""
+    global _TOKENIZER
+    if _TOKENIZER is None:
+        try:
+            from konlpy.tag import Okt
+
+            okt = Okt()
+            # JVM이 실제로 뜨는지 확인 (Java가 없으면 여기서 예외)
+            okt.pos("테스트")
+
+            def tokenize(text):
+                return [
+                    word
+                    for word, tag in okt.pos(text, norm=True, stem=True)
+                    if tag in _KONLPY_POS and len(word) >= 2
+                ]
+
+            _TOKENIZER = ("konlpy-okt", tokenize)
+        except Exception as e:
+            logging.info(f"konlpy를 사용할 수 없어 간이 토크나이저를 사용합니다: {e}")
+            _TOKENIZER = ("simple", _simple_tokenize)
+    return _TOKENIZER
+
+
+def _init_worker():
+    """프로세스 풀 워커 초기화: 토크나이저를 미리 로드"""
+    logging.disable(logging.INFO)
+    _get_tokenizer()
+
+
+@lru_cache(maxsize=16384)
+def _review_tokens(text):
+    """리뷰 1건의 키워드 집합 (메모이즈: 같은 리뷰 내용은 프로세스당 한 번만 토큰화)"""
+    _, tokenize = _get_tokenizer()
+    return frozenset(token for token in tokenize(text) if token not in STOPWORDS)
+
+
+def _count_keywords(texts):
+    """리뷰 묶음의 키워드별 언급 리뷰 수 (같은 리뷰 안의 반복은 1회)
+
+    리뷰별 키워드 집합을 한 배열로 이어 붙여 value_counts로 한 번에 셉니다.
+    """
+    tokens = list(chain.from_iterable(map(_review_tokens, texts)))
+    return pd.Series(tokens, dtype=object).value_counts(sort=False)
+
+
+def _get_pool(max_workers):
+    """max_workers개 워커의 공유 프로세스 풀 (처음 요청할 때 생성)"""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != max_workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            _POOL_WORKERS = max_workers
+        return _POOL
+
+
+def _reset_pool(pool):
+    """깨진 풀을 버려 다음 호출에서 새로 만들도록 함"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _worker_tokenizer_name():
+    """워커 프로세스가 사용하는 토크나이저 이름"""
+    return _get_tokenizer()[0]
+
+
+class ReviewTextAnalyzer:
+    def __init__(self, reviews_df, max_workers=None, batch_size=1000):
+        """ReviewTextAnalyzer 초기화
+
+        Args:
+            reviews_df (pd.DataFrame): ProductDetailParser로 파싱한 리뷰 데이터프레임
+            max_workers (int): 토큰화 프로세스 수 (None이면 CPU 코어 수)
+            batch_size (int): 워커 1회 작업당 리뷰 수
+        """
+        if reviews_df is None or "content" not in reviews_df.columns:
+            reviews_df = pd.DataFrame({"content": [], "rating": []})
+        self.contents = reviews_df["content"].dropna().astype(str)
+        self.contents = self.contents[self.contents.str.len() > 0]
+        if "rating" in reviews_df.columns:
+            self.ratings = reviews_df["rating"].reindex(self.contents.index).fillna(0)
+        else:
+            self.ratings = pd.Series(0.0, index=self.contents.index)
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.tokenizer_name = None
+
+    def analyze_sentiment(self):
+        """감성 사전 기반 리뷰별 감성 점수/라벨 (벡터화)
+
+        긍정/부정 어간 출현 횟수의 차이를 점수로 쓰고, 평점이 있는 리뷰는
+        평점(3점 기준)의 방향을 더합니다.
+        """
+        positive = self.contents.str.count(_POSITIVE_PATTERN)
+        negative = self.contents.str.count(_NEGATIVE_PATTERN)
+        rating_bias = np.where(self.ratings > 0, np.sign(self.ratings - 3), 0)
+        score = positive - negative + rating_bias
+        label = np.select([score > 0, score < 0], ["긍정", "부정"], default="중립")
+        return pd.DataFrame(
+            {
+                "positive": positive,
+                "negative": negative,
+                "score": score,
+                "label": label,
+            },
+            index=self.contents.index,
+        )
+
+    def sentiment_distribution(self, sentiment=None):
+        """감정 라벨별 리뷰 수와 비율"""
+        if sentiment is None:
+            sentiment = self.analyze_sentiment()
+        counts = (
+            sentiment["label"]
+            .value_counts()
+            .reindex(list(SENTIMENT_LABELS), fill_value=0)
+        )
+        total = counts.sum()
+        return pd.DataFrame(
+            {
+                "감정": counts.index,
+                "리뷰 수": counts.values,
+                "비율": counts.values / total * 100 if total else 0.0,
+            }
+        )
+
+    def extract_keywords(self, top_n=20):
+        """키워드별 언급 리뷰 수 상위 top_n
+
+        리뷰를 batch_size개씩 나눠 공유 프로세스 풀에서 토큰화하고(워커마다
+        토크나이저 1회 초기화), 묶음별 카운트를 합산합니다. 풀이 깨지면 현재
+        프로세스에서 다시 셉니다.
+        """
+        texts = self.contents.tolist()
+        if not texts:
+            self.tokenizer_name = _get_tokenizer()[0]
+            return pd.DataFrame(columns=["키워드", "리뷰 수"])
+
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        max_workers = self.max_workers or os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(batches)))
+
+        batch_counts = None
+        if max_workers > 1:
+            pool = _get_pool(max_workers)
+            try:
+                batch_counts = list(pool.map(_count_keywords, batches))
+                self.tokenizer_name = pool.submit(_worker_tokenizer_name).result()
+            except BrokenProcessPool as e:
+                logging.warning(f"토큰화 프로세스 풀 오류, 현재 프로세스에서 처리: {e}")
+                _reset_pool(pool)
+                batch_counts = None
+        if batch_counts is None:
+            self.tokenizer_name = _get_tokenizer()[0]
+            batch_counts = [_count_keywords(batch) for batch in batches]
+
+        # 묶음별 카운트 합산 후 언급 수 내림차순 (같으면 키워드 순)
+        counts = pd.concat(batch_counts).groupby(level=0).sum()
+        counts = counts.sort_values(ascending=False, kind="stable")
+
+        logging.info(
+            f"리뷰 키워드 추출 완료: 리뷰 {len(texts)}개, 키워드 {len(counts)}개 "
+            f"(토크나이저: {self.tokenizer_name}, 워커 {max_workers}개)"
+        )
+        top = counts.head(top_n)
+        return pd.DataFrame({"키워드": top.index.to_numpy(), "리뷰 수": top.to_numpy()})
+
+    def analyze(self, top_n=20):
+        """감성 분포 + 상위 키워드 종합 분석"""
+        sentiment = self.analyze_sentiment()
+        return {
+            "review_count": len(self.contents),
+            "sentiment": sentiment,
+            "sentiment_distribution": self.sentiment_distribution(sentiment),
+            "keywords": self.extract_keywords(top_n),
+            "tokenizer": self.tokenizer_name,
+        }
+
+    def create_sentiment_pie_chart(self, distribution):
+        """감정 분포 파이 차트 생성"""
+        import plotly.express as px
+
+        fig = px.pie(
+            distribution,
+            values="리뷰 수",
+            names="감정",
+            color="감정",
+            color_discrete_map={
+                "긍정": "#2A9D8F",
+                "중립": "#ADB5BD",
+                "부정": "#E63946",
+            },
+            title=f"리뷰 감정 분포 ({distribution['리뷰 수'].sum()}개)",
+        )
+        fig.update_layout(height=300)
+        return fig
+
+    def create_keyword_bar_chart(self, keywords):
+        """상위 키워드 가로 막대 그래프 생성"""
+        import plotly.express as px
+
+        fig = px.bar(
+            keywords.iloc[::-1],
+            x="리뷰 수",
+            y="키워드",
+            orientation="h",
+            title="리뷰 주요 키워드",
+        )
+        fig.update_layout(height=300, yaxis_title=None)
+        return fig
@@ -0,0 +1,181 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+# PRD 2.2 판매량 추정 알고리즘 상수
+BASE_CONVERSION = 0.02  # 2% 구매 전환율 (구매자 50명당 리뷰 1개)
+# 검색 결과에는 출시일이 없으므로 기본 경과일을 가정
+DEFAULT_DAYS_SINCE_LAUNCH = 365
+# 스냅샷 간격이 이보다 짧으면 리뷰 증가량이 의미가 없으므로 공식을 사용
+MIN_SNAPSHOT_DAYS = 1
+
+
+def estimate_sales(review_count, days_since_launch, category_factor=1.0):
+    """PRD 판매량 추정 공식 (스칼라/배열/Series 모두 가능, 월 판매량)
+
+    estimated_monthly_sales = (review_count / base_conversion) / (days / 30) * factor
+    """
+    review_count = np.asarray(review_count, dtype=np.float64)
+    days = np.maximum(np.asarray(days_since_launch, dtype=np.float64), 1.0)
+    return (review_count / BASE_CONVERSION) / (days / 30) * category_factor
+
+
+def _unique_products(products_df):
+    """listing_id, product_id 순으로 중복 행 제거 (첫 등장 = 가장 높은 순위 유지)"""
+    duplicated = np.zeros(len(products_df), dtype=bool)
+    for key in ("listing_id", "product_id"):
+        if key in products_df.columns:
+            values = products_df[key]
+            duplicated |= (values.notna() & values.duplicated(keep="first")).to_numpy()
+    return products_df[~duplicated]
+
+
+class SalesEstimator:
+    def __init__(
+        self,
+        products_df,
+        history_df=None,
+        days_since_launch=DEFAULT_DAYS_SINCE_LAUNCH,
+        category_factor=1.0,
+        as_of=None,
+    ):
+        """SalesEstimator 초기화
+
+        Args:
+            products_df (pd.DataFrame): CoupangParser를 통해 파싱된 상품 데이터프레임
+            history_df (pd.DataFrame): 과거 스냅샷 (product_id, captured_at,
+                review_count 컬럼). 같은 상품의 리뷰 수 변화량이 있으면 공식 대신 사용
+            days_since_launch (int | pd.Series): 출시 후 경과일 (스냅샷이 없을 때)
+            category_factor (float | pd.Series): 카테고리 보정 계수
+            as_of (pd.Timestamp): products_df 수집 시각 (None이면 현재 시각)
+        """
+        self.products_df = products_df
+        self.history_df = history_df
+        self.days_since_launch = days_since_launch
+        self.category_factor = category_factor
+        self.as_of = pd.Timestamp.now() if as_of is None else pd.Timestamp(as_of)
+
+    def estimate(self):
+        """상품별 추정 월 판매량 (컬럼 단위 벡터 연산)
+
+        Returns:
+            pd.DataFrame: products_df에 estimated_monthly_sales와
+                estimate_method("snapshot" 또는 "formula") 컬럼을 붙인 결과
+        """
+        if self.products_df.empty or "review_count" not in self.products_df.columns:
+            return self.products_df.assign(
+                estimated_monthly_sales=pd.Series(dtype=np.float64),
+                estimate_method=pd.Series(dtype=object),
+            )
+
+        review_count = self.products_df["review_count"].fillna(0).to_numpy()
+        estimated = estimate_sales(
+            review_count, self.days_since_launch, self.category_factor
+        )
+        method = np.full(len(estimated), "formula", dtype=object)
+
+        snapshot_sales = self._snapshot_sales()
+        if snapshot_sales is not None:
+            matched = self.products_df["product_id"].map(snapshot_sales)
+            matched = matched.to_numpy(dtype=np.float64)
+            use_snapshot = ~np.isnan(matched)
+            estimated = np.where(use_snapshot, matched, estimated)
+            method[use_snapshot] = "snapshot"
+            logging.info(
+                f"판매량 추정: 스냅샷 기반 {int(use_snapshot.sum())}개 / "
+                f"공식 기반 {int((~use_snapshot).sum())}개"
+            )
+
+        return self.products_df.assign(
+            estimated_monthly_sales=estimated, estimate_method=method
+        )
+
+    def _snapshot_sales(self):
+        """과거 스냅샷과 현재 리뷰 수의 차이로 계산한 product_id별 월 판매량
+
+        상품별 가장 이른 스냅샷과 가장 최근 관측(현재 포함) 사이의 리뷰 증가량을
+        기간(일)으로 나눠 월 단위로 환산합니다. 기간이 MIN_SNAPSHOT_DAYS보다 짧은
+        상품은 제외합니다.
+        """
+        if self.history_df is None or self.history_df.empty:
+            return None
+        if "product_id" not in self.products_df.columns:
+            return None
+
+        current = pd.DataFrame(
+            {
+                "product_id": self.products_df["product_id"],
+                "captured_at": self.as_of,
+                "review_count": self.products_df["review_count"],
+            }
+        )
+        observations = pd.concat(
+            [self.history_df[["product_id", "captured_at", "review_count"]], current],
+            ignore_index=True,
+        ).dropna(subset=["product_id"])
+        observations["captured_at"] = pd.to_datetime(observations["captured_at"])
+        observations = observations.sort_values("captured_at", kind="stable")
+
+        grouped = observations.groupby("product_id", sort=False)
+        first = grouped.first()
+        last = grouped.last()
+        days = (last["captured_at"] - first["captured_at"]).dt.total_seconds() / 86400
+        delta_reviews = (last["review_count"] - first["review_count"]).clip(lower=0)
+
+        valid = days >= MIN_SNAPSHOT_DAYS
+        if not valid.any():
+            return None
+        monthly = (
+            (delta_reviews[valid] / BASE_CONVERSION)
+            / (days[valid] / 30)
+            * self._factor_by_product(valid.index[valid])
+        )
+        return monthly.astype(np.float64)
+
+    def _factor_by_product(self, product_ids):
+        """category_factor를 product_id 인덱스에 맞춰 반환"""
+        if not isinstance(self.category_factor, pd.Series):
+            return self.category_factor
+        factors = pd.Series(
+            self.category_factor.to_numpy(), index=self.products_df["product_id"]
+        )
+        factors = factors[~factors.index.duplicated()]
+        return factors.reindex(product_ids).fillna(1.0)
+
+    def get_top_n(self, n=10):
+        """추정 월 판매량 상위 n개 상품 (상품 번호당 한 행)
+
+        리뷰 수와 그로부터 추정한 판매량은 상품 번호 단위라 옵션/광고 노출 행이
+        모두 같은 값을 가지므로, 상품 번호별로 가장 높은 순위의 행만 남긴 뒤
+        순위를 매깁니다. 상품 번호가 없는 행은 listing_id로만 중복을 제거합니다.
+        """
+        estimated = _unique_products(self.estimate())
+        return estimated.nlargest(n, "estimated_monthly_sales")
+
+    def create_top_sales_chart(self, top_n_df):
+        """추정 판매량 상위 상품 가로 막대 그래프 생성"""
+        import plotly.express as px
+
+        # 이름이 같은 상품이 막대 하나로 합쳐지지 않도록 순위를 붙임
+        ranks = np.arange(1, len(top_n_df) + 1).astype(str)
+        names = top_n_df["name"].fillna("").astype(str).str.slice(0, 18)
+        labels = ranks + ". " + names
+        chart_df = top_n_df.assign(label=labels.to_numpy()).iloc[::-1]
+        fig = px.bar(
+            chart_df,
+            x="estimated_monthly_sales",
+            y="label",
+            orientation="h",
+            color="estimate_method",
+            color_discrete_map={"snapshot": "#E63946", "formula": "#457B9D"},
+            title=f"추정 월 판매량 상위 {len(top_n_df)}개",
+            labels={
+                "estimated_monthly_sales": "추정 월 판매량 (개)",
+                "label": "",
+                "estimate_method": "추정 방식",
+            },
+            hover_data={"name": True, "review_count": True, "label": False},
+        )
+        fig.update_layout(height=300)
+        return fig
@@ -0,0 +1,268 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+# 두 스냅샷 사이에서 변화를 추적하는 필드
+DIFF_FIELDS = (
+    "price",
+    "original_price",
+    "discount_rate",
+    "review_count",
+    "rating",
+    "is_rocket",
+    "delivery_type",
+)
+# 변화량(new - old)을 계산하는 숫자 필드
+NUMERIC_DIFF_FIELDS = frozenset(
+    ("price", "original_price", "discount_rate", "review_count", "rating")
+)
+
+
+def summary_stats(products_df):
+    """대시보드 요약 지표의 기반 합계 (상품 수, 가격 합/개수, 리뷰 합, 로켓 수)
+
+    SnapshotDiff와 함께 쓸 때는 listing_id 기준으로 중복 제거된 스냅샷에서 계산하며,
+    SnapshotDiff.update_stats로 다음 스냅샷의 값을 변경된 행만으로 갱신할 수 있도록
+    평균 대신 합계/개수를 보관합니다.
+    """
+    price = products_df["price"].fillna(0).to_numpy(dtype=np.int64)
+    return {
+        "count": len(products_df),
+        "price_count": int((price > 0).sum()),
+        "price_sum": int(price[price > 0].sum()),
+        "review_sum": int(products_df["review_count"].fillna(0).sum()),
+        "rocket_count": int(products_df["is_rocket"].sum()),
+    }
+
+
+def diff_key(old_df, new_df):
+    """두 스냅샷의 행을 맞출 키 컬럼
+
+    검색 결과 행은 옵션 번호 listing_id로 구분합니다. listing_id가 없던 이전
+    버전의 스냅샷과 비교할 때만 상품 번호 product_id를 씁니다.
+    """
+    if "listing_id" in old_df.columns and "listing_id" in new_df.columns:
+        return "listing_id"
+    return "product_id"
+
+
+def _unique_by_key(products_df, key):
+    """키가 있는 행만, 키별 첫 등장(가장 높은 순위)만 남김"""
+    products_df = products_df[products_df[key].notna()]
+    duplicated = products_df[key].duplicated(keep="first")
+    if duplicated.any():
+        products_df = products_df[~duplicated.to_numpy()]
+    return products_df.reset_index(drop=True)
+
+
+def _field_values(series):
+    """비교용 numpy 배열 (숫자/불리언은 원래 dtype, 그 외는 object)"""
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(
+        series.dtype
+    ):
+        return series.to_numpy()
+    return series.to_numpy(dtype=object)
+
+
+class SnapshotDiff:
+    def __init__(self, old_df, new_df, fields=DIFF_FIELDS):
+        """두 스냅샷(같은 키워드의 이전/현재 상품 데이터) 비교
+
+        두 DataFrame을 merge하지 않고, 이전 스냅샷의 키(diff_key, 보통
+        listing_id)로 해시 인덱스를 만든 뒤 현재 스냅샷의 키를 조회(get_indexer)하여
+        행 위치를 맞춥니다. 같은 상품 번호의 옵션끼리는 서로 비교하지 않으므로
+        옵션 간 순위가 바뀌어도 가격 변동으로 잡히지 않습니다. 필드 비교는 위치가
+        맞춰진 numpy 배열끼리 수행합니다.
+
+        Args:
+            old_df (pd.DataFrame): 이전 스냅샷
+            new_df (pd.DataFrame): 현재 스냅샷
+            fields (tuple): 비교할 필드 (두 스냅샷에 모두 있는 것만 사용)
+        """
+        self.key = diff_key(old_df, new_df)
+        self.old_df = _unique_by_key(old_df, self.key)
+        self.new_df = _unique_by_key(new_df, self.key)
+        self.fields = [
+            f for f in fields if f in self.old_df.columns and f in self.new_df.columns
+        ]
+        # 변경 내역에 붙이는 상품 식별 컬럼
+        self.id_columns = ["product_id"]
+        if self.key != "product_id":
+            self.id_columns.append(self.key)
+
+        # 해시 인덱스 조회: 현재 상품 → 이전 스냅샷 행 위치 (-1이면 신규)
+        old_index = pd.Index(self.old_df[self.key])
+        self._old_positions = old_index.get_indexer(self.new_df[self.key])
+        self._matched = self._old_positions >= 0
+        # 이전 스냅샷 행 중 현재에도 있는 행
+        self._old_kept = np.zeros(len(self.old_df), dtype=bool)
+        self._old_kept[self._old_positions[self._matched]] = True
+
+        self._field_changes = self._compare_fields()
+        logging.info(
+            f"스냅샷 비교: 신규 {int((~self._matched).sum())}개, "
+            f"이탈 {int((~self._old_kept).sum())}개, "
+            f"변경 {len(self.changed_product_positions())}개"
+        )
+
+    def _compare_fields(self):
+        """필드별 (현재 스냅샷 행 위치, 이전 값, 현재 값) 중 값이 바뀐 것만"""
+        new_positions = np.flatnonzero(self._matched)
+        old_positions = self._old_positions[self._matched]
+        changes = {}
+        for field in self.fields:
+            old_values = _field_values(self.old_df[field])[old_positions]
+            new_values = _field_values(self.new_df[field])[new_positions]
+            changed = old_values != new_values
+            if old_values.dtype.kind in "fO":
+                # 양쪽 모두 결측이면 변경 아님
+                changed &= ~(pd.isna(old_values) & pd.isna(new_values))
+            if changed.any():
+                changes[field] = (
+                    new_positions[changed],
+                    old_values[changed],
+                    new_values[changed],
+                )
+        return changes
+
+    def appeared(self):
+        """현재 스냅샷에 새로 나타난 상품"""
+        return self.new_df[~self._matched]
+
+    def disappeared(self):
+        """이전 스냅샷에만 있고 현재 사라진 상품"""
+        return self.old_df[~self._old_kept]
+
+    def changed_product_positions(self):
+        """필드 값이 하나라도 바뀐 현재 스냅샷 행 위치 (정렬됨)"""
+        if not self._field_changes:
+            return np.array([], dtype=np.int64)
+        positions = [positions for positions, _, _ in self._field_changes.values()]
+        return np.unique(np.concatenate(positions))
+
+    def _ids(self, positions):
+        """현재 스냅샷 행 위치의 상품 식별 컬럼 (product_id, listing_id)"""
+        return {
+            column: self.new_df[column].to_numpy()[positions]
+            for column in self.id_columns
+        }
+
+    def field_changes(self):
+        """필드별 변경 내역 (long 형식: 식별 컬럼, name, field, old, new, delta)"""
+        frames = []
+        for field, (positions, old_values, new_values) in self._field_changes.items():
+            frame = pd.DataFrame(
+                {
+                    **self._ids(positions),
+                    "name": self.new_df["name"].to_numpy()[positions]
+                    if "name" in self.new_df.columns
+                    else None,
+                    "field": field,
+                    "old": old_values,
+                    "new": new_values,
+                }
+            )
+            if field in NUMERIC_DIFF_FIELDS:
+                frame["delta"] = new_values.astype(np.float64) - old_values.astype(
+                    np.float64
+                )
+            frames.append(frame)
+        columns = [*self.id_columns, "name", "field", "old", "new", "delta"]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True).reindex(columns=columns)
+
+    def price_changes(self):
+        """가격이 바뀐 상품의 이전/현재 가격과 변동률 (변경 행만 계산)"""
+        if "price" not in self._field_changes:
+            return pd.DataFrame(
+                columns=[
+                    *self.id_columns,
+                    "name",
+                    "old_price",
+                    "new_price",
+                    "change_pct",
+                ]
+            )
+        positions, old_values, new_values = self._field_changes["price"]
+        old_price = old_values.astype(np.float64)
+        new_price = new_values.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_pct = np.where(
+                old_price > 0, (new_price - old_price) / old_price * 100, np.nan
+            )
+        return pd.DataFrame(
+            {
+                **self._ids(positions),
+                "name": self.new_df["name"].to_numpy()[positions],
+                "old_price": old_price,
+                "new_price": new_price,
+                "change_pct": change_pct,
+            }
+        ).sort_values("change_pct", key=np.abs, ascending=False, ignore_index=True)
+
+    def review_gains(self):
+        """리뷰 수가 늘어난 상품과 증가량 (변경 행만 계산, 증가량 내림차순)"""
+        if "review_count" not in self._field_changes:
+            return pd.DataFrame(
+                columns=[*self.id_columns, "name", "old_reviews", "new_reviews", "gain"]
+            )
+        positions, old_values, new_values = self._field_changes["review_count"]
+        gain = new_values.astype(np.int64) - old_values.astype(np.int64)
+        gains = pd.DataFrame(
+            {
+                **self._ids(positions),
+                "name": self.new_df["name"].to_numpy()[positions],
+                "old_reviews": old_values.astype(np.int64),
+                "new_reviews": new_values.astype(np.int64),
+                "gain": gain,
+            }
+        )
+        return gains[gains["gain"] > 0].sort_values(
+            "gain", ascending=False, ignore_index=True
+        )
+
+    def update_stats(self, old_stats):
+        """이전 스냅샷의 summary_stats를 신규/이탈/변경 행만으로 현재 값으로 갱신
+
+        전체 상품을 다시 집계하지 않고, 이탈 상품의 기여분을 빼고 신규 상품의
+        기여분을 더한 뒤 가격/리뷰 수/로켓 여부가 바뀐 행의 차이만 반영합니다.
+        """
+        stats = dict(old_stats)
+        removed = summary_stats(self.disappeared())
+        added = summary_stats(self.appeared())
+        for key in stats:
+            stats[key] += added[key] - removed[key]
+
+        if "price" in self._field_changes:
+            _, old_values, new_values = self._field_changes["price"]
+            old_price = old_values.astype(np.int64)
+            new_price = new_values.astype(np.int64)
+            stats["price_count"] += int((new_price > 0).sum() - (old_price > 0).sum())
+            stats["price_sum"] += int(
+                new_price[new_price > 0].sum() - old_price[old_price > 0].sum()
+            )
+        if "review_count" in self._field_changes:
+            _, old_values, new_values = self._field_changes["review_count"]
+            stats["review_sum"] += int(
+                new_values.astype(np.int64).sum() - old_values.astype(np.int64).sum()
+            )
+        if "is_rocket" in self._field_changes:
+            _, old_values, new_values = self._field_changes["is_rocket"]
+            stats["rocket_count"] += int(
+                new_values.astype(bool).sum() - old_values.astype(bool).sum()
+            )
+        return stats
+
+    def summary(self):
+        """변화 요약 (신규/이탈/가격 변경/리뷰 증가 상품 수, 총 리뷰 증가량)"""
+        review_gains = self.review_gains()
+        price_changes = self._field_changes.get("price")
+        return {
+            "appeared": int((~self._matched).sum()),
+            "disappeared": int((~self._old_kept).sum()),
+            "price_changed": len(price_changes[0]) if price_changes else 0,
+            "review_gained": len(review_gains),
+            "review_gain_total": int(review_gains["gain"].sum()),
+        }
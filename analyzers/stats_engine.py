@@ -0,0 +1,191 @@
+from collections import OrderedDict
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 통계를 계산하는 숫자 컬럼 (0 이하 값은 "정보 없음"으로 보고 제외)
+STATS_COLUMNS = ("price", "original_price", "discount_rate", "review_count", "rating")
+
+# 컬럼별 구간 분포 ([왼쪽 경계, 오른쪽 경계) 구간, 라벨)
+COLUMN_BINS = {
+    "price": (
+        [0, 10000, 30000, 50000, 100000, 200000, np.inf],
+        ["1만원 미만", "1-3만원", "3-5만원", "5-10만원", "10-20만원", "20만원 이상"],
+    ),
+    "review_count": (
+        [0, 10, 50, 100, 500, 1000, np.inf],
+        ["10개 미만", "10-50개", "50-100개", "100-500개", "500-1000개", "1000개 이상"],
+    ),
+}
+
+_EMPTY_STATS = {
+    "count": 0,
+    "sum": 0,
+    "mean": 0,
+    "median": 0,
+    "std": 0,
+    "min": 0,
+    "max": 0,
+    "q25": 0,
+    "q75": 0,
+}
+
+# 데이터 버전(내용 지문)별 엔진 캐시 크기
+_MAX_ENGINES = 8
+
+
+def data_fingerprint(products_df, columns=STATS_COLUMNS):
+    """통계 대상 컬럼 내용의 지문 (같은 데이터면 같은 값)"""
+    present = [c for c in columns if c in products_df.columns]
+    hashed = pd.util.hash_pandas_object(products_df[present], index=False)
+    return (len(products_df), tuple(present), int(hashed.sum()))
+
+
+class StatsEngine:
+    """상품 숫자 컬럼 통계 엔진 (한 번에 계산, 데이터 버전별 메모이즈)
+
+    count/sum/mean/median/std/min/max/사분위수와 구간 분포를 모든 숫자 컬럼에
+    대해 한 번의 벡터 연산(컬럼 x 행 행렬의 nan-통계)으로 계산합니다.
+    for_frame()은 데이터 지문이 같은 DataFrame에 같은 엔진을 돌려주므로,
+    여러 분석기/위젯이 같은 통계를 요청해도 데이터셋당 한 번만 계산됩니다.
+    """
+
+    _engines = OrderedDict()
+    _engines_lock = threading.Lock()
+
+    def __init__(self, products_df, columns=STATS_COLUMNS):
+        """StatsEngine 초기화
+
+        Args:
+            products_df (pd.DataFrame): CoupangParser를 통해 파싱된 상품 데이터프레임
+            columns (tuple): 통계를 계산할 숫자 컬럼
+        """
+        self.products_df = products_df
+        self.columns = [c for c in columns if c in products_df.columns]
+        self._stats = None
+        self._distributions = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_frame(cls, products_df):
+        """데이터 버전(내용 지문)별로 공유되는 엔진 반환"""
+        key = data_fingerprint(products_df)
+        with cls._engines_lock:
+            engine = cls._engines.get(key)
+            if engine is not None:
+                cls._engines.move_to_end(key)
+                return engine
+            engine = cls(products_df)
+            cls._engines[key] = engine
+            while len(cls._engines) > _MAX_ENGINES:
+                cls._engines.popitem(last=False)
+            return engine
+
+    def _values(self):
+        """(행 x 컬럼) float 행렬, 0 이하/결측은 nan"""
+        # 컬럼 단위 연산이 연속 메모리에서 이루어지도록 열 우선(F) 배열
+        values = np.empty((len(self.products_df), len(self.columns)), order="F")
+        for i, column in enumerate(self.columns):
+            series = self.products_df[column]
+            if not pd.api.types.is_numeric_dtype(series.dtype):
+                series = pd.to_numeric(series, errors="coerce")
+            values[:, i] = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values[~(values > 0)] = np.nan
+        return values
+
+    def _compute(self):
+        """모든 컬럼의 기본 통계를 한 번에 계산
+
+        컬럼별로 한 번 정렬(nan은 뒤로)한 행렬에서 min/max/사분위수를 위치로
+        바로 읽고, 합계/평균/표준편차는 같은 행렬의 nan-합계로 계산합니다.
+        """
+        values = self._values()
+        values.sort(axis=0)
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        sums = np.where(valid, values, 0).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+            deviations = np.where(valid, values - means, 0)
+            # 표본이 1개면 pandas와 같이 nan (ddof=1)
+            stds = np.sqrt((deviations**2).sum(axis=0) / (counts - 1))
+        quantiles = {q: _sorted_quantile(values, counts, q) for q in (0.25, 0.5, 0.75)}
+
+        stats = {}
+        for i, column in enumerate(self.columns):
+            if counts[i] == 0:
+                stats[column] = dict(_EMPTY_STATS)
+                continue
+            stats[column] = {
+                "count": int(counts[i]),
+                "sum": sums[i],
+                "mean": means[i],
+                "median": quantiles[0.5][i],
+                "std": stds[i],
+                "min": values[0, i],
+                "max": values[counts[i] - 1, i],
+                "q25": quantiles[0.25][i],
+                "q75": quantiles[0.75][i],
+            }
+        logging.info(
+            f"StatsEngine 통계 계산: {len(self.products_df)}행 x {len(self.columns)}컬럼"
+        )
+        return stats, values, counts
+
+    def _ensure(self):
+        with self._lock:
+            if self._stats is None:
+                stats, values, counts = self._compute()
+                # 정렬된 행렬에서 구간 분포까지 계산한 뒤 행렬은 버림
+                self._distributions = {
+                    column: self._distribution(column, values, counts)
+                    for column in COLUMN_BINS
+                }
+                self._stats = stats
+
+    def _distribution(self, column, values, counts):
+        """구간 분포 (정렬된 값에서 구간 경계 위치를 이분 탐색)"""
+        if column not in self.columns:
+            return pd.Series(dtype=int)
+        i = self.columns.index(column)
+        if counts[i] == 0:
+            return pd.Series(dtype=int)
+        edges, labels = COLUMN_BINS[column]
+        # [edges[j], edges[j+1]) 구간 (pd.cut(..., right=False)와 동일)
+        boundaries = np.searchsorted(values[: counts[i], i], edges, side="left")
+        return pd.Series(
+            np.diff(boundaries),
+            index=pd.CategoricalIndex(
+                labels, categories=labels, ordered=True, name=column
+            ),
+            name="count",
+        )
+
+    def column_stats(self, column):
+        """컬럼 기본 통계 dict (0 이하 값 제외, 값이 없으면 모두 0)"""
+        self._ensure()
+        return self._stats.get(column, dict(_EMPTY_STATS))
+
+    def distribution(self, column):
+        """컬럼 구간 분포 Series (COLUMN_BINS에 정의된 컬럼만)"""
+        self._ensure()
+        return self._distributions.get(column, pd.Series(dtype=int))
+
+    def all_stats(self):
+        """모든 컬럼 통계 DataFrame (행: 컬럼, 열: 통계)"""
+        self._ensure()
+        return pd.DataFrame.from_dict(self._stats, orient="index")
+
+
+def _sorted_quantile(values, counts, q):
+    """컬럼별로 정렬된 행렬의 q 분위수 (선형 보간, pandas quantile과 동일)"""
+    position = np.maximum(counts - 1, 0) * q
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    if values.shape[0] == 0:
+        return np.zeros(values.shape[1])
+    low = np.take_along_axis(values, lower[np.newaxis, :], axis=0)[0]
+    high = np.take_along_axis(values, upper[np.newaxis, :], axis=0)[0]
+    return low + (high - low) * (position - lower)
@@ -0,0 +1,266 @@
+"""PRD 엔드포인트(/api/search, /api/dashboard, /api/trends)를 제공하는 asyncio HTTP 서버
+
+표준 라이브러리 asyncio 스트림 위의 최소 HTTP/1.1 구현(keep-alive, Content-Length
+본문, ETag/If-None-Match)이며, 실제 파싱/분석은 AnalysisService가 프로세스 풀에서
+처리합니다.
+
+엔드포인트:
+    GET  /api/search?keyword=<키워드>&page=<페이지>
+    GET  /api/dashboard?keyword=<키워드>
+    GET  /api/trends?keyword=<키워드>&period=<1m|3m|6m|1y|3y|5y>
+    POST /api/analyze?kind=<search|detail>   (본문: HTML 1페이지)
+    GET  /api/health
+
+사용법:
+    python -m api.server <HTML 폴더> [--host 127.0.0.1] [--port 8000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from urllib.parse import parse_qs, urlsplit
+
+from api.service import DEFAULT_TREND_PERIOD, AnalysisService, ApiError
+from parsers.coupang_parser import PARSER_BACKENDS
+from parsers.parse_cache import PARSE_CACHE_DIR
+from storage.result_store import RESULTS_DIR
+from storage.snapshot_store import SNAPSHOT_DIR
+
+# 요청 본문(업로드 HTML) 최대 크기
+MAX_BODY_BYTES = 32 * 1024 * 1024
+# 요청 줄/헤더 한 줄 최대 크기와 헤더 수
+MAX_LINE_BYTES = 16 * 1024
+MAX_HEADERS = 100
+# keep-alive 연결에서 다음 요청을 기다리는 시간 (초)
+KEEP_ALIVE_TIMEOUT = 15.0
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def _error_body(message):
+    return json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+
+
+def _query_value(query, name, default=None):
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def _required(query, name):
+    value = _query_value(query, name)
+    if not value:
+        raise ApiError(400, f"{name} 파라미터가 필요합니다.")
+    return value
+
+
+class ApiServer:
+    """AnalysisService를 HTTP로 노출하는 asyncio 서버"""
+
+    def __init__(self, service):
+        """ApiServer 초기화
+
+        Args:
+            service (AnalysisService): 요청을 처리할 분석 서비스
+        """
+        self.service = service
+        self.requests = 0
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """서버 시작 (port=0이면 빈 포트, 실제 포트는 server.sockets에서 확인)"""
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE_BYTES
+        )
+
+    async def handle_connection(self, reader, writer):
+        """연결 하나에서 keep-alive로 요청을 차례로 처리"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(
+                        reader.readline(), KEEP_ALIVE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                request = await self._read_request(request_line, reader)
+                if request is None:
+                    await self._respond(writer, 400, _error_body("잘못된 요청입니다."))
+                    break
+                method, target, version, headers, body = request
+                keep_alive = self._keep_alive(version, headers)
+                if body is None:
+                    await self._respond(
+                        writer, 413, _error_body("요청 본문이 너무 큽니다."), False
+                    )
+                    break
+
+                status, payload, etag = await self.dispatch(method, target, body)
+                if etag is not None and headers.get("if-none-match") == etag:
+                    status, payload = 304, b""
+                await self._respond(writer, status, payload, keep_alive, etag)
+                if not keep_alive:
+                    break
+        except (
+            ConnectionError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, request_line, reader):
+        """(메서드, 대상, 버전, 헤더, 본문) (형식이 잘못되면 None, 본문 초과면 본문 None)"""
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            return None
+        method, target, version = parts
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                return None
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            return None
+        if length > MAX_BODY_BYTES:
+            return method, target, version, headers, None
+        body = await reader.readexactly(length) if length else b""
+        return method, target, version, headers, body
+
+    @staticmethod
+    def _keep_alive(version, headers):
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            return connection != "close"
+        return connection == "keep-alive"
+
+    async def _respond(self, writer, status, payload, keep_alive=False, etag=None):
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(payload)}",
+            "Connection: " + ("keep-alive" if keep_alive else "close"),
+        ]
+        if etag is not None:
+            head.append(f"ETag: {etag}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+        await writer.drain()
+
+    async def dispatch(self, method, target, body):
+        """요청을 서비스 메서드로 연결하고 (상태 코드, JSON bytes, ETag) 반환"""
+        self.requests += 1
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/api/analyze":
+                if method != "POST":
+                    raise ApiError(405, "POST만 지원합니다.")
+                payload, etag = await self.service.analyze_html(
+                    body, _query_value(query, "kind", "search")
+                )
+                return 200, payload, etag
+
+            if method != "GET":
+                raise ApiError(405, "GET만 지원합니다.")
+            if url.path == "/api/search":
+                try:
+                    page = int(_query_value(query, "page", "1"))
+                except ValueError:
+                    raise ApiError(400, "page는 정수여야 합니다.")
+                payload, etag = await self.service.search(
+                    _required(query, "keyword"), page
+                )
+            elif url.path == "/api/dashboard":
+                payload, etag = await self.service.dashboard(
+                    _required(query, "keyword")
+                )
+            elif url.path == "/api/trends":
+                payload, etag = await self.service.trends(
+                    _required(query, "keyword"),
+                    _query_value(query, "period", DEFAULT_TREND_PERIOD),
+                )
+            elif url.path == "/api/health":
+                health = dict(self.service.health(), requests=self.requests)
+                return 200, json.dumps(health).encode("utf-8"), None
+            else:
+                raise ApiError(404, f"없는 경로입니다: {url.path}")
+            return 200, payload, etag
+        except ApiError as e:
+            return e.status, _error_body(e.message), None
+        except Exception as e:
+            logging.error(f"API 요청 처리 실패 ({method} {target}): {e}", exc_info=True)
+            return 500, _error_body(f"{type(e).__name__}: {e}"), None
+
+
+async def serve(service, host, port):
+    server = await ApiServer(service).start(host, port)
+    address = server.sockets[0].getsockname()
+    logging.info(f"API 서버 시작: http://{address[0]}:{address[1]}")
+    print(f"API 서버: http://{address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("data_dir", help="키워드 폴더(search/, detail/)가 있는 HTML 폴더")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument(
+        "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)"
+    )
+    arg_parser.add_argument(
+        "--backend", default="lxml-native", choices=PARSER_BACKENDS
+    )
+    arg_parser.add_argument("--store", default=SNAPSHOT_DIR, help="스냅샷 저장소 폴더")
+    arg_parser.add_argument(
+        "--results", default=RESULTS_DIR, help="스케줄러가 미리 계산한 결과 폴더"
+    )
+    arg_parser.add_argument(
+        "--cache-dir", default=PARSE_CACHE_DIR, help="파싱 캐시 폴더"
+    )
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    service = AnalysisService(
+        args.data_dir,
+        store_root=args.store,
+        backend=args.backend,
+        max_workers=args.workers,
+        cache_dir=args.cache_dir,
+        results_root=args.results,
+    )
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
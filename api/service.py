@@ -0,0 +1,557 @@
+import asyncio
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from analyzers.product_table import ProductTable
+from analyzers.review_text_analyzer import ReviewTextAnalyzer
+from analyzers.sales_estimator import SalesEstimator
+from parsers.coupang_parser import CoupangParser
+from parsers.parse_cache import PARSE_CACHE_DIR, ParseCache
+from parsers.product_detail_parser import ProductDetailParser
+from parsers.review_pages import parse_review_files
+from parsers.search_pages import parse_search_files
+from pipeline.batch import build_report, find_jobs, to_jsonable
+from storage.result_store import RESULTS_DIR, ResultStore
+from storage.snapshot_store import SNAPSHOT_DIR, SnapshotStore
+
+# 보관할 최대 응답 수와 JSON 총 크기
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 입력 폴더의 키워드 목록을 다시 스캔하는 주기 (초)
+CATALOG_TTL = 5.0
+
+# /api/trends의 period 값 → 조회 기간 (일)
+TREND_PERIODS = {"1m": 30, "3m": 90, "6m": 180, "1y": 365, "3y": 1095, "5y": 1825}
+DEFAULT_TREND_PERIOD = "1y"
+
+# 대시보드 판매량/리뷰 키워드 상위 개수
+TOP_N = 10
+
+# 입력 HTML 해시 계산 시 한 번에 읽는 크기
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# 상품명에서 연관 키워드로 셀 단어 (한글/영문/숫자 2글자 이상)
+_NAME_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+_SEARCH_PRODUCT_COLUMNS = [
+    "product_id",
+    "listing_id",
+    "name",
+    "price",
+    "original_price",
+    "discount_rate",
+    "review_count",
+    "rating",
+    "is_rocket",
+    "delivery_type",
+    "seller",
+    "image_url",
+    "product_url",
+    "rank",
+]
+
+
+class ApiError(Exception):
+    """HTTP 상태 코드와 함께 클라이언트에 돌려줄 오류"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def encode_payload(payload):
+    """응답 dict를 JSON bytes와 ETag로 (프로세스 풀 워커에서 호출)"""
+    body = json.dumps(
+        to_jsonable(payload), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    return body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def trend_points(store, keyword, start=None):
+    """스냅샷별 상품 수/중간 가격/총 리뷰 수 시계열 (수집 시각 순)"""
+    history = store.history_frame(
+        keyword, columns=("price", "review_count"), start=start
+    )
+    if history.empty:
+        return pd.DataFrame(
+            columns=["capturedAt", "productCount", "medianPrice", "totalReviews"]
+        )
+    # 가격이 없는 상품(0)은 중간 가격에서 제외
+    history = history.assign(price=history["price"].where(history["price"] > 0))
+    grouped = history.groupby("captured_at", sort=True)
+    points = pd.DataFrame(
+        {
+            "productCount": grouped["product_id"].size(),
+            "medianPrice": grouped["price"].median(),
+            "totalReviews": grouped["review_count"].sum(),
+        }
+    )
+    points.index.name = "capturedAt"
+    return points.reset_index()
+
+
+def trend_insights(points):
+    """첫 스냅샷과 마지막 스냅샷 비교 문장"""
+    if len(points) < 2:
+        return ["비교할 스냅샷이 2개 이상 쌓이면 추이를 알려 드립니다."]
+    first, last = points.iloc[0], points.iloc[-1]
+    days = max((last["capturedAt"] - first["capturedAt"]).days, 1)
+    insights = [
+        f"{days}일 동안 검색 결과 상품 수 {int(first['productCount'])}개 → "
+        f"{int(last['productCount'])}개"
+    ]
+    if first["medianPrice"] > 0 and not np.isnan(last["medianPrice"]):
+        change = (last["medianPrice"] / first["medianPrice"] - 1) * 100
+        insights.append(f"중간 가격 {change:+.1f}% (₩{last['medianPrice']:,.0f})")
+    review_growth = int(last["totalReviews"] - first["totalReviews"])
+    insights.append(f"총 리뷰 수 {review_growth:+,}개 (하루 평균 {review_growth / days:,.1f}개)")
+    return insights
+
+
+def related_keywords(names, keyword, top_n=TOP_N):
+    """상품명에 자주 나오는 단어 (검색 키워드에 들어 있는 단어 제외)"""
+    excluded = set(_NAME_WORD.findall(keyword or ""))
+    counts = Counter()
+    for name in names.dropna():
+        counts.update(set(_NAME_WORD.findall(str(name))) - excluded)
+    return [word for word, _ in counts.most_common(top_n)]
+
+
+# --- 프로세스 풀 작업 (결과는 워커에서 바로 JSON으로 인코딩) ---
+
+
+def _search_task(search_paths, page, backend, cache_dir):
+    """검색 결과 page번째 페이지만 파싱하여 상품 반환
+
+    다른 페이지는 읽지 않으므로 중복 제거와 rank는 이 페이지 안에서 계산하고,
+    totalCount는 이 페이지의 상품 수입니다.
+    """
+    page_df = parse_search_files(
+        search_paths[page - 1 : page],
+        backend=backend,
+        max_workers=1,
+        cache_dir=cache_dir,
+    )
+    if len(page_df):
+        page_df = page_df.assign(page=page)
+    products = ProductTable(page_df).frame
+    return encode_payload(
+        {
+            "products": products[
+                [c for c in _SEARCH_PRODUCT_COLUMNS if c in products.columns]
+            ],
+            "totalCount": len(products),
+            "page": page,
+            "hasNext": page < len(search_paths),
+        }
+    )
+
+
+def build_dashboard(keyword, product_table, reviews_df, store, as_of):
+    """키워드 대시보드 dict: 가격/리뷰수/판매량/판매형태/리뷰 분석 + 스냅샷 추이
+
+    API 요청 시 계산(_dashboard_task)과 스케줄러의 사전 계산이 함께 사용합니다.
+    """
+    report = build_report(keyword, product_table, reviews_df, top_n=TOP_N)
+    sales = SalesEstimator(
+        product_table.frame, store.history_frame(keyword), as_of=as_of
+    ).get_top_n(TOP_N)
+    start = pd.Timestamp(as_of) - pd.Timedelta(
+        days=TREND_PERIODS[DEFAULT_TREND_PERIOD]
+    )
+    return {
+        "keyword": keyword,
+        "productCount": report["product_count"],
+        "priceData": report["price"],
+        "reviewData": report["review_count"],
+        "salesData": sales[
+            [
+                "product_id",
+                "name",
+                "review_count",
+                "estimated_monthly_sales",
+                "estimate_method",
+            ]
+        ],
+        "trendData": trend_points(store, keyword, start=start),
+        "analysisData": {
+            "delivery": report["delivery"],
+            "reviews": report["reviews"],
+        },
+    }
+
+
+def _dashboard_task(
+    keyword, search_paths, detail_paths, as_of, backend, cache_dir, store_root
+):
+    """저장된 HTML로 키워드 대시보드 계산"""
+    products_df = parse_search_files(
+        search_paths, backend=backend, max_workers=1, cache_dir=cache_dir
+    )
+    reviews_df = (
+        parse_review_files(detail_paths, max_workers=1, cache_dir=cache_dir)
+        if detail_paths
+        else None
+    )
+    return encode_payload(
+        build_dashboard(
+            keyword,
+            ProductTable(products_df),
+            reviews_df,
+            SnapshotStore(store_root),
+            as_of,
+        )
+    )
+
+
+def _trends_task(keyword, start, store_root):
+    """스냅샷 저장소 기반 키워드 추이"""
+    store = SnapshotStore(store_root)
+    points = trend_points(store, keyword, start=start)
+    latest = store.latest(keyword, columns=["name"])
+    return encode_payload(
+        {
+            "keyword": keyword,
+            "trendPoints": points,
+            "relatedKeywords": (
+                related_keywords(latest["name"], keyword) if latest is not None else []
+            ),
+            "insights": trend_insights(points),
+        }
+    )
+
+
+def _analyze_html_task(html_content, kind, backend, cache_dir):
+    """업로드된 HTML 1페이지 분석 (kind: "search" 또는 "detail")"""
+    parse_cache = ParseCache(cache_dir) if cache_dir else None
+    if kind == "detail":
+        parser = ProductDetailParser(scoped=True)
+
+        def parse(html):
+            return parser.parse_product_detail(html).get("reviews")
+
+        reviews_df = (
+            parse_cache.get_or_parse("detail", html_content, parse)
+            if parse_cache
+            else parse(html_content)
+        )
+        review_text_analyzer = ReviewTextAnalyzer(reviews_df, max_workers=1)
+        analysis = review_text_analyzer.analyze(top_n=TOP_N)
+        return encode_payload(
+            {
+                "reviewCount": analysis["review_count"],
+                "sentimentDistribution": analysis["sentiment_distribution"],
+                "keywords": analysis["keywords"],
+                "tokenizer": analysis["tokenizer"],
+            }
+        )
+
+    parser = CoupangParser(backend=backend, scoped=True)
+    products_df = (
+        parse_cache.get_or_parse("search", html_content, parser.parse_search_html)
+        if parse_cache
+        else parser.parse_search_html(html_content)
+    )
+    report = build_report(None, ProductTable(products_df), None, top_n=TOP_N)
+    return encode_payload(
+        {
+            "productCount": report["product_count"],
+            "priceData": report["price"],
+            "reviewData": report["review_count"],
+            "analysisData": {"delivery": report["delivery"]},
+        }
+    )
+
+
+class ResponseCache:
+    """인코딩된 JSON 응답 캐시 (내용 해시 키, LRU)"""
+
+    def __init__(
+        self,
+        max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=RESPONSE_CACHE_MAX_BYTES,
+    ):
+        """ResponseCache 초기화
+
+        Args:
+            max_entries (int): 보관할 최대 응답 수
+            max_bytes (int): JSON 총 크기 한도 (바이트)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """캐시된 (body, etag) (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        self._entries[key] = entry
+        self._bytes += len(entry[0])
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (body, _) = self._entries.popitem(last=False)
+            self._bytes -= len(body)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class AnalysisService:
+    """파서/분석기를 비동기로 제공하는 서비스 (프로세스 풀 + 내용 해시 캐시)
+
+    CPU를 쓰는 파싱/분석은 모두 프로세스 풀에서 실행하고 결과는 워커에서 JSON으로
+    인코딩해 받으므로 이벤트 루프는 막히지 않습니다. 파일 목록 스캔, 해시 계산,
+    스냅샷 목록 조회처럼 블로킹 I/O는 스레드로 보냅니다.
+
+    응답은 (엔드포인트, 입력 HTML 내용 해시, 스냅샷 목록, 파라미터) 키로 캐시하므로
+    파일이 바뀌지 않으면 다시 계산하지 않고, 같은 키를 동시에 요청한 클라이언트들은
+    진행 중인 계산 하나를 함께 기다립니다.
+    """
+
+    def __init__(
+        self,
+        data_dir,
+        store_root=SNAPSHOT_DIR,
+        backend="lxml-native",
+        max_workers=None,
+        cache_dir=PARSE_CACHE_DIR,
+        response_cache=None,
+        results_root=RESULTS_DIR,
+    ):
+        """AnalysisService 초기화
+
+        Args:
+            data_dir (str): 키워드 폴더(search/, detail/)가 있는 HTML 폴더
+                (pipeline.batch와 같은 레이아웃)
+            store_root (str): SnapshotStore 루트 (추이/판매량 추정)
+            backend (str): CoupangParser 파싱 백엔드
+            max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+            cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+            response_cache (ResponseCache): 응답 캐시 (None이면 기본 한도로 생성)
+            results_root (str): 스케줄러가 미리 계산한 ResultStore 루트
+                (None이면 사용 안 함)
+        """
+        self.data_dir = data_dir
+        self.store_root = store_root
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self.cache = response_cache or ResponseCache()
+        self.store = SnapshotStore(store_root)
+        self.results = ResultStore(results_root) if results_root else None
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._inflight = {}
+        self._catalog = {}
+        self._catalog_time = 0.0
+        self._digests = {}  # 경로 → (mtime_ns, 크기, SHA-256)
+        self._lock = threading.Lock()
+        self.computed = 0
+
+    # --- 입력 파일 (스레드에서 실행) ---
+
+    def _jobs(self):
+        """키워드 → 작업 (CATALOG_TTL초마다 입력 폴더 다시 스캔)"""
+        with self._lock:
+            if time.monotonic() - self._catalog_time > CATALOG_TTL:
+                jobs = find_jobs(self.data_dir)
+                self._catalog = {job["keyword"]: job for job in jobs}
+                self._catalog_time = time.monotonic()
+            return self._catalog
+
+    def _file_digest(self, path):
+        """(수정 시각 ns, 파일 내용 SHA-256) (수정 시각/크기가 그대로면 이전 해시 재사용)"""
+        stat = os.stat(path)
+        with self._lock:
+            memo = self._digests.get(path)
+        if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+            return stat.st_mtime_ns, memo[2]
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_DIGEST_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+        with self._lock:
+            self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return stat.st_mtime_ns, digest
+
+    def _resolve(self, keyword):
+        """키워드 작업과 입력 파일 내용 해시, 마지막 저장 시각"""
+        job = self._jobs().get(keyword)
+        if job is None:
+            raise ApiError(404, f"저장된 HTML이 없는 키워드입니다: {keyword}")
+        digests = []
+        modified_ns = 0
+        for path in job["search_paths"] + job["detail_paths"]:
+            mtime_ns, digest = self._file_digest(path)
+            digests.append(digest)
+            modified_ns = max(modified_ns, mtime_ns)
+        return job, tuple(digests), pd.Timestamp(modified_ns, unit="ns")
+
+    def _snapshot_version(self, keyword):
+        """키워드 스냅샷 파일 목록 (스냅샷이 추가되면 바뀜)"""
+        return self.store.version(keyword)
+
+    # --- 공용 실행 ---
+
+    async def _cached(self, key, task, *args):
+        """캐시된 응답 또는 task(*args)를 프로세스 풀에서 실행한 결과 (body, etag)
+
+        같은 키의 계산이 진행 중이면 새로 제출하지 않고 그 결과를 함께 기다립니다.
+        """
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._compute(key, task, args))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 먼저 요청한 클라이언트가 끊겨도 공유 계산은 취소되지 않도록 shield
+        return await asyncio.shield(pending)
+
+    async def _compute(self, key, task, args):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            entry = await loop.run_in_executor(self.pool, task, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 새로 만들고 이번 요청은 실패 처리
+            logging.error("프로세스 풀이 손상되어 다시 만듭니다.")
+            self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            raise ApiError(503, "분석 워커가 재시작되었습니다. 다시 요청하세요.")
+        self.computed += 1
+        logging.info(
+            f"API 계산 완료: {key[0]} {time.perf_counter() - start:.3f}s "
+            f"({len(entry[0])} bytes)"
+        )
+        return self.cache.put(key, entry)
+
+    # --- 엔드포인트 ---
+
+    async def search(self, keyword, page=1):
+        """GET /api/search: 키워드 검색 결과 page번째 페이지 상품"""
+        job, digests, _ = await asyncio.to_thread(self._resolve, keyword)
+        if page < 1 or page > len(job["search_paths"]):
+            raise ApiError(
+                404, f"페이지 범위를 벗어났습니다: {page} (1-{len(job['search_paths'])})"
+            )
+        # 응답은 page번째 파일과 전체 페이지 수(hasNext)에만 의존
+        page_key = (digests[page - 1], len(job["search_paths"]))
+        return await self._cached(
+            ("search", keyword, page_key, page, self.backend),
+            _search_task,
+            job["search_paths"],
+            page,
+            self.backend,
+            self.cache_dir,
+        )
+
+    async def dashboard(self, keyword):
+        """GET /api/dashboard: 키워드 대시보드 데이터
+
+        스케줄러(pipeline.scheduler)가 미리 계산한 결과가 있으면 계산 없이 그대로
+        돌려주고, 없을 때만 저장된 HTML로 계산합니다.
+        """
+        if self.results is not None:
+            precomputed = await asyncio.to_thread(self.results.dashboard, keyword)
+            if precomputed is not None:
+                return precomputed
+        (job, digests, as_of), snapshots = await asyncio.gather(
+            asyncio.to_thread(self._resolve, keyword),
+            asyncio.to_thread(self._snapshot_version, keyword),
+        )
+        return await self._cached(
+            ("dashboard", keyword, digests, snapshots, as_of, self.backend),
+            _dashboard_task,
+            keyword,
+            job["search_paths"],
+            job["detail_paths"],
+            as_of,
+            self.backend,
+            self.cache_dir,
+            self.store_root,
+        )
+
+    async def trends(self, keyword, period=DEFAULT_TREND_PERIOD):
+        """GET /api/trends: 스냅샷 기반 키워드 추이"""
+        if period not in TREND_PERIODS:
+            raise ApiError(
+                400, f"지원하지 않는 period입니다: {period} (가능한 값: {list(TREND_PERIODS)})"
+            )
+        snapshots = await asyncio.to_thread(self._snapshot_version, keyword)
+        start = pd.Timestamp.now().normalize() - pd.Timedelta(
+            days=TREND_PERIODS[period]
+        )
+        return await self._cached(
+            ("trends", keyword, snapshots, start, period),
+            _trends_task,
+            keyword,
+            start,
+            self.store_root,
+        )
+
+    async def analyze_html(self, html_bytes, kind="search"):
+        """POST /api/analyze: 본문으로 받은 HTML 1페이지 분석"""
+        if kind not in ("search", "detail"):
+            raise ApiError(400, f"kind는 search 또는 detail이어야 합니다: {kind}")
+        if not html_bytes:
+            raise ApiError(400, "분석할 HTML 본문이 비어 있습니다.")
+        digest = await asyncio.to_thread(ParseCache.content_hash, html_bytes)
+        html_content = html_bytes.decode("utf-8", errors="replace")
+        return await self._cached(
+            ("analyze", kind, digest, self.backend),
+            _analyze_html_task,
+            html_content,
+            kind,
+            self.backend,
+            self.cache_dir,
+        )
+
+    def health(self):
+        return {
+            "status": "ok",
+            "workers": self.max_workers,
+            "computed": self.computed,
+            "inflight": len(self._inflight),
+            "cache": self.cache.stats(),
+        }
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,212 @@
+"""API 서버(api.server) 동시 접속 벤치마크
+
+docs/ 폴더의 HTML 픽스처로 임시 키워드 폴더와 스냅샷 저장소를 만들고, 같은
+프로세스에서 127.0.0.1 빈 포트로 서버를 띄운 뒤 keep-alive 클라이언트 여러 개가
+/api/dashboard, /api/search, /api/trends를 섞어 요청합니다(네트워크 불필요).
+첫 요청(프로세스 풀 계산)과 동시 요청(캐시/진행 중 계산 공유)의 지연 시간,
+초당 요청 수, 실제 계산 횟수, ETag 재검증(304)을 출력합니다.
+
+사용법:
+    python benchmarks/bench_api_server.py [--clients 50] [--requests 20] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+DOCS_DIR = os.path.join(ROOT_DIR, "docs")
+
+
+class _Client:
+    """keep-alive HTTP/1.1 클라이언트 (벤치마크용 최소 구현)"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, path, method="GET", body=b"", headers=None):
+        """(상태 코드, 응답 헤더, 본문)"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        length = int(response_headers.get("content-length", 0))
+        payload = await self.reader.readexactly(length) if length else b""
+        return status, response_headers, payload
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+def _make_fixtures(root):
+    """키워드 폴더 2개 (검색 2페이지+상세, 검색 1페이지)와 스냅샷 2개 생성"""
+    import pandas as pd
+
+    from parsers.coupang_parser import CoupangParser, extract_search_keyword
+    from storage.snapshot_store import SnapshotStore
+
+    data_dir = os.path.join(root, "html")
+    first = os.path.join(data_dir, "first")
+    os.makedirs(os.path.join(first, "search"))
+    os.makedirs(os.path.join(first, "detail"))
+    shutil.copy(os.path.join(DOCS_DIR, "coupang.html"), os.path.join(first, "search"))
+    shutil.copy(
+        os.path.join(DOCS_DIR, "coupang_1.html"), os.path.join(first, "search")
+    )
+    shutil.copy(
+        os.path.join(DOCS_DIR, "coupang_detail.html"), os.path.join(first, "detail")
+    )
+    second = os.path.join(data_dir, "second")
+    os.makedirs(second)
+    shutil.copy(os.path.join(DOCS_DIR, "coupang_1.html"), second)
+
+    with open(os.path.join(DOCS_DIR, "coupang.html"), encoding="utf-8") as f:
+        html_content = f.read()
+    keyword = extract_search_keyword(html_content) or "first"
+    products_df = CoupangParser(backend="lxml-native").parse_search_html(html_content)
+    store = SnapshotStore(os.path.join(root, "snapshots"))
+    now = pd.Timestamp.now()
+    store.append(keyword, products_df, captured_at=now - pd.Timedelta(days=30))
+    grown = products_df.assign(review_count=products_df["review_count"] + 25)
+    store.append(keyword, grown, captured_at=now - pd.Timedelta(days=1))
+    return data_dir, os.path.join(root, "snapshots"), keyword
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+async def _run(args, root):
+    from api.server import ApiServer
+    from api.service import AnalysisService
+
+    data_dir, store_root, keyword = _make_fixtures(root)
+    service = AnalysisService(
+        data_dir,
+        store_root=store_root,
+        max_workers=args.workers,
+        cache_dir=os.path.join(root, "parse-cache"),
+        results_root=None,
+    )
+    server = await ApiServer(service).start("127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    encoded = quote(keyword)
+    paths = [
+        f"/api/dashboard?keyword={encoded}",
+        f"/api/search?keyword={encoded}&page=1",
+        f"/api/search?keyword={encoded}&page=2",
+        f"/api/trends?keyword={encoded}&period=3m",
+        "/api/dashboard?keyword=second",
+    ]
+
+    try:
+        # 1) 첫 요청: 프로세스 풀에서 파싱/분석 (워커 시작 비용 포함)
+        client = _Client(host, port)
+        for path in paths:
+            start = time.perf_counter()
+            status, headers, payload = await client.request(path)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"첫 요청 {status} {elapsed:7.1f} ms {len(payload):>7} bytes  {path}")
+        status, headers, _ = await client.request(paths[0])
+        status, _, _ = await client.request(
+            paths[0], headers={"If-None-Match": headers["etag"]}
+        )
+        print(f"ETag 재검증: {status}")
+        with open(os.path.join(DOCS_DIR, "coupang_detail.html"), "rb") as f:
+            status, _, payload = await client.request(
+                "/api/analyze?kind=detail", method="POST", body=f.read()
+            )
+        print(f"POST /api/analyze?kind=detail: {status}, {len(payload)} bytes")
+        await client.close()
+
+        # 2) 동시 요청: 캐시 적중 + 동일 키 계산 공유 (새 키워드 포함해 캐시 비움)
+        service.cache.clear()
+        computed_before = service.computed
+        latencies = []
+
+        async def run_client(index):
+            client = _Client(host, port)
+            try:
+                for i in range(args.requests):
+                    path = paths[(index + i) % len(paths)]
+                    start = time.perf_counter()
+                    status, _, _ = await client.request(path)
+                    latencies.append(time.perf_counter() - start)
+                    if status != 200:
+                        raise RuntimeError(f"{path}: {status}")
+            finally:
+                await client.close()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client(i) for i in range(args.clients)))
+        elapsed = time.perf_counter() - start
+        total = len(latencies)
+        print(
+            f"\n동시 클라이언트 {args.clients}개 × {args.requests}회 = {total}회, "
+            f"{elapsed:.2f}s ({total / elapsed:,.0f} req/s)"
+        )
+        print(
+            f"지연 시간 p50 {_percentile(latencies, 0.5):.1f} ms, "
+            f"p95 {_percentile(latencies, 0.95):.1f} ms, "
+            f"최대 {max(latencies) * 1000:.1f} ms"
+        )
+        print(
+            f"실제 계산 {service.computed - computed_before}회 "
+            f"(서로 다른 요청 {len(paths)}개), 캐시 {service.cache.stats()}"
+        )
+        client = _Client(host, port)
+        health = json.loads((await client.request("/api/health"))[2])
+        await client.close()
+        print(f"health: {health}")
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--clients", type=int, default=50, help="동시 클라이언트 수")
+    arg_parser.add_argument("--requests", type=int, default=20, help="클라이언트당 요청 수")
+    arg_parser.add_argument("--workers", type=int, default=2, help="프로세스 수")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    root = tempfile.mkdtemp(prefix="bench-api-")
+    try:
+        asyncio.run(_run(args, root))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""비동기 페이지 수집기(fetcher.page_fetcher) 벤치마크
+
+docs/ 폴더의 HTML 픽스처를 돌려주는 로컬 대역 서버(fetcher.fixture_server)를 같은
+프로세스에서 127.0.0.1 빈 포트로 띄우고(네트워크 불필요) 다음을 측정합니다.
+
+1. 스트리밍 파싱 vs 전체 수신 후 파싱: 느린 chunked 응답에서 페이지당 시간
+2. 처리량: 키워드 여러 개의 검색 페이지 + 상세 페이지를 호스트별 속도 제한과
+   503 주입 아래에서 받을 때 초당 페이지 수, 재시도 수, 서버 동시 요청 수
+3. 재수집: 같은 URL을 다시 받을 때 ETag 조건부 요청(304)과 파싱 캐시 재사용
+
+사용법:
+    python benchmarks/bench_fetcher.py [--keywords 10] [--rate 20] [--per-host 4]
+        [--fail-every 7] [--chunk-delay 0.005]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+DOCS_DIR = os.path.join(ROOT_DIR, "docs")
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+async def _compare_streaming(base_url, repeat):
+    """같은 느린 응답을 스트리밍/전체 수신 후 파싱으로 받아 페이지당 시간 비교"""
+    from fetcher.page_fetcher import PageFetcher
+    from parsers.coupang_parser import CoupangParser
+
+    def buffered(stream):
+        html_content = stream.read()
+        return CoupangParser(backend="lxml-native", scoped=True).parse_search_html(
+            html_content
+        )
+
+    async with PageFetcher(
+        base_url=base_url, rate=1000, cache_dir=None, validators_path=None
+    ) as fetcher:
+        url = fetcher.search_url("bench")
+        timings = {}
+        for name, parse in (
+            ("전체 수신 후 파싱", buffered),
+            ("스트리밍 파싱", fetcher._parse_search),
+        ):
+            best = None
+            for _ in range(repeat):
+                result = await fetcher.fetch(url, "search", parse)
+                best = min(best or result["seconds"], result["seconds"])
+            timings[name] = (best, len(result["frame"]))
+    for name, (seconds, count) in timings.items():
+        print(f"  {name:<12} {seconds * 1000:8.1f} ms/페이지  상품 {count}개")
+
+
+async def _crawl(base_url, args, cache_dir, validators_path):
+    from fetcher.page_fetcher import PageFetcher
+
+    async with PageFetcher(
+        base_url=base_url,
+        rate=args.rate,
+        burst=args.per_host,
+        max_per_host=args.per_host,
+        backoff=0.05,
+        cache_dir=cache_dir,
+        validators_path=validators_path,
+    ) as fetcher:
+        start = time.perf_counter()
+        jobs = [
+            fetcher.fetch_search_pages(f"keyword-{i}", pages=2)
+            for i in range(args.keywords)
+        ]
+        jobs.append(fetcher.fetch_reviews([f"{i}" for i in range(args.keywords)]))
+        outputs = await asyncio.gather(*jobs)
+        elapsed = time.perf_counter() - start
+        results = [result for _, page_results in outputs for result in page_results]
+        products = sum(len(frame) for frame, _ in outputs[:-1])
+        reviews = len(outputs[-1][0])
+        return elapsed, results, products, reviews, fetcher.stats()
+
+
+def _report(label, elapsed, results, products, reviews, stats, server):
+    latencies = [result["seconds"] for result in results]
+    print(
+        f"  {label}: {len(results)}페이지 {elapsed:.2f}s "
+        f"({len(results) / elapsed:,.1f} 페이지/s), 상품 {products}개, 리뷰 {reviews}개"
+    )
+    print(
+        f"    지연 p50 {_percentile(latencies, 0.5):.1f} ms, "
+        f"p95 {_percentile(latencies, 0.95):.1f} ms, "
+        f"재시도 {stats['retries']}회, 304 {stats['not_modified']}회, "
+        f"수신 {stats['bytes_received'] / 1024:,.0f} KiB"
+    )
+    print(
+        f"    연결 {stats['connections']}, 속도 제한 대기 "
+        f"{stats['rate_wait_seconds']:.2f}s, 서버 최대 동시 요청 {server.max_active}, "
+        f"서버 응답 {dict(server.statuses)}"
+    )
+
+
+async def _run(args, root):
+    from fetcher.fixture_server import FixtureServer
+
+    # 1) 스트리밍 비교: 실패 주입 없이 느린 chunked 응답만
+    slow_server = FixtureServer(DOCS_DIR, chunk_delay=args.chunk_delay)
+    server = await slow_server.start("127.0.0.1", 0)
+    try:
+        print(f"1) 느린 응답 (16KiB 조각마다 {args.chunk_delay * 1000:.0f} ms 지연)")
+        await _compare_streaming(slow_server.base_url(server), args.repeat)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    # 2), 3) 속도 제한 + 503 주입 서버에서 수집 후 같은 URL 재수집
+    fixture_server = FixtureServer(DOCS_DIR, fail_every=args.fail_every)
+    server = await fixture_server.start("127.0.0.1", 0)
+    base_url = fixture_server.base_url(server)
+    cache_dir = os.path.join(root, "parse-cache")
+    validators_path = os.path.join(root, "validators.json")
+    try:
+        print(
+            f"\n2) 키워드 {args.keywords}개 × 검색 2페이지 + 상세 {args.keywords}개 "
+            f"(호스트당 {args.rate:g} req/s, 동시 {args.per_host}, "
+            f"{args.fail_every}번째 요청마다 503)"
+        )
+        outcome = await _crawl(base_url, args, cache_dir, validators_path)
+        _report("첫 수집", *outcome, fixture_server)
+
+        fixture_server.statuses.clear()
+        print("\n3) 같은 URL 재수집 (ETag 조건부 요청)")
+        outcome = await _crawl(base_url, args, cache_dir, validators_path)
+        _report("재수집", *outcome, fixture_server)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=10, help="키워드 수")
+    arg_parser.add_argument("--rate", type=float, default=20.0, help="호스트당 req/s")
+    arg_parser.add_argument("--per-host", type=int, default=4, help="호스트당 동시 요청")
+    arg_parser.add_argument(
+        "--fail-every", type=int, default=7, help="n번째 요청마다 503 (0이면 없음)"
+    )
+    arg_parser.add_argument(
+        "--chunk-delay", type=float, default=0.005, help="느린 응답의 조각 간 지연 (초)"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="스트리밍 비교 반복")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    root = tempfile.mkdtemp(prefix="bench-fetcher-")
+    try:
+        asyncio.run(_run(args, root))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""대시보드 그림 캐시(analyzers.figure_cache) 벤치마크
+
+docs/coupang.html 상품(기본)과 이를 N개로 복제한 대량 상품(대량 모드 차트)으로
+대시보드 차트마다 st.plotly_chart 한 번에 드는 시간을 비교합니다.
+- 캐시 없음: 분석기로 그림을 만들고 Streamlit과 같은 방식으로 직렬화
+- 그림 캐시: 보관한 go.Figure를 그대로 직렬화 (to_dict, 검증 생략)
+- JSON 캐시: JSON으로 보관했다가 dict로 복원해 넘김 (이전 방식, dict는 다시 검증됨)
+
+main.py는 "그림 캐시"가 "캐시 없음"보다 빠른 차트에만 캐시를 사용합니다.
+
+사용법:
+    python benchmarks/bench_figure_cache.py [--sizes 32 5000] [--repeat 20]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def _marshal(figure_or_data):
+    """st.plotly_chart가 그림을 프런트엔드로 보내기 전에 하는 변환"""
+    import plotly.io as pio
+    import plotly.tools
+
+    figure = plotly.tools.return_figure_from_figure_or_data(
+        figure_or_data, validate_figure=True
+    )
+    return pio.to_json(figure, validate=False)
+
+
+def _load_products(size):
+    """픽스처 상품을 size개로 복제한 ProductTable"""
+    import numpy as np
+    import pandas as pd
+    from analyzers.product_table import ProductTable
+    from parsers.coupang_parser import CoupangParser
+
+    with open(os.path.join(ROOT_DIR, "docs", "coupang.html"), encoding="utf-8") as f:
+        sample = CoupangParser(backend="lxml-native", metrics=None).parse_search_html(
+            f.read()
+        )
+    products_df = sample.iloc[np.arange(size) % len(sample)].reset_index(drop=True)
+    products_df["listing_id"] = np.arange(size).astype(str)
+    products_df["product_id"] = products_df["listing_id"]
+    return ProductTable(products_df), pd
+
+
+def _charts(size):
+    """(차트 이름, 그림을 만드는 함수) 목록"""
+    from analyzers.delivery_analyzer import DeliveryAnalyzer
+    from analyzers.price_analyzer import PriceAnalyzer
+    from analyzers.review_analyzer import ReviewAnalyzer
+    from analyzers.review_text_analyzer import ReviewTextAnalyzer
+    from analyzers.sales_estimator import SalesEstimator
+
+    table, pd = _load_products(size)
+    top_n_df = SalesEstimator(table.frame).get_top_n(10)
+    text_analyzer = ReviewTextAnalyzer(pd.DataFrame({"content": []}))
+    distribution = pd.DataFrame({"감정": ["긍정", "중립", "부정"], "리뷰 수": [61, 25, 14]})
+    keywords = pd.DataFrame(
+        {"키워드": [f"키워드{i}" for i in range(20)], "리뷰 수": range(40, 20, -1)}
+    )
+    return [
+        ("price_bars", PriceAnalyzer(table).create_product_price_bar_chart),
+        ("review_bars", ReviewAnalyzer(table).create_product_review_bar_chart),
+        ("delivery_stack", DeliveryAnalyzer(table).create_delivery_pie_chart),
+        (
+            "top_sales",
+            lambda: SalesEstimator(table.frame).create_top_sales_chart(top_n_df),
+        ),
+        (
+            "sentiment_pie",
+            lambda: text_analyzer.create_sentiment_pie_chart(distribution),
+        ),
+        ("review_keywords", lambda: text_analyzer.create_keyword_bar_chart(keywords)),
+    ]
+
+
+def _best(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[32, 5000])
+    arg_parser.add_argument("--repeat", type=int, default=20, help="측정 반복 (최솟값)")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    import plotly.io as pio
+    from analyzers.figure_cache import FigureCache
+
+    print(f"{'상품 수':>7} {'차트':<16} {'캐시 없음':>9} {'그림 캐시':>9} {'JSON 캐시':>9}")
+    for size in args.sizes:
+        for name, build in _charts(size):
+            build()  # plotly 지연 로딩/템플릿 준비를 측정에서 제외
+            cache = FigureCache()
+            figure = cache.get_or_build(name, build)
+            spec = pio.to_json(figure, validate=False)
+            uncached = _best(lambda: _marshal(build()), args.repeat)
+            cached = _best(
+                lambda: _marshal(cache.get_or_build(name, build)), args.repeat
+            )
+            json_cached = _best(lambda: _marshal(json.loads(spec)), args.repeat)
+            print(
+                f"{size:>7,} {name:<16} {uncached:>7.1f}ms {cached:>7.1f}ms "
+                f"{json_cached:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
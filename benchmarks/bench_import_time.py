@@ -0,0 +1,151 @@
+"""파싱/분석 코어 모듈의 임포트 시간 예산 검사
+
+모듈마다 새 파이썬 프로세스에서 코어가 반드시 쓰는 pandas를 먼저 임포트한 뒤
+모듈 임포트에 추가로 드는 시간을 측정해(repeat회 중 최솟값) 예산을 넘거나, 코어 모듈이 plotly/streamlit(그리고 lxml-native 경로는 bs4)을 함께
+임포트하면 실패(종료 코드 1)합니다. 배치 CLI, API 서버(api.server), 페이지 수집기, 프로세스 풀 워커가
+시작할 때마다 이 시간을 내므로 회귀를 막기 위한 검사입니다.
+
+--profile을 주면 -X importtime 결과를 최상위 패키지별 자체 시간 합계로 묶어
+무엇이 느린지 보여 줍니다.
+
+사용법:
+    python benchmarks/bench_import_time.py [--repeat 5] [--profile pipeline.batch]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기준선 모듈 (코어가 항상 임포트하므로 측정 전에 미리 임포트해 예산에서 제외)
+BASELINE_MODULE = "pandas"
+
+# 모듈별 (기준선 이후 추가 임포트 시간 예산 ms, 함께 임포트되면 안 되는 패키지)
+IMPORT_BUDGETS = {
+    "parsers.coupang_parser": (40, ("plotly", "streamlit", "bs4")),
+    "parsers.search_pages": (40, ("plotly", "streamlit", "bs4")),
+    "parsers.review_pages": (40, ("plotly", "streamlit", "bs4")),
+    "analyzers.product_table": (30, ("plotly", "streamlit")),
+    "analyzers.price_analyzer": (30, ("plotly", "streamlit")),
+    "analyzers.review_analyzer": (30, ("plotly", "streamlit")),
+    "analyzers.delivery_analyzer": (30, ("plotly", "streamlit")),
+    "analyzers.review_text_analyzer": (30, ("plotly", "streamlit")),
+    "analyzers.sales_estimator": (30, ("plotly", "streamlit")),
+    "analyzers.snapshot_diff": (30, ("plotly", "streamlit")),
+    "storage.snapshot_store": (30, ("plotly", "streamlit")),
+    "pipeline.batch": (60, ("plotly", "streamlit", "bs4")),
+    "api.server": (120, ("plotly", "streamlit", "bs4")),
+    "fetcher.page_fetcher": (80, ("plotly", "streamlit", "bs4")),
+    "pipeline.scheduler": (120, ("plotly", "streamlit", "bs4")),
+}
+
+# 자식 프로세스: 임포트 시간(초)과 로드된 최상위 패키지 출력
+_MEASURE_CODE = """
+import json, sys, time
+{preload}
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "packages": sorted({{name.split(".")[0] for name in sys.modules}}),
+}}))
+"""
+
+
+def measure(module, repeat, preload=None):
+    """새 프로세스에서 module 임포트 시간 측정 (repeat회 중 최솟값 ms, 로드된 패키지)
+
+    preload가 주어지면 그 모듈을 먼저 임포트한 뒤(측정 제외) 시간을 잽니다.
+    """
+    code = _MEASURE_CODE.format(
+        module=module, preload=f"import {preload}" if preload else ""
+    )
+    best = None
+    packages = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        elapsed_ms = result["seconds"] * 1000
+        if best is None or elapsed_ms < best:
+            best = elapsed_ms
+        packages = set(result["packages"])
+    return best, packages
+
+
+def profile(module, top=15):
+    """-X importtime 결과를 최상위 패키지별 자체 시간 합계로 묶어 상위 top개 출력"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_part, _, name = line.split("|")
+        self_us = self_part.split(":")[1].strip()
+        if not self_us.isdigit():  # 헤더 줄
+            continue
+        name = name.strip()
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + int(self_us)
+    rows = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+    print(f"\n{module} 임포트 시간 상위 {len(rows)}개 패키지 (자체 시간 합계)")
+    for package, total_us in rows:
+        print(f"  {package:<24} {total_us / 1000:8.1f} ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    arg_parser.add_argument(
+        "--profile", action="append", default=[], help="패키지별로 나눠 볼 모듈"
+    )
+    args = arg_parser.parse_args()
+
+    baseline_ms, _ = measure(BASELINE_MODULE, args.repeat)
+    print(f"기준선 import {BASELINE_MODULE}: {baseline_ms:.1f} ms\n")
+    print(f"{'모듈':<32} {'추가':>8} {'예산':>6}  결과")
+
+    failures = []
+    for module, (budget_ms, forbidden) in IMPORT_BUDGETS.items():
+        extra_ms, packages = measure(module, args.repeat, preload=BASELINE_MODULE)
+        loaded = sorted(set(forbidden) & packages)
+        problems = []
+        if extra_ms > budget_ms:
+            problems.append(f"예산 초과 {extra_ms - budget_ms:.1f} ms")
+        if loaded:
+            problems.append(f"불필요한 임포트 {loaded}")
+        failures.extend(f"{module}: {problem}" for problem in problems)
+        print(
+            f"{module:<32} {extra_ms:8.1f} {budget_ms:6d}  "
+            + ("; ".join(problems) or "OK")
+        )
+
+    for module in args.profile:
+        profile(module)
+
+    if failures:
+        print("\n임포트 시간 예산 검사 실패:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n임포트 시간 예산 검사 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
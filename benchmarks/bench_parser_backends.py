@@ -0,0 +1,106 @@
+"""CoupangParser 파싱 백엔드별 성능 벤치마크
+
+docs/ 폴더의 HTML 픽스처를 각 백엔드(전체/scoped 모드)로 파싱하여
+파싱 시간과 최대 메모리 사용량을 비교합니다.
+측정마다 새 프로세스를 사용하므로 이전 측정의 메모리가 결과에 섞이지 않습니다.
+
+사용법:
+    python benchmarks/bench_parser_backends.py [--repeat 5]
+"""
+
+import argparse
+import glob
+import logging
+import multiprocessing as mp
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+try:
+    import resource  # Windows에는 없음
+except ImportError:
+    resource = None
+
+
+def _peak_rss_kb():
+    """현재 프로세스의 최대 RSS (KB, Linux 기준)"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(backend, scoped, path, repeat, queue):
+    """자식 프로세스에서 한 백엔드/픽스처 조합을 측정"""
+    logging.disable(logging.CRITICAL)
+    from parsers.coupang_parser import CoupangParser
+
+    with open(path, encoding="utf-8") as f:
+        html_content = f.read()
+    parser = CoupangParser(backend=backend, scoped=scoped)
+
+    # 메모리: 첫 파싱에서 측정 (tracemalloc은 파이썬 힙만, RSS는 lxml C 메모리 포함)
+    rss_before = _peak_rss_kb()
+    tracemalloc.start()
+    products_df = parser.parse_search_html(html_content)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _peak_rss_kb()
+
+    # 시간: repeat회 중 최솟값
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse_search_html(html_content)
+        timings.append(time.perf_counter() - start)
+
+    queue.put(
+        {
+            "fixture": os.path.basename(path),
+            "backend": backend,
+            "scoped": scoped,
+            "products": len(products_df),
+            "parse_ms": min(timings) * 1000,
+            "py_peak_mb": py_peak / 1024 / 1024,
+            "rss_peak_delta_mb": (
+                (rss_after - rss_before) / 1024 if rss_before is not None else None
+            ),
+        }
+    )
+
+
+def main():
+    from parsers.coupang_parser import PARSER_BACKENDS
+
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5, help="시간 측정 반복 횟수")
+    arg_parser.add_argument(
+        "--fixtures",
+        default=os.path.join(ROOT_DIR, "docs", "*.html"),
+        help="측정할 HTML 파일 glob 패턴",
+    )
+    args = arg_parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    rows = []
+    for path in sorted(glob.glob(args.fixtures)):
+        for backend in PARSER_BACKENDS:
+            for scoped in (False, True):
+                queue = ctx.Queue()
+                proc = ctx.Process(
+                    target=_measure, args=(backend, scoped, path, args.repeat, queue)
+                )
+                proc.start()
+                rows.append(queue.get())
+                proc.join()
+
+    import pandas as pd
+
+    print(pd.DataFrame(rows).to_string(index=False, float_format="%.2f"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""상품 DataFrame 조립 방식별 메모리 벤치마크
+
+docs/ 검색 결과 픽스처에서 추출한 상품 행을 N개(기본 1만/5만/10만)로 복제한 뒤
+- dict: 상품마다 dict를 만들어 pd.DataFrame(list[dict])로 조립 (기존 방식)
+- columnar: ProductColumnBuffer에 바로 누적 후 압축 dtype으로 조립
+두 방식의 조립 시간, 조립 중 최대 파이썬 힙(tracemalloc), 결과 DataFrame
+메모리(memory_usage(deep=True), 전체 및 압축 dtype 컬럼만)를 비교합니다.
+
+사용법:
+    python benchmarks/bench_product_table.py [--sizes 10000 50000 100000]
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+TYPED_COLUMNS = [
+    "price",
+    "original_price",
+    "discount_rate",
+    "review_count",
+    "rating",
+    "is_rocket",
+    "delivery_type",
+]
+
+
+def _load_rows():
+    """픽스처에서 상품 행 튜플 추출"""
+    from parsers.coupang_parser import CoupangParser
+
+    parser = CoupangParser(backend="lxml-native", metrics=None)
+    rows = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "docs", "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            rows.extend(parser._iter_products(f.read()))
+    return rows
+
+
+def _build_dict(rows):
+    import pandas as pd
+    from parsers.product_columns import PRODUCT_COLUMNS
+
+    return pd.DataFrame([dict(zip(PRODUCT_COLUMNS, row)) for row in rows])
+
+
+def _build_columnar(rows):
+    from parsers.product_columns import ProductColumnBuffer
+
+    buffer = ProductColumnBuffer()
+    for row in rows:
+        buffer.append(row)
+    return buffer.to_frame()
+
+
+def _measure(build, rows):
+    """조립 시간, 최대 파이썬 힙, 결과 DataFrame 메모리 측정 (MB)"""
+    start = time.perf_counter()
+    build(rows)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    products_df = build(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    memory = products_df.memory_usage(deep=True)
+    return {
+        "build_ms": seconds * 1000,
+        "peak_mb": peak / 1024**2,
+        "frame_mb": memory.sum() / 1024**2,
+        # 문자열 컬럼(이름/URL)은 두 방식이 같으므로 압축 대상 컬럼만 따로 집계
+        "typed_mb": memory[TYPED_COLUMNS].sum() / 1024**2,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000]
+    )
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    import pandas as pd
+
+    sample = _load_rows()
+    if not sample:
+        print("docs/ 폴더에서 상품을 찾지 못했습니다.")
+        return
+
+    results = []
+    for size in args.sizes:
+        # 문자열 객체는 공유되지만 두 방식에 동일하게 적용되므로 비교에는 영향 없음
+        rows = [sample[i % len(sample)] for i in range(size)]
+        for name, build in (("dict", _build_dict), ("columnar", _build_columnar)):
+            results.append({"rows": size, "method": name, **_measure(build, rows)})
+
+    result_df = pd.DataFrame(results)
+    dict_df = result_df[result_df["method"] == "dict"].set_index("rows")
+    for column in ("frame_mb", "typed_mb"):
+        baseline = result_df["rows"].map(dict_df[column])
+        result_df[column.replace("_mb", "_saving")] = 1 - result_df[column] / baseline
+    with pd.option_context("display.float_format", "{:.2f}".format):
+        print(result_df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""키워드 수집 스케줄러(pipeline.scheduler) 벤치마크와 비정상 종료 재개 검사
+
+docs/ 폴더의 HTML 픽스처를 돌려주는 로컬 대역 서버(fetcher.fixture_server)를 같은
+프로세스에서 띄우고(네트워크 불필요), 임시 폴더의 작업 큐/스냅샷/결과 저장소로
+다음을 확인합니다.
+
+1. 등록: 키워드 작업을 우선순위를 섞어 등록하고 같은 키워드를 다시 등록해 병합 확인
+2. 비정상 종료: 별도 프로세스로 스케줄러를 실행하다 일부 작업이 끝나면 SIGKILL
+3. 재개: 같은 큐로 스케줄러를 다시 실행해 중단된 작업을 체크포인트부터 마무리하고
+   처리량(작업/s)과 키워드별 스냅샷 수(중복 수집 여부) 출력
+4. 조회: API 서비스가 미리 계산된 대시보드를 계산 없이 돌려주는 지연 시간
+
+사용법:
+    python benchmarks/bench_scheduler.py [--keywords 12] [--workers 2] [--pages 2]
+        [--details 2] [--chunk-delay 0.004]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+DOCS_DIR = os.path.join(ROOT_DIR, "docs")
+
+
+def _paths(root):
+    return {
+        "queue": os.path.join(root, "jobs.sqlite3"),
+        "store": os.path.join(root, "snapshots"),
+        "results": os.path.join(root, "results"),
+        "cache": os.path.join(root, "parse-cache"),
+        "validators": os.path.join(root, "validators.json"),
+    }
+
+
+async def _crash_run(args, paths, base_url, queue):
+    """하위 프로세스 스케줄러를 실행하다 작업 일부가 끝나면 SIGKILL"""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "pipeline.scheduler",
+        "--queue",
+        paths["queue"],
+        "run",
+        "--workers",
+        str(args.workers),
+        "--base-url",
+        base_url,
+        "--rate",
+        str(args.rate),
+        "--per-host",
+        str(args.workers * 2),
+        "--store",
+        paths["store"],
+        "--results",
+        paths["results"],
+        "--cache-dir",
+        paths["cache"],
+        "--validators",
+        paths["validators"],
+        "--poll",
+        "0.2",
+        cwd=ROOT_DIR,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    target = max(1, args.keywords // 3)
+    start = time.perf_counter()
+    while True:
+        counts = await asyncio.to_thread(queue.counts)
+        if counts.get("done", 0) >= target and counts.get("running"):
+            break
+        if process.returncode is not None or time.perf_counter() - start > 120:
+            raise RuntimeError(f"하위 스케줄러가 예상대로 진행되지 않았습니다: {counts}")
+        await asyncio.sleep(0.02)
+    process.send_signal(signal.SIGKILL)
+    await process.wait()
+    return time.perf_counter() - start
+
+
+async def _run(args, root):
+    from api.service import AnalysisService
+    from fetcher.fixture_server import FixtureServer
+    from fetcher.page_fetcher import PageFetcher
+    from pipeline.scheduler import CrawlScheduler
+    from storage.job_queue import JobQueue
+    from storage.snapshot_store import SnapshotStore
+
+    paths = _paths(root)
+    fixture_server = FixtureServer(
+        DOCS_DIR, chunk_delay=args.chunk_delay, fail_every=args.fail_every
+    )
+    server = await fixture_server.start("127.0.0.1", 0)
+    base_url = fixture_server.base_url(server)
+    queue = JobQueue(paths["queue"], lease_seconds=60)
+    keywords = [f"keyword-{i:02d}" for i in range(args.keywords)]
+    try:
+        # 1) 등록 + 중복 병합
+        created = merged = 0
+        for i, keyword in enumerate(keywords):
+            _, new = queue.enqueue(
+                keyword, priority=i % 3, pages=args.pages, details=args.details
+            )
+            created += new
+        for keyword in keywords[::2]:
+            _, new = queue.enqueue(keyword, priority=5, pages=args.pages)
+            merged += not new
+        print(f"1) 작업 등록 {created}개, 같은 키워드 재등록 {merged}회 → 병합")
+
+        # 2) 하위 프로세스 스케줄러를 실행 중 강제 종료
+        elapsed = await _crash_run(args, paths, base_url, queue)
+        counts = queue.counts()
+        running = queue.jobs(status="running")
+        checkpointed = sum(job["stage"] == "analyze" for job in running)
+        print(
+            f"2) {elapsed:.2f}s 후 SIGKILL: {counts} "
+            f"(실행 중 {len(running)}개 중 체크포인트 있음 {checkpointed}개)"
+        )
+        done_jobs = sorted(queue.jobs(status="done"), key=lambda job: job["updated_at"])
+        done_order = [job["priority"] for job in done_jobs]
+        print(f"   먼저 끝난 작업의 우선순위 순서: {done_order}")
+
+        # 3) 같은 큐로 재시작 → 중단된 작업 재개
+        fetcher = PageFetcher(
+            base_url=base_url,
+            rate=args.rate,
+            max_per_host=args.workers * 2,
+            backoff=0.05,
+            cache_dir=paths["cache"],
+            validators_path=paths["validators"],
+        )
+        scheduler = CrawlScheduler(
+            queue,
+            fetcher,
+            store_root=paths["store"],
+            results_root=paths["results"],
+            max_workers=args.workers,
+            poll_interval=0.1,
+        )
+        counts = queue.counts()
+        remaining = counts.get("queued", 0) + counts.get("running", 0)
+        start = time.perf_counter()
+        try:
+            await scheduler.run(until_idle=True)
+        finally:
+            scheduler.close()
+            fetcher.close()
+        elapsed = time.perf_counter() - start
+        counts = queue.counts()
+        resumed = sum(job["attempts"] > 1 for job in queue.jobs(status="done"))
+        print(
+            f"3) 재시작 후 {remaining}개 작업 {elapsed:.2f}s "
+            f"({remaining / elapsed:.1f} 작업/s): {counts}, 재시도/재개된 작업 {resumed}개, "
+            f"페이지 수집 {fetcher.stats()}"
+        )
+        store = SnapshotStore(paths["store"])
+        snapshot_counts = [len(store.version(keyword)) for keyword in keywords]
+        print(
+            f"   키워드별 스냅샷 수: 최소 {min(snapshot_counts)}, 최대 {max(snapshot_counts)} "
+            f"(2 이상이면 체크포인트 직전 종료로 다시 수집한 키워드)"
+        )
+        if counts.get("done") != len(keywords):
+            raise RuntimeError(f"완료되지 않은 작업이 있습니다: {counts}")
+
+        # 4) 미리 계산된 대시보드 조회
+        service = AnalysisService(
+            os.path.join(root, "no-html"),
+            store_root=paths["store"],
+            results_root=paths["results"],
+            cache_dir=None,
+            max_workers=1,
+        )
+        try:
+            latencies = []
+            for i in range(args.reads):
+                start = time.perf_counter()
+                await service.dashboard(keywords[i % len(keywords)])
+                latencies.append(time.perf_counter() - start)
+        finally:
+            service.close()
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        print(
+            f"4) 대시보드 조회 {args.reads}회: p50 {p50:.2f} ms, "
+            f"최대 {latencies[-1] * 1000:.2f} ms, 계산 {service.computed}회"
+        )
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--keywords", type=int, default=12, help="키워드 수")
+    arg_parser.add_argument("--workers", type=int, default=2, help="동시 작업 수")
+    arg_parser.add_argument("--pages", type=int, default=2, help="키워드당 검색 페이지")
+    arg_parser.add_argument("--details", type=int, default=2, help="키워드당 상세 페이지")
+    arg_parser.add_argument("--rate", type=float, default=50.0, help="호스트당 req/s")
+    arg_parser.add_argument(
+        "--fail-every", type=int, default=9, help="n번째 요청마다 503 (0이면 없음)"
+    )
+    arg_parser.add_argument(
+        "--chunk-delay", type=float, default=0.004, help="응답 조각 간 지연 (초)"
+    )
+    arg_parser.add_argument("--reads", type=int, default=500, help="대시보드 조회 수")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    root = tempfile.mkdtemp(prefix="bench-scheduler-")
+    try:
+        asyncio.run(_run(args, root))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
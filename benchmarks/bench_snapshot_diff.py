@@ -0,0 +1,89 @@
+"""스냅샷 비교(SnapshotDiff) 벤치마크
+
+docs/coupang.html 상품을 N개(기본 1만/5만)의 서로 다른 listing_id로 복제한
+이전 스냅샷과, 5% 이탈/신규 상품, 10% 가격 변동, 30% 리뷰 증가를 섞은 현재
+스냅샷을 만들어 비교 및 요약 지표 갱신 시간을 측정합니다. 증분 갱신 결과가
+전체 재집계와 같은지도 확인합니다.
+
+사용법:
+    python benchmarks/bench_snapshot_diff.py [--sizes 10000 50000] [--repeat 5]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def _make_snapshots(sample_df, size, seed=0):
+    """이전/현재 스냅샷 쌍 생성"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    old_df = sample_df.iloc[np.arange(size) % len(sample_df)].reset_index(drop=True)
+    old_df["listing_id"] = np.arange(size).astype(str)
+    old_df["product_id"] = old_df["listing_id"]
+
+    new_df = old_df.sample(frac=0.95, random_state=seed)
+    added = old_df.iloc[: size // 20].copy()
+    added["listing_id"] = [f"new-{i}" for i in range(len(added))]
+    added["product_id"] = added["listing_id"]
+    new_df = pd.concat([new_df, added], ignore_index=True)
+
+    price_changed = rng.random(len(new_df)) < 0.1
+    new_df.loc[price_changed, "price"] += 100
+    review_gained = rng.random(len(new_df)) < 0.3
+    new_df.loc[review_gained, "review_count"] += 3
+    return old_df, new_df
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    import pandas as pd
+    from analyzers.snapshot_diff import SnapshotDiff, summary_stats
+    from parsers.coupang_parser import CoupangParser
+
+    with open(os.path.join(ROOT_DIR, "docs", "coupang.html"), encoding="utf-8") as f:
+        sample_df = CoupangParser(backend="lxml-native").parse_search_html(f.read())
+
+    results = []
+    for size in args.sizes:
+        old_df, new_df = _make_snapshots(sample_df, size)
+        old_stats = summary_stats(old_df)
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            snapshot_diff = SnapshotDiff(old_df, new_df)
+            stats = snapshot_diff.update_stats(old_stats)
+            timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        full_stats = summary_stats(new_df)
+        full_seconds = time.perf_counter() - start
+        results.append(
+            {
+                "rows": size,
+                "diff_ms": min(timings) * 1000,
+                "full_stats_ms": full_seconds * 1000,
+                "stats_match": stats == full_stats,
+                **snapshot_diff.summary(),
+            }
+        )
+
+    with pd.option_context("display.float_format", "{:.2f}".format):
+        print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
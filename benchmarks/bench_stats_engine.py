@@ -0,0 +1,130 @@
+"""가격/리뷰 통계 계산 벤치마크 (StatsEngine)
+
+docs/coupang.html 상품을 N개(기본 1만/10만)로 복제한 뒤
+- pandas: 분석기마다 필터링 후 mean/median/std/quantile/pd.cut을 각각 호출 (기존 방식)
+- engine: StatsEngine이 모든 숫자 컬럼을 한 번에 계산 (첫 요청)
+- memoized: 같은 데이터로 분석기를 다시 만들었을 때 (리렌더링)
+세 경우의 시간을 비교하고, 결과가 기존 방식과 같은지 확인합니다.
+
+사용법:
+    python benchmarks/bench_stats_engine.py [--sizes 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def _pandas_stats(products_df):
+    """기존 분석기 방식의 가격/리뷰 통계"""
+    import pandas as pd
+
+    results = {}
+    for column, bins in (
+        ("price", [0, 10000, 30000, 50000, 100000, 200000, float("inf")]),
+        ("review_count", [0, 10, 50, 100, 500, 1000, float("inf")]),
+    ):
+        values = products_df[column].fillna(0).astype(int)
+        values = values[values > 0]
+        results[column] = {
+            "count": len(values),
+            "mean": values.mean(),
+            "median": values.median(),
+            "std": values.std(),
+            "min": values.min(),
+            "max": values.max(),
+            "q25": values.quantile(0.25),
+            "q75": values.quantile(0.75),
+            "distribution": pd.cut(values, bins=bins, right=False)
+            .value_counts()
+            .sort_index()
+            .tolist(),
+        }
+    return results
+
+
+def _engine_stats(products_df):
+    """StatsEngine 방식의 가격/리뷰 통계"""
+    from analyzers.stats_engine import StatsEngine
+
+    engine = StatsEngine.for_frame(products_df)
+    results = {}
+    for column in ("price", "review_count"):
+        stats = dict(engine.column_stats(column))
+        stats.pop("sum")
+        stats["distribution"] = engine.distribution(column).tolist()
+        results[column] = stats
+    return results
+
+
+def _same(expected, actual):
+    import numpy as np
+
+    for column, stats in expected.items():
+        for key, value in stats.items():
+            if key == "distribution":
+                if value != actual[column][key]:
+                    return False
+            elif not np.isclose(value, actual[column][key], equal_nan=True):
+                return False
+    return True
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    import numpy as np
+    import pandas as pd
+    from analyzers.stats_engine import StatsEngine
+    from parsers.coupang_parser import CoupangParser
+
+    with open(os.path.join(ROOT_DIR, "docs", "coupang.html"), encoding="utf-8") as f:
+        sample_df = CoupangParser(backend="lxml-native").parse_search_html(f.read())
+
+    rng = np.random.default_rng(0)
+    results = []
+    for size in args.sizes:
+        products_df = sample_df.iloc[rng.integers(0, len(sample_df), size)]
+        products_df = products_df.reset_index(drop=True)
+        products_df["price"] = (
+            products_df["price"] * rng.uniform(0.5, 3.0, size)
+        ).round()
+
+        timings = {"pandas": [], "engine": [], "memoized": []}
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            expected = _pandas_stats(products_df)
+            timings["pandas"].append(time.perf_counter() - start)
+
+            StatsEngine._engines.clear()
+            start = time.perf_counter()
+            actual = _engine_stats(products_df)
+            timings["engine"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _engine_stats(products_df)
+            timings["memoized"].append(time.perf_counter() - start)
+
+        results.append(
+            {
+                "rows": size,
+                **{f"{k}_ms": min(v) * 1000 for k, v in timings.items()},
+                "match": _same(expected, actual),
+            }
+        )
+
+    with pd.option_context("display.float_format", "{:.2f}".format):
+        print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""docs/*.html 픽스처를 쿠팡 URL 형태로 돌려주는 로컬 대역 HTTP 서버
+
+PageFetcher를 네트워크 없이 검증하기 위한 서버로, 표준 라이브러리 asyncio 스트림
+위에서 keep-alive, ETag/Last-Modified 조건부 요청(304), gzip, chunked 전송(조각
+사이 지연 포함), n번째 요청마다 503, 초당 요청 한도를 넘으면 429(Retry-After)를
+흉내 냅니다.
+
+경로:
+    GET /np/search?q=<키워드>&page=<N>   N번째 검색 결과 픽스처 (키워드는 무시)
+    GET /vp/products/<상품ID>            상세/리뷰 픽스처
+
+사용법:
+    python -m fetcher.fixture_server [docs] [--port 8001] [--fail-every 5]
+        [--rate-limit 20] [--chunk-delay 0.01]
+"""
+
+import argparse
+import asyncio
+from collections import Counter, deque
+from email.utils import formatdate
+import gzip
+import hashlib
+import logging
+import os
+import time
+from urllib.parse import parse_qs, urlsplit
+
+SEARCH_FILES = ("coupang.html", "coupang_1.html")
+DETAIL_FILE = "coupang_detail.html"
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    503: "Service Unavailable",
+}
+
+
+class FixturePage:
+    """픽스처 파일 1개 (본문, gzip 본문, ETag, Last-Modified)"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.body = f.read()
+        self.gzip_body = gzip.compress(self.body, compresslevel=6)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+        self.last_modified = formatdate(os.path.getmtime(path), usegmt=True)
+
+    def not_modified(self, headers):
+        """조건부 요청 헤더가 현재 버전과 일치하는지"""
+        if "if-none-match" in headers:
+            return self.etag in headers["if-none-match"]
+        return headers.get("if-modified-since") == self.last_modified
+
+
+class FixtureServer:
+    """검색/상세 픽스처를 제공하는 asyncio HTTP 서버"""
+
+    def __init__(
+        self,
+        docs_dir="docs",
+        chunked=True,
+        chunk_size=16 * 1024,
+        chunk_delay=0.0,
+        fail_every=0,
+        rate_limit=None,
+        retry_after=1,
+    ):
+        """FixtureServer 초기화
+
+        Args:
+            docs_dir (str): coupang.html, coupang_1.html, coupang_detail.html 폴더
+            chunked (bool): True면 chunked 전송, False면 Content-Length 전송
+            chunk_size (int): 본문을 나눠 보내는 조각 크기 (바이트)
+            chunk_delay (float): 조각 사이 지연 (초, 느린 네트워크 흉내)
+            fail_every (int): n번째 요청마다 503 (0이면 사용 안 함)
+            rate_limit (int): 최근 1초 요청 수 한도 (넘으면 429, None이면 제한 없음)
+            retry_after (int): 429/503 응답의 Retry-After (초)
+        """
+        self.search_pages = [
+            FixturePage(os.path.join(docs_dir, name)) for name in SEARCH_FILES
+        ]
+        self.detail_page = FixturePage(os.path.join(docs_dir, DETAIL_FILE))
+        self.chunked = chunked
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.fail_every = fail_every
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.requests = 0
+        self.statuses = Counter()
+        self.active = 0
+        self.max_active = 0
+        self._recent = deque()
+
+    async def start(self, host="127.0.0.1", port=8001):
+        """서버 시작 (port=0이면 빈 포트, 실제 포트는 server.sockets에서 확인)"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def base_url(self, server):
+        host, port = server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def handle_connection(self, reader, writer):
+        """연결 하나에서 keep-alive로 요청을 차례로 처리"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    await self._handle(writer, parts, headers, keep_alive)
+                finally:
+                    self.active -= 1
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, writer, parts, headers, keep_alive):
+        self.requests += 1
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 1.0:
+            self._recent.popleft()
+        self._recent.append(now)
+
+        if len(parts) != 3 or parts[0] != "GET":
+            return await self._respond(writer, 400, keep_alive=keep_alive)
+        if self.rate_limit and len(self._recent) > self.rate_limit:
+            return await self._respond(
+                writer, 429, keep_alive=keep_alive, retry_after=self.retry_after
+            )
+        if self.fail_every and self.requests % self.fail_every == 0:
+            return await self._respond(
+                writer, 503, keep_alive=keep_alive, retry_after=0
+            )
+
+        page = self._route(parts[1])
+        if page is None:
+            return await self._respond(writer, 404, keep_alive=keep_alive)
+        if page.not_modified(headers):
+            return await self._respond(writer, 304, page, keep_alive)
+        use_gzip = "gzip" in headers.get("accept-encoding", "")
+        await self._respond(writer, 200, page, keep_alive, use_gzip=use_gzip)
+
+    def _route(self, target):
+        """요청 경로 → FixturePage (없으면 None)"""
+        url = urlsplit(target)
+        if url.path == "/np/search":
+            try:
+                page_no = int(parse_qs(url.query).get("page", ["1"])[0])
+            except ValueError:
+                return None
+            if 1 <= page_no <= len(self.search_pages):
+                return self.search_pages[page_no - 1]
+            return None
+        if url.path.startswith("/vp/products/"):
+            return self.detail_page
+        return None
+
+    async def _respond(
+        self,
+        writer,
+        status,
+        page=None,
+        keep_alive=True,
+        use_gzip=False,
+        retry_after=None,
+    ):
+        self.statuses[status] += 1
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            "Connection: " + ("keep-alive" if keep_alive else "close"),
+        ]
+        if retry_after is not None:
+            head.append(f"Retry-After: {retry_after}")
+        body = b""
+        if page is not None:
+            head += [f"ETag: {page.etag}", f"Last-Modified: {page.last_modified}"]
+            if status == 200:
+                head.append("Content-Type: text/html; charset=utf-8")
+                body = page.gzip_body if use_gzip else page.body
+                if use_gzip:
+                    head.append("Content-Encoding: gzip")
+        if status == 304:
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+            return
+        if not self.chunked or status != 200:
+            head.append(f"Content-Length: {len(body)}")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+            return
+
+        head.append("Transfer-Encoding: chunked")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        for start in range(0, len(body), self.chunk_size):
+            piece = body[start : start + self.chunk_size]
+            writer.write(f"{len(piece):x}\r\n".encode("latin-1") + piece + b"\r\n")
+            await writer.drain()
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+async def serve(fixture_server, host, port):
+    server = await fixture_server.start(host, port)
+    print(f"픽스처 서버: {fixture_server.base_url(server)}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("docs_dir", nargs="?", default="docs", help="픽스처 폴더")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8001)
+    arg_parser.add_argument(
+        "--fail-every", type=int, default=0, help="n번째 요청마다 503"
+    )
+    arg_parser.add_argument(
+        "--rate-limit", type=int, default=None, help="초당 요청 한도 (넘으면 429)"
+    )
+    arg_parser.add_argument(
+        "--chunk-delay", type=float, default=0.0, help="본문 조각 사이 지연 (초)"
+    )
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    fixture_server = FixtureServer(
+        args.docs_dir,
+        chunk_delay=args.chunk_delay,
+        fail_every=args.fail_every,
+        rate_limit=args.rate_limit,
+    )
+    try:
+        asyncio.run(serve(fixture_server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+import asyncio
+from collections import deque
+import time
+from urllib.parse import urlsplit
+import zlib
+
+# 본문을 읽어 올리는 조각 크기 (바이트)
+READ_CHUNK_SIZE = 64 * 1024
+# 상태 줄/헤더 한 줄 최대 크기와 헤더 수
+MAX_LINE_BYTES = 64 * 1024
+MAX_HEADERS = 200
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class HttpError(Exception):
+    """연결/프로토콜 오류 (재시도 대상)"""
+
+
+def split_url(url):
+    """URL → ((scheme, host, port), 요청 대상 경로)"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"지원하지 않는 URL입니다: {url}")
+    port = parts.port or DEFAULT_PORTS[scheme]
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    return (scheme, parts.hostname, port), target
+
+
+class ConnectionPool:
+    """(scheme, host, port)별 keep-alive 연결 재사용 풀"""
+
+    def __init__(self, max_idle_per_host=4, idle_timeout=30.0, connect_timeout=10.0):
+        """ConnectionPool 초기화
+
+        Args:
+            max_idle_per_host (int): 호스트별로 남겨 둘 유휴 연결 수
+            idle_timeout (float): 이 시간(초)보다 오래 쉰 연결은 버리고 새로 연결
+            connect_timeout (float): 연결(TLS 핸드셰이크 포함) 제한 시간 (초)
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.opened = 0
+        self.reused = 0
+        self._idle = {}
+        self._ssl_context = None
+
+    async def acquire(self, origin):
+        """(reader, writer, 재사용 여부) 반환 (유휴 연결이 없으면 새로 연결)"""
+        idle = self._idle.get(origin)
+        while idle:
+            reader, writer, released_at = idle.pop()
+            stale = time.monotonic() - released_at > self.idle_timeout
+            if stale or writer.is_closing() or reader.at_eof():
+                writer.close()
+                continue
+            self.reused += 1
+            return reader, writer, True
+
+        scheme, host, port = origin
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                # ssl(OpenSSL)은 https 연결을 처음 열 때만 로드
+                import ssl
+
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port, ssl=ssl_context, limit=MAX_LINE_BYTES
+                ),
+                self.connect_timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise HttpError(f"{host}:{port} 연결 실패: {e!r}") from e
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, origin, reader, writer, reusable):
+        """응답을 끝까지 읽은 연결을 풀에 반납 (재사용 불가면 닫음)"""
+        idle = self._idle.setdefault(origin, deque())
+        if not reusable or writer.is_closing() or len(idle) >= self.max_idle_per_host:
+            writer.close()
+            return
+        idle.append((reader, writer, time.monotonic()))
+
+    def close(self):
+        """유휴 연결 모두 닫기"""
+        for idle in self._idle.values():
+            while idle:
+                idle.pop()[1].close()
+
+    def stats(self):
+        return {
+            "opened": self.opened,
+            "reused": self.reused,
+            "idle": sum(len(idle) for idle in self._idle.values()),
+        }
+
+
+class HttpResponse:
+    """상태/헤더까지 읽은 응답 (본문은 iter_chunks()로 조각 단위 수신)"""
+
+    def __init__(
+        self,
+        pool,
+        origin,
+        reader,
+        writer,
+        url,
+        status,
+        reason,
+        version,
+        headers,
+        timeout,
+        has_body,
+    ):
+        """HttpResponse 초기화 (HttpClient.request()가 생성)"""
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.bytes_received = 0
+        self._pool = pool
+        self._origin = origin
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._has_body = has_body
+        self._keep_alive = self._is_keep_alive(version, headers)
+        self._finished = False
+
+    @staticmethod
+    def _is_keep_alive(version, headers):
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            return connection != "close"
+        return connection == "keep-alive"
+
+    @property
+    def charset(self):
+        """Content-Type의 charset (없으면 None)"""
+        for param in self.headers.get("content-type", "").split(";")[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"') or None
+        return None
+
+    async def _read(self, coro):
+        try:
+            return await asyncio.wait_for(coro, self._timeout)
+        except asyncio.TimeoutError as e:
+            raise HttpError(f"응답 본문 수신 시간 초과: {self.url}") from e
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            raise HttpError(f"응답 본문 수신 실패: {self.url} ({e!r})") from e
+
+    async def _iter_raw(self):
+        """전송 인코딩(chunked/Content-Length/연결 종료)을 풀어 원본 조각 반환"""
+        reader = self._reader
+        if self.headers.get("transfer-encoding", "").lower().endswith("chunked"):
+            while True:
+                size_line = await self._read(reader.readline())
+                try:
+                    size = int(size_line.split(b";")[0].strip(), 16)
+                except ValueError:
+                    raise HttpError(f"잘못된 chunk 크기: {size_line[:40]!r}")
+                if size == 0:
+                    # trailer 헤더는 사용하지 않으므로 빈 줄까지 버림
+                    while True:
+                        line = await self._read(reader.readline())
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                    return
+                yield await self._read(reader.readexactly(size))
+                await self._read(reader.readline())
+        elif "content-length" in self.headers:
+            remaining = int(self.headers["content-length"])
+            while remaining > 0:
+                piece = await self._read(reader.read(min(remaining, READ_CHUNK_SIZE)))
+                if not piece:
+                    raise HttpError(f"응답 본문이 {remaining}바이트 덜 왔습니다: {self.url}")
+                remaining -= len(piece)
+                yield piece
+        else:
+            # 길이 정보가 없으면 연결이 닫힐 때까지 읽고 재사용하지 않음
+            self._keep_alive = False
+            while True:
+                piece = await self._read(reader.read(READ_CHUNK_SIZE))
+                if not piece:
+                    return
+                yield piece
+
+    async def iter_chunks(self):
+        """본문 조각을 받는 대로 반환 (gzip/deflate는 풀어서 반환)"""
+        if self._finished:
+            return
+        try:
+            if self._has_body:
+                encoding = self.headers.get("content-encoding", "").lower()
+                # wbits 47: gzip/zlib 헤더 자동 감지
+                decompressor = (
+                    zlib.decompressobj(47) if encoding in ("gzip", "deflate") else None
+                )
+                async for piece in self._iter_raw():
+                    self.bytes_received += len(piece)
+                    if decompressor is not None:
+                        piece = decompressor.decompress(piece)
+                    if piece:
+                        yield piece
+                if decompressor is not None:
+                    tail = decompressor.flush()
+                    if tail:
+                        yield tail
+        except zlib.error as e:
+            self.close()
+            raise HttpError(f"응답 압축 해제 실패: {self.url} ({e})") from e
+        except BaseException:
+            self.close()
+            raise
+        self._finished = True
+        self._pool.release(self._origin, self._reader, self._writer, self._keep_alive)
+
+    async def read(self):
+        """본문 전체 (bytes)"""
+        return b"".join([piece async for piece in self.iter_chunks()])
+
+    def close(self):
+        """본문을 끝까지 읽지 않고 버릴 때 연결 닫기"""
+        if not self._finished:
+            self._finished = True
+            self._writer.close()
+
+
+class HttpClient:
+    """ConnectionPool 위의 최소 비동기 HTTP/1.1 클라이언트 (GET/HEAD)"""
+
+    def __init__(self, pool=None, timeout=30.0, headers=None):
+        """HttpClient 초기화
+
+        Args:
+            pool (ConnectionPool): 연결 풀 (None이면 새로 생성)
+            timeout (float): 응답 헤더/본문 조각 하나를 기다리는 제한 시간 (초)
+            headers (dict): 모든 요청에 붙일 기본 헤더
+        """
+        self.pool = pool or ConnectionPool()
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+
+    async def request(self, url, headers=None, method="GET"):
+        """요청을 보내고 상태/헤더까지 읽은 HttpResponse 반환
+
+        재사용한 keep-alive 연결이 서버 쪽에서 이미 닫혀 있었으면 새 연결로 한 번
+        다시 보냅니다.
+        """
+        origin, target = split_url(url)
+        scheme, host, port = origin
+        host_header = host if port == DEFAULT_PORTS[scheme] else f"{host}:{port}"
+        merged = {"Host": host_header, "Accept-Encoding": "gzip, deflate"}
+        merged.update(self.headers)
+        merged.update(headers or {})
+        lines = [f"{method} {target} HTTP/1.1"]
+        lines += [f"{name}: {value}" for name, value in merged.items()]
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        while True:
+            reader, writer, reused = await self.pool.acquire(origin)
+            try:
+                writer.write(head)
+                await writer.drain()
+                status_line = await asyncio.wait_for(reader.readline(), self.timeout)
+                if not status_line:
+                    raise ConnectionResetError("응답 없이 연결이 닫혔습니다")
+                status, reason, version, response_headers = await self._read_head(
+                    status_line, reader
+                )
+            except (
+                OSError,
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+            ) as e:
+                writer.close()
+                if reused:
+                    continue
+                raise HttpError(f"요청 실패: {url} ({e!r})") from e
+            except (asyncio.TimeoutError, ValueError, HttpError) as e:
+                # ValueError: 한 줄이 MAX_LINE_BYTES를 넘는 경우
+                writer.close()
+                raise HttpError(f"응답 헤더 수신 실패: {url} ({e!r})") from e
+            except BaseException:
+                writer.close()
+                raise
+            has_body = method != "HEAD" and status >= 200 and status not in (204, 304)
+            return HttpResponse(
+                self.pool,
+                origin,
+                reader,
+                writer,
+                url,
+                status,
+                reason,
+                version,
+                response_headers,
+                self.timeout,
+                has_body,
+            )
+
+    async def _read_head(self, status_line, reader):
+        """상태 줄과 헤더 파싱 → (상태 코드, 사유, 버전, 소문자 헤더 dict)"""
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise HttpError(f"잘못된 상태 줄: {status_line[:80]!r}")
+        version = parts[0]
+        try:
+            status = int(parts[1])
+        except ValueError:
+            raise HttpError(f"잘못된 상태 코드: {status_line[:80]!r}")
+        reason = parts[2].strip() if len(parts) > 2 else ""
+        headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), self.timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HttpError("응답 헤더가 너무 많습니다")
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            value = value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        return status, reason, version, headers
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,485 @@
+"""쿠팡 검색/상세 페이지를 비동기로 받아 바로 파서에 흘려보내는 페이지 수집기
+
+호스트별 동시 요청 수 제한과 토큰 버킷 속도 제한, keep-alive 연결 재사용,
+429/5xx/연결 오류 재시도(지수 백오프 + Retry-After), ETag/Last-Modified 조건부
+요청을 지원합니다. 응답 본문은 임시 파일 없이 받는 조각 그대로 파서 스레드에
+넘기므로 다운로드와 파싱이 겹치고, 304 응답은 ParseCache에 저장된 이전 파싱
+결과로 대신합니다.
+
+사용법:
+    python -m fetcher.page_fetcher <키워드> [--pages 2] [--details 상품ID ...]
+        [--base-url http://127.0.0.1:8001] [--rate 1.0] [--output 결과.parquet]
+"""
+
+import argparse
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+
+from fetcher.http_client import ConnectionPool, HttpClient, HttpError, split_url
+from fetcher.rate_limit import HostLimiter
+from parsers.coupang_parser import PARSER_BACKENDS, CoupangParser
+from parsers.parse_cache import PARSE_CACHE_DIR, ParseCache
+from parsers.product_detail_parser import ProductDetailParser
+from parsers.review_pages import merge_review_pages
+from parsers.search_pages import merge_search_pages
+
+COUPANG_BASE_URL = "https://www.coupang.com"
+SEARCH_PATH = "/np/search"
+DETAIL_PATH = "/vp/products/{product_id}"
+
+# 조건부 요청에 쓸 URL별 검증자(ETag/Last-Modified)와 본문 해시 저장 파일
+VALIDATORS_PATH = os.path.join(".cache", "fetch", "validators.json")
+
+# 재시도할 응답 상태 코드 (연결/수신 오류도 재시도)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+class FetchError(Exception):
+    """재시도 후에도 페이지를 받지 못한 경우"""
+
+    def __init__(self, url, message, status=None, retry_after=None):
+        super().__init__(f"{message}: {url}")
+        self.url = url
+        self.reason = message
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self):
+        return self.status is None or self.status in RETRY_STATUSES
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 초 (없거나 잘못되면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class BodyStream:
+    """이벤트 루프가 받은 본문 조각을 파서 스레드가 read()로 읽는 파일 객체
+
+    CoupangParser(lxml-native scoped)는 read(size)로 조각씩 읽어 상품 li가 닫히는
+    대로 처리하고, BeautifulSoup 기반 파서는 read()로 전체를 읽습니다. 조각은
+    charset에 맞춰 점진적으로 디코딩하므로 멀티바이트 문자가 잘려도 안전합니다.
+    """
+
+    def __init__(self, encoding="utf-8"):
+        """BodyStream 초기화
+
+        Args:
+            encoding (str): 응답 charset (알 수 없는 이름이면 utf-8)
+        """
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder(errors="replace")
+        self._queue = queue.Queue()
+        self._buffer = ""
+        self._eof = False
+
+    def feed(self, chunk):
+        """본문 조각 추가 (이벤트 루프 쪽)"""
+        self._queue.put(chunk)
+
+    def close(self):
+        """본문 끝 표시"""
+        self._queue.put(None)
+
+    def abort(self, error):
+        """수신 실패를 파서 스레드의 read()에 전달"""
+        self._queue.put(error)
+
+    def read(self, size=-1):
+        """최대 size자 (음수면 끝까지), 본문이 끝나면 빈 문자열"""
+        while not self._eof and (size is None or size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if item is None:
+                self._buffer += self._decoder.decode(b"", final=True)
+                self._eof = True
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                self._buffer += self._decoder.decode(item)
+        if size is None or size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class ValidatorStore:
+    """URL별 (ETag, Last-Modified, 본문 SHA-256) 저장소 (JSON 파일, 없으면 메모리)"""
+
+    def __init__(self, path=VALIDATORS_PATH, max_entries=10000):
+        """ValidatorStore 초기화
+
+        Args:
+            path (str): 저장 파일 경로 (None이면 프로세스 메모리에만 보관)
+            max_entries (int): 최대 URL 수 (넘으면 오래전에 갱신된 URL부터 제거)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"검증자 파일 읽기 실패 ({path}): {e}")
+
+    def get(self, url):
+        return self._entries.get(url)
+
+    def put(self, url, entry):
+        self._entries.pop(url, None)
+        self._entries[url] = entry
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+
+    def save(self):
+        """변경 사항을 임시 파일에 쓴 뒤 교체 (path가 없으면 무시)"""
+        if not self.path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class PageFetcher:
+    """호스트별 속도 제한/재시도/조건부 요청을 적용해 페이지를 받아 파싱"""
+
+    def __init__(
+        self,
+        base_url=COUPANG_BASE_URL,
+        backend="lxml-native",
+        rate=1.0,
+        burst=1,
+        max_per_host=2,
+        max_retries=3,
+        backoff=0.5,
+        max_backoff=30.0,
+        timeout=30.0,
+        cache_dir=PARSE_CACHE_DIR,
+        validators_path=VALIDATORS_PATH,
+        headers=None,
+    ):
+        """PageFetcher 초기화
+
+        Args:
+            base_url (str): 검색/상세 URL을 만들 사이트 주소 (테스트 서버 주소로 교체 가능)
+            backend (str): CoupangParser 파싱 백엔드
+            rate (float): 호스트별 초당 요청 수
+            burst (int): 호스트별로 한 번에 보낼 수 있는 최대 요청 수
+            max_per_host (int): 호스트별 동시 요청 수 (연결 수)
+            max_retries (int): 429/5xx/연결 오류 재시도 횟수
+            backoff (float): 첫 재시도 대기 시간 (초, 재시도마다 2배 + 지터)
+            max_backoff (float): 재시도 대기 시간 상한 (초)
+            timeout (float): 연결/응답 조각 하나를 기다리는 제한 시간 (초)
+            cache_dir (str): ParseCache 디렉터리 (None이면 조건부 요청 안 함)
+            validators_path (str): 검증자 저장 파일 (None이면 메모리에만 보관)
+            headers (dict): 기본 헤더에 덧붙일 요청 헤더
+        """
+        if backend not in PARSER_BACKENDS:
+            raise ValueError(f"지원하지 않는 파싱 백엔드입니다: {backend}")
+        self.base_url = base_url.rstrip("/")
+        self.backend = backend
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limiter = HostLimiter(rate, burst, max_per_host)
+        self.pool = ConnectionPool(
+            max_idle_per_host=max_per_host, connect_timeout=timeout
+        )
+        self.client = HttpClient(
+            self.pool, timeout=timeout, headers=dict(DEFAULT_HEADERS, **(headers or {}))
+        )
+        self.cache = ParseCache(cache_dir) if cache_dir else None
+        self.validators = ValidatorStore(validators_path)
+        # 파서 스레드 하나가 응답 하나를 끝까지 읽으므로 동시 요청 수만큼 준비
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_per_host, thread_name_prefix="fetch-parse"
+        )
+        self.requests = 0
+        self.retries = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+
+    def search_url(self, keyword, page=1):
+        query = {"q": keyword}
+        if page > 1:
+            query["page"] = page
+        return f"{self.base_url}{SEARCH_PATH}?{urlencode(query)}"
+
+    def detail_url(self, product_id):
+        return self.base_url + DETAIL_PATH.format(product_id=product_id)
+
+    def _parse_search(self, stream):
+        return CoupangParser(backend=self.backend, scoped=True).parse_search_html(
+            stream
+        )
+
+    @staticmethod
+    def _parse_detail(stream):
+        return ProductDetailParser(scoped=True).parse_product_detail(stream).get(
+            "reviews"
+        )
+
+    async def fetch_search(self, url):
+        """검색 결과 1페이지 → 결과 dict (frame: 상품 DataFrame)"""
+        return await self.fetch(url, "search", self._parse_search)
+
+    async def fetch_detail(self, url):
+        """상세/리뷰 1페이지 → 결과 dict (frame: 리뷰 DataFrame)"""
+        return await self.fetch(url, "detail", self._parse_detail)
+
+    async def fetch_search_pages(self, keyword, pages=1):
+        """검색 결과 1~pages페이지를 받아 병합 → (상품 DataFrame, 페이지별 결과)"""
+        urls = [self.search_url(keyword, page) for page in range(1, pages + 1)]
+        results = await asyncio.gather(*(self.fetch_search(url) for url in urls))
+        return merge_search_pages([result["frame"] for result in results]), results
+
+    async def fetch_reviews(self, product_ids):
+        """상품 상세 페이지들을 받아 리뷰 병합 → (리뷰 DataFrame, 페이지별 결과)"""
+        urls = [self.detail_url(product_id) for product_id in product_ids]
+        results = await asyncio.gather(*(self.fetch_detail(url) for url in urls))
+        return merge_review_pages(result["frame"] for result in results), results
+
+    async def fetch(self, url, kind, parse):
+        """url을 받아 parse(BodyStream) 결과를 담은 dict 반환
+
+        결과 dict: url, kind, status, frame, not_modified, attempts, bytes, seconds
+        재시도 후에도 실패하거나 재시도 대상이 아닌 상태 코드면 FetchError.
+        """
+        host = split_url(url)[0][1]
+        started = time.perf_counter()
+        attempts = 0
+        conditional = self.cache is not None
+        while True:
+            attempts += 1
+            validators = self.validators.get(url) if conditional else None
+            try:
+                async with self.limiter.limit(host):
+                    result = await self._request(url, kind, parse, validators)
+            except (FetchError, HttpError) as e:
+                if isinstance(e, FetchError) and not e.retryable:
+                    raise
+                status = getattr(e, "status", None)
+                retry_after = getattr(e, "retry_after", None)
+                if attempts > self.max_retries:
+                    raise FetchError(
+                        url,
+                        f"{attempts}회 시도 실패 ({getattr(e, 'reason', e)})",
+                        status=status,
+                    ) from e
+                if retry_after is not None and status == 429:
+                    # 호스트 전체가 Retry-After 동안 새 요청을 보내지 않도록 함
+                    self.limiter.bucket(host).penalize(retry_after)
+                delay = min(self.max_backoff, self.backoff * 2 ** (attempts - 1))
+                delay = max(delay * random.uniform(0.5, 1.0), retry_after or 0.0)
+                logging.warning(f"페이지 수신 실패, {delay:.2f}초 후 재시도: {e}")
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            if result is None:
+                # 304인데 파싱 캐시가 지워진 경우: 조건 없이 바로 다시 요청
+                conditional = False
+                attempts -= 1
+                continue
+            result.update(
+                url=url,
+                kind=kind,
+                attempts=attempts,
+                seconds=time.perf_counter() - started,
+            )
+            return result
+
+    async def _request(self, url, kind, parse, validators):
+        """요청 1회 (304인데 캐시된 파싱 결과가 없으면 None)"""
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        self.requests += 1
+        response = await self.client.request(url, headers)
+        status = response.status
+        if status != 200:
+            await response.read()
+            self.bytes_received += response.bytes_received
+            if status == 304 and validators:
+                frame = await self._run(self.cache.get, kind, validators["digest"])
+                if frame is None:
+                    return None
+                self.not_modified += 1
+                return {"status": 304, "frame": frame, "not_modified": True, "bytes": 0}
+            raise FetchError(
+                url,
+                f"HTTP {status} {response.reason}".strip(),
+                status=status,
+                retry_after=parse_retry_after(response.headers.get("retry-after")),
+            )
+
+        frame, digest = await self._stream_parse(response, parse)
+        self.bytes_received += response.bytes_received
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if self.cache is not None and frame is not None and (etag or last_modified):
+            await self._run(self.cache.put, kind, digest, frame)
+            self.validators.put(
+                url, {"etag": etag, "last_modified": last_modified, "digest": digest}
+            )
+        return {
+            "status": 200,
+            "frame": frame,
+            "not_modified": False,
+            "bytes": response.bytes_received,
+        }
+
+    async def _stream_parse(self, response, parse):
+        """본문 조각을 받는 대로 파서 스레드에 넘기고 (파싱 결과, 본문 SHA-256) 반환"""
+        stream = BodyStream(response.charset or "utf-8")
+        parsing = asyncio.get_running_loop().run_in_executor(
+            self._executor, parse, stream
+        )
+        digest = hashlib.sha256()
+        try:
+            async for chunk in response.iter_chunks():
+                digest.update(chunk)
+                stream.feed(chunk)
+        except BaseException as e:
+            # 파서 스레드가 read()에서 멈추지 않도록 실패를 전달 (결과는 버림)
+            stream.abort(e if isinstance(e, Exception) else HttpError("요청 취소"))
+            parsing.add_done_callback(lambda future: future.exception())
+            raise
+        stream.close()
+        return await parsing, digest.hexdigest()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "rate_wait_seconds": round(self.limiter.waited(), 3),
+            "connections": self.pool.stats(),
+        }
+
+    def close(self):
+        """검증자 저장, 연결/파서 스레드 정리"""
+        self.validators.save()
+        self.client.close()
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+async def _run_cli(args):
+    async with PageFetcher(
+        base_url=args.base_url,
+        backend=args.backend,
+        rate=args.rate,
+        burst=args.burst,
+        max_per_host=args.per_host,
+        max_retries=args.retries,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        validators_path=None if args.no_cache else args.validators,
+    ) as fetcher:
+        start = time.perf_counter()
+        products_df, results = await fetcher.fetch_search_pages(
+            args.keyword, args.pages
+        )
+        for result in results:
+            print(
+                f"{result['status']} {len(result['frame']):>4}개 "
+                f"{result['seconds']:6.2f}s  {result['url']}"
+            )
+        print(f"상품 {len(products_df)}개 (중복 제거 후)")
+        if args.details:
+            reviews_df, results = await fetcher.fetch_reviews(args.details)
+            print(f"리뷰 {len(reviews_df)}개 ({len(results)}페이지)")
+        elapsed = time.perf_counter() - start
+        print(f"{elapsed:.2f}s, {json.dumps(fetcher.stats(), ensure_ascii=False)}")
+        if args.output:
+            products_df.to_parquet(args.output, index=False)
+            print(f"저장: {args.output}")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("keyword", help="검색 키워드")
+    arg_parser.add_argument("--pages", type=int, default=1, help="검색 결과 페이지 수")
+    arg_parser.add_argument(
+        "--details", nargs="*", default=[], help="리뷰를 받을 상품 ID"
+    )
+    arg_parser.add_argument("--base-url", default=COUPANG_BASE_URL)
+    arg_parser.add_argument(
+        "--backend", default="lxml-native", choices=PARSER_BACKENDS
+    )
+    arg_parser.add_argument("--rate", type=float, default=1.0, help="호스트별 초당 요청 수")
+    arg_parser.add_argument("--burst", type=int, default=1)
+    arg_parser.add_argument("--per-host", type=int, default=2, help="호스트별 동시 요청 수")
+    arg_parser.add_argument("--retries", type=int, default=3)
+    arg_parser.add_argument("--cache-dir", default=PARSE_CACHE_DIR, help="파싱 캐시 폴더")
+    arg_parser.add_argument("--validators", default=VALIDATORS_PATH, help="검증자 파일")
+    arg_parser.add_argument(
+        "--no-cache", action="store_true", help="파싱 캐시/조건부 요청 사용 안 함"
+    )
+    arg_parser.add_argument("--output", help="병합한 상품을 저장할 Parquet 경로")
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(_run_cli(args))
+
+
+if __name__ == "__main__":
+    main()
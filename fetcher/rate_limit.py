@@ -0,0 +1,86 @@
+import asyncio
+from contextlib import asynccontextmanager
+import time
+
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 차는 토큰 버킷 (asyncio, 대기 순서대로 발급)"""
+
+    def __init__(self, rate, burst=1):
+        """TokenBucket 초기화
+
+        Args:
+            rate (float): 초당 발급 토큰 수 (요청 수)
+            burst (int): 쉬었다가 한 번에 보낼 수 있는 최대 요청 수 (버킷 크기)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.waited = 0.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """토큰 1개를 받을 때까지 대기"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+
+    def penalize(self, seconds):
+        """서버가 Retry-After로 요청한 시간 동안 새 토큰 발급 중지"""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수(세마포어)와 요청 속도(토큰 버킷) 제한"""
+
+    def __init__(self, rate=1.0, burst=1, max_per_host=2):
+        """HostLimiter 초기화
+
+        Args:
+            rate (float): 호스트별 초당 요청 수
+            burst (int): 호스트별 토큰 버킷 크기
+            max_per_host (int): 호스트별 동시 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_per_host = max(1, max_per_host)
+        self._semaphores = {}
+        self._buckets = {}
+
+    def bucket(self, host):
+        """호스트의 토큰 버킷 (처음 요청할 때 생성)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    @asynccontextmanager
+    async def limit(self, host):
+        """동시 요청 자리를 잡고 토큰을 받은 뒤 요청 구간 실행"""
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        async with semaphore:
+            await self.bucket(host).acquire()
+            yield
+
+    def waited(self):
+        """토큰을 기다린 시간 합계 (초)"""
+        return sum(bucket.waited for bucket in self._buckets.values())
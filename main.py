@@ -1,13 +1,31 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import numpy as np
-from parsers.coupang_parser import CoupangParser
+from parsers.coupang_parser import (
+    CoupangParser,
+    PARSER_BACKENDS,
+    extract_search_keyword,
+)
 from parsers.product_detail_parser import ProductDetailParser
+from parsers.debug_capture import DebugCapture
+from parsers.parser_metrics import PARSER_METRICS
+from parsers.search_pages import parse_search_pages, parse_search_files
+from parsers.review_pages import parse_review_pages
+from parsers.parse_cache import ParseCache
+from storage.snapshot_store import SnapshotStore
+from analyzers.product_table import ProductTable
 from analyzers.price_analyzer import PriceAnalyzer  # PriceAnalyzer 임포트
 from analyzers.review_analyzer import ReviewAnalyzer  # ReviewAnalyzer 임포트
 from analyzers.delivery_analyzer import DeliveryAnalyzer  # DeliveryAnalyzer 임포트
+from analyzers.review_text_analyzer import ReviewTextAnalyzer
+from analyzers.sales_estimator import SalesEstimator, DEFAULT_DAYS_SINCE_LAUNCH
+from analyzers.snapshot_diff import SnapshotDiff
+from analyzers.figure_cache import FigureCache, figure_key, frame_fingerprint
+from pipeline.dag_executor import DagExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import logging
+import os
+import threading
 
 # --- 로깅 설정 ---
 logging.basicConfig(
@@ -32,9 +50,15 @@ st.set_page_config(
 # 메인 타이틀
 st.title("🛒 쿠팡 카피캣 - 시장 분석 도구")
 
+# 세션에 보관하는 분석 결과 (다른 위젯을 조작해 다시 실행돼도 대시보드 유지)
+ANALYSIS_STATE_KEY = "analysis_result"
+
 # 캐시 클리어 버튼 (디버깅용)
+# 디스크 파싱 캐시(ParseCache)는 HTML 내용 해시 기반이라 지우지 않아도 결과가 바뀌지 않음
+# (그림 캐시도 데이터 지문 기반이라 마찬가지)
 if st.button("🔄 캐시 클리어 (새로운 분석)", type="secondary"):
     st.cache_data.clear()
+    st.session_state.pop(ANALYSIS_STATE_KEY, None)
     st.success("캐시가 클리어되었습니다. 파일을 다시 업로드하세요.")
     st.rerun()
 st.markdown("HTML 파일을 업로드하여 즉시 시장 데이터를 분석하세요!")
@@ -49,81 +73,238 @@ def read_html_file(uploaded_file):
     return None
 
 
-@st.cache_data
-def parse_coupang_search(html_content):
-    """쿠팡 검색 결과 HTML 파싱 (캐시 적용)"""
-    if not html_content:
-        return None
-    parser = CoupangParser()
-    return parser.parse_search_html(html_content)
+@st.cache_resource
+def get_debug_capture(first_n, only_fallback):
+    """디버그 캡처 인스턴스 (설정별로 기록 스레드 하나를 재사용)"""
+    return DebugCapture(first_n=first_n, only_fallback=only_fallback)
+
+
+@st.cache_resource
+def get_parse_cache():
+    """모든 세션이 공유하는 디스크 파싱 캐시 (재시작 후에도 유지)"""
+    return ParseCache()
+
+
+@st.cache_resource
+def get_snapshot_store():
+    """모든 세션이 공유하는 검색 결과 스냅샷 저장소"""
+    return SnapshotStore()
+
+
+@st.cache_resource
+def get_figure_cache():
+    """모든 세션이 공유하는 go.Figure 그림 캐시 (데이터 지문 + 차트 파라미터 키)"""
+    return FigureCache()
+
+
+def plot_cached(build, name, fingerprint=None, **params):
+    """그림 캐시에서 꺼내 표시 (없으면 build()로 만들어 저장), 그림 반환
+
+    캐시된 go.Figure는 검증 없이 직렬화되어 다시 만드는 것보다 빠릅니다
+    (benchmarks/bench_figure_cache.py). 여러 세션이 공유하므로 반환된 그림을
+    수정하면 안 되며, build()가 None을 반환하면 아무것도 그리지 않고 None을
+    반환합니다.
+    """
+    figure = get_figure_cache().get_or_build(
+        figure_key(name, fingerprint, **params), build
+    )
+    if figure is not None:
+        st.plotly_chart(figure, use_container_width=True)
+    return figure
+
+
+# 점진적 파싱 시 화면을 갱신하는 상품 묶음 크기
+STREAM_CHUNK_SIZE = 20
+
+
+def stream_coupang_search(html_content, report_progress, backend, debug_options=None):
+    """쿠팡 검색 결과 HTML을 점진적으로 파싱하며 요약 지표/가격 분포를 갱신
+
+    report_progress(text): 파싱한 상품 수를 진행 표시줄에 알리는 함수
+    debug_options: (first_n, only_fallback) 튜플. None이면 디버그 캡처 비활성
+    이미 파싱한 적 있는 HTML이면 디스크 캐시에서 바로 읽습니다.
+    """
+    parse_cache = get_parse_cache()
+    digest = parse_cache.content_hash(html_content)
+    cached = parse_cache.get("search", digest)
+    if cached is not None:
+        logging.info(f"검색 결과 파싱 캐시 사용: {len(cached)}개 상품")
+        return cached
+
+    # 미리보기 히스토그램을 그릴 때만 plotly 로드 (캐시 적중 시에는 불필요)
+    import plotly.express as px
+
+    debug_capture = get_debug_capture(*debug_options) if debug_options else None
+    # scoped: 상품 li 서브트리만 파싱
+    parser = CoupangParser(backend=backend, scoped=True, debug_capture=debug_capture)
+
+    summary_placeholder = st.empty()
+    preview_placeholder = st.empty()
+
+    chunks = []
+    total_count = price_count = rocket_count = 0
+    price_sum = total_reviews = 0
+    for chunk in parser.iter_products(html_content, chunk_size=STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        # 누적 지표는 새로 들어온 묶음만으로 갱신
+        prices = chunk["price"][chunk["price"] > 0]
+        total_count += len(chunk)
+        price_count += len(prices)
+        price_sum += prices.sum()
+        total_reviews += chunk["review_count"].sum()
+        rocket_count += chunk["is_rocket"].sum()
+
+        report_progress(f"🔍 상품 데이터 추출 중... ({total_count}개)")
+        with summary_placeholder.container():
+            display_summary_metrics(
+                total_count,
+                price_sum / price_count if price_count else 0,
+                total_reviews,
+                rocket_count / total_count * 100,
+            )
+        preview_prices = pd.concat([c["price"] for c in chunks])
+        fig = px.histogram(
+            x=preview_prices[preview_prices > 0],
+            nbins=30,
+            title=f"가격 분포 (파싱 중: {total_count}개)",
+            labels={"x": "가격 (원)"},
+        )
+        fig.update_layout(height=300, yaxis_title="상품 수")
+        preview_placeholder.plotly_chart(fig, use_container_width=True)
+
+    # 최종 대시보드가 같은 지표를 다시 그리므로 미리보기는 제거
+    summary_placeholder.empty()
+    preview_placeholder.empty()
+    if not chunks:
+        return pd.DataFrame()
+    products_df = pd.concat(chunks, ignore_index=True)
+    parse_cache.put("search", digest, products_df)
+    return products_df
+
+
+def parse_coupang_search_pages(html_contents, backend="lxml-native"):
+    """여러 검색 결과 페이지 HTML을 병렬 파싱 후 병합 (페이지별 디스크 캐시 적용)"""
+    return parse_search_pages(
+        list(html_contents), backend=backend, cache_dir=get_parse_cache().cache_dir
+    )
+
+
+def parse_coupang_search_dir(search_dir, backend="lxml-native"):
+    """폴더 안의 검색 결과 HTML 파일을 파일명 순으로 병렬 파싱 후 병합"""
+    paths = sorted(
+        os.path.join(search_dir, name)
+        for name in os.listdir(search_dir)
+        if name.lower().endswith((".html", ".htm"))
+    )
+    return parse_search_files(
+        paths, backend=backend, cache_dir=get_parse_cache().cache_dir
+    )
+
 
+def parse_product_detail(html_contents):
+    """상품 상세/리뷰 페이지 HTML 파싱 (리뷰 DataFrame은 디스크 캐시 적용)
 
-@st.cache_data
-def parse_product_detail(html_content):
-    """상품 상세 페이지 HTML 파싱 (캐시 적용)"""
-    if not html_content:
+    여러 페이지가 주어지면 병렬 파싱 후 (내용, 평점) 기준으로 중복 제거합니다.
+    """
+    html_contents = [html for html in html_contents if html]
+    if not html_contents:
         return None
-    parser = ProductDetailParser()
-    return parser.parse_product_detail(html_content)
+    if len(html_contents) > 1:
+        reviews_df = parse_review_pages(
+            html_contents, cache_dir=get_parse_cache().cache_dir
+        )
+        return {"reviews": reviews_df}
+
+    html_content = html_contents[0]
+    # scoped: 리뷰 article 서브트리만 파싱
+    parser = ProductDetailParser(scoped=True)
+    reviews_df = get_parse_cache().get_or_parse(
+        "detail",
+        html_content,
+        lambda html: parser.parse_product_detail(html)["reviews"],
+    )
+    return {"reviews": reviews_df}
 
 
 # === 4행 2열 그리드용 분석 함수들 ===
+# 그리드 셀은 독립 fragment(st.fragment, Streamlit 1.37+)로 그려 셀 안의 상호작용은
+# 그 셀만 다시 실행
 
 
+@st.fragment
 def display_price_analysis_grid(price_analyzer):
     """1행 1열: 가격 분석"""
     st.markdown("#### 💰 가격 분석")
 
     # 새로운 상품별 가격 막대 차트 표시
-    price_chart = price_analyzer.create_product_price_bar_chart()
-    st.plotly_chart(price_chart, use_container_width=True)
+    plot_cached(
+        price_analyzer.create_product_price_bar_chart,
+        "price_bars",
+        price_analyzer.table.fingerprint,
+    )
 
 
+@st.fragment
 def display_review_count_analysis(review_analyzer):
     """1행 2열: 리뷰수 분석"""
     st.markdown("#### ⭐ 리뷰수 분석")
 
     # 새로운 상품별 리뷰 수 막대 차트 표시
-    review_chart = review_analyzer.create_product_review_bar_chart()
-    st.plotly_chart(review_chart, use_container_width=True)
+    plot_cached(
+        review_analyzer.create_product_review_bar_chart,
+        "review_bars",
+        review_analyzer.table.fingerprint,
+    )
 
 
-def display_top10_sales_placeholder():
-    """2행 1열: 상위10 판매량 (플레이스홀더)"""
+@st.fragment
+def display_top10_sales(sales_estimator):
+    """2행 1열: 상위10 판매량 (리뷰 수 기반 추정)"""
     st.markdown("#### 📈 상위10 판매량")
-    st.info("🚧 구현 예정: 과거 1달 판매량 트렌드")
-
-    # 샘플 차트
-    sample_data = pd.DataFrame(
-        {
-            "date": pd.date_range("2024-09-01", periods=30),
-            "sales": np.random.randint(100, 500, 30),
-        }
+    top_n_df = sales_estimator.get_top_n(10)
+    if top_n_df.empty:
+        st.warning("판매량을 추정할 상품 데이터가 없습니다.")
+        return
+
+    plot_cached(
+        lambda: sales_estimator.create_top_sales_chart(top_n_df),
+        "top_sales",
+        frame_fingerprint(top_n_df),
+    )
+    snapshot_count = (top_n_df["estimate_method"] == "snapshot").sum()
+    st.caption(
+        f"PRD 공식 기준 추정치 (전환율 2%, 출시 후 {sales_estimator.days_since_launch}일 가정, "
+        f"카테고리 계수 {sales_estimator.category_factor}). "
+        f"스냅샷 리뷰 증가량 기반: {snapshot_count}개"
     )
-    fig = px.line(sample_data, x="date", y="sales", title="샘플: 일별 판매량 트렌드")
-    fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
 def display_view_count_analysis():
     """2행 2열: 조회수 분석 (플레이스홀더)"""
     st.markdown("#### 👀 조회수 분석")
     st.info("🚧 구현 예정: 상품별 조회수 분석")
 
     # 샘플 차트
-    sample_products = ["상품A", "상품B", "상품C", "상품D", "상품E"]
-    sample_views = [1500, 1200, 980, 750, 600]
-
-    fig = px.bar(
-        x=sample_views,
-        y=sample_products,
-        orientation="h",
-        title="샘플: 조회수 상위 5개 상품",
-    )
-    fig.update_layout(height=300, yaxis={"categoryorder": "total ascending"})
-    st.plotly_chart(fig, use_container_width=True)
+    def build():
+        import plotly.express as px
 
+        sample_products = ["상품A", "상품B", "상품C", "상품D", "상품E"]
+        sample_views = [1500, 1200, 980, 750, 600]
+
+        fig = px.bar(
+            x=sample_views,
+            y=sample_products,
+            orientation="h",
+            title="샘플: 조회수 상위 5개 상품",
+        )
+        fig.update_layout(height=300, yaxis={"categoryorder": "total ascending"})
+        return fig
 
+    plot_cached(build, "view_count_sample")
+
+
+@st.fragment
 def display_sales_type_analysis(delivery_analyzer):
     """3행 1열: 판매형태 분석"""
     st.markdown("#### 🚀 판매형태 분석")
@@ -181,97 +362,205 @@ def display_sales_type_analysis(delivery_analyzer):
     )
 
     # 스택 막대 그래프 표시
-    delivery_chart = delivery_analyzer.create_delivery_pie_chart()
-    if delivery_chart:
-        st.plotly_chart(delivery_chart, use_container_width=True)
-    else:
+    delivery_chart = plot_cached(
+        delivery_analyzer.create_delivery_pie_chart,
+        "delivery_stack",
+        delivery_analyzer.table.fingerprint,
+    )
+    if delivery_chart is None:
         st.info("배송 형태 데이터가 없습니다.")
 
 
+@st.fragment
 def display_ads_analysis_placeholder():
     """3행 2열: 광고 분석 (플레이스홀더)"""
     st.markdown("#### 💸 광고 분석")
     st.info("🚧 구현 예정: 광고 단가 및 효율 분석")
 
     # 샘플 차트
-    sample_keywords = ["키워드A", "키워드B", "키워드C", "키워드D"]
-    sample_costs = [1200, 980, 850, 600]
+    def build():
+        import plotly.express as px
+
+        sample_keywords = ["키워드A", "키워드B", "키워드C", "키워드D"]
+        sample_costs = [1200, 980, 850, 600]
+
+        fig = px.bar(
+            x=sample_keywords, y=sample_costs, title="샘플: 키워드별 광고 단가"
+        )
+        fig.update_layout(height=300)
+        return fig
 
-    fig = px.bar(x=sample_keywords, y=sample_costs, title="샘플: 키워드별 광고 단가")
-    fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
+    plot_cached(build, "ads_sample")
 
 
+@st.fragment
 def display_search_trends_placeholder():
     """4행 1열: 검색 트렌드 (플레이스홀더)"""
     st.markdown("#### 🔍 검색 트렌드")
     st.info("🚧 구현 예정: 과거 3년 검색 트렌드")
 
-    # 샘플 차트
-    sample_data = pd.DataFrame(
-        {
-            "month": pd.date_range("2022-01", periods=36, freq="M"),
-            "search_volume": np.random.randint(50, 100, 36),
-        }
-    )
-    fig = px.line(
-        sample_data, x="month", y="search_volume", title="샘플: 월별 검색량 추이"
-    )
-    fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
+    # 샘플 차트 (한 번 만든 난수 샘플을 캐시해 다시 실행해도 같은 그림)
+    def build():
+        import plotly.express as px
 
+        sample_data = pd.DataFrame(
+            {
+                "month": pd.date_range("2022-01", periods=36, freq="M"),
+                "search_volume": np.random.randint(50, 100, 36),
+            }
+        )
+        fig = px.line(
+            sample_data, x="month", y="search_volume", title="샘플: 월별 검색량 추이"
+        )
+        fig.update_layout(height=300)
+        return fig
 
-def display_review_analysis_placeholder():
-    """4행 2열: 리뷰 분석 (플레이스홀더)"""
-    st.markdown("#### 📝 리뷰 분석")
-    st.info("🚧 구현 예정: 감정 분석 및 키워드 추출")
+    plot_cached(build, "search_trends_sample")
 
-    # 샘플 감정 분석 결과
-    sentiment_data = pd.DataFrame(
-        {"감정": ["긍정", "중립", "부정"], "비율": [65, 25, 10]}
-    )
 
-    fig = px.pie(
-        sentiment_data, values="비율", names="감정", title="샘플: 리뷰 감정 분포"
+@st.fragment
+def display_review_analysis(review_text_analyzer, analysis):
+    """4행 2열: 리뷰 분석 (감성 분포 + 주요 키워드)
+
+    analysis는 분석 시 한 번 계산해 세션에 보관한 review_text_analyzer.analyze() 결과
+    """
+    st.markdown("#### 📝 리뷰 분석")
+    if analysis is None:
+        st.info("분석할 리뷰가 없습니다. 상품 상세/리뷰 페이지를 확인하세요.")
+        return
+
+    distribution = analysis["sentiment_distribution"]
+    keywords = analysis["keywords"]
+    plot_cached(
+        lambda: review_text_analyzer.create_sentiment_pie_chart(distribution),
+        "sentiment_pie",
+        frame_fingerprint(distribution),
+    )
+    plot_cached(
+        lambda: review_text_analyzer.create_keyword_bar_chart(keywords),
+        "review_keywords",
+        frame_fingerprint(keywords),
+    )
+    st.caption(
+        f"리뷰 {analysis['review_count']:,}개 / 토크나이저: {analysis['tokenizer']}"
     )
-    fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
 
 
-def display_analysis_results(
-    products_df, price_analyzer, review_analyzer, delivery_analyzer
-):  # review_analyzer, delivery_analyzer 추가
-    """분석 결과 대시보드 표시"""
+def display_snapshot_diff(snapshot_diff):
+    """이전 스냅샷 대비 변화 (신규/이탈 상품, 가격 변동, 리뷰 증가)"""
+    with st.expander("🔁 이전 스냅샷 대비 변화", expanded=True):
+        summary = snapshot_diff.summary()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("신규 상품", f"{summary['appeared']:,}")
+        col2.metric("이탈 상품", f"{summary['disappeared']:,}")
+        col3.metric("가격 변동 상품", f"{summary['price_changed']:,}")
+        col4.metric("리뷰 증가", f"{summary['review_gain_total']:,}")
+
+        price_changes = snapshot_diff.price_changes()
+        if not price_changes.empty:
+            st.markdown("**가격 변동 (변동률 큰 순)**")
+            st.dataframe(price_changes.head(20), use_container_width=True)
+        review_gains = snapshot_diff.review_gains()
+        if not review_gains.empty:
+            st.markdown("**리뷰 증가 (증가량 큰 순)**")
+            st.dataframe(review_gains.head(20), use_container_width=True)
+
+
+def display_parser_metrics():
+    """파서 핫패스 메트릭 패널 (접이식)"""
+    with st.expander("🛠️ 파서 메트릭", expanded=False):
+        cache_stats = get_parse_cache().stats()
+        st.caption(
+            f"파싱 캐시: {cache_stats['entries']}개 / "
+            f"{cache_stats['bytes'] / 1024**2:,.1f}MB "
+            f"(이 프로세스 hit {cache_stats['hits']} / miss {cache_stats['misses']})"
+        )
+        figure_stats = get_figure_cache().stats()
+        st.caption(
+            f"그림 캐시: {figure_stats['entries']}개 / "
+            f"데이터 점 {figure_stats['points']:,}개 "
+            f"(hit {figure_stats['hits']} / miss {figure_stats['misses']})"
+        )
+        snapshot = PARSER_METRICS.snapshot()
+        if snapshot["items"] == 0:
+            st.info("아직 수집된 파서 메트릭이 없습니다.")
+            return
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("파싱한 상품 수", f"{snapshot['items']:,}")
+        col2.metric("초당 상품 수", f"{snapshot['items_per_sec']:,.0f}")
+        col3.metric("파싱 횟수", snapshot["parses"])
+        col4.metric("파싱 오류", snapshot["errors"])
+        if snapshot["last_parse"]:
+            last = snapshot["last_parse"]
+            st.caption(
+                f"마지막 파싱: {last['backend']} / {last['items']}개 / "
+                f"{last['seconds'] * 1000:,.1f}ms ({last['items_per_sec']:,.0f}개/초)"
+            )
 
-    st.success("🎉 분석이 완료되었습니다!")
+        st.markdown("**필드별 추출 시간**")
+        st.dataframe(PARSER_METRICS.field_timing_stats(), use_container_width=True)
+        st.markdown("**선택자 티어별 hit/miss**")
+        st.dataframe(PARSER_METRICS.tier_stats(), use_container_width=True)
 
-    # 요약 통계
+
+def display_summary_metrics(total_count, avg_price, total_reviews, rocket_ratio):
+    """요약 통계 4개 지표 표시 (rocket_ratio가 None이면 N/A)"""
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("총 상품 수", len(products_df))
+        st.metric("총 상품 수", total_count)
 
     with col2:
-        # price_analyzer에서 계산된 평균 가격 사용
-        avg_price = price_analyzer.analyze_prices()["basic_stats"]["mean"]
         st.metric("평균 가격", f"₩{avg_price:,.0f}")
 
     with col3:
-        total_reviews = (
-            products_df["review_count"].sum()
-            if "review_count" in products_df.columns
-            else 0
-        )
         st.metric("총 리뷰 수", f"{total_reviews:,}")
 
     with col4:
-        # is_rocket 컬럼이 있는지 확인
-        if "is_rocket" in products_df.columns and not products_df.empty:
-            rocket_ratio = (products_df["is_rocket"].sum() / len(products_df)) * 100
+        if rocket_ratio is not None:
             st.metric("로켓배송 비율", f"{rocket_ratio:.1f}%")
         else:
             st.metric("로켓배송 비율", "N/A")
 
+
+def display_analysis_results(result, sales_options=None):
+    """분석 결과 대시보드 표시
+
+    result는 analyze_data가 세션에 보관한 분석 결과이며, 다시 실행될 때도
+    파싱/분석 없이 이 결과로 그립니다. sales_options(출시 후 경과일, 카테고리
+    계수)가 바뀌면 판매량 추정 셀만 새로 계산됩니다.
+    """
+    products_df = result["product_table"].frame
+    price_analyzer = result["price_analyzer"]
+    review_analyzer = result["review_analyzer"]
+    delivery_analyzer = result["delivery_analyzer"]
+    days_since_launch, category_factor = sales_options or (
+        DEFAULT_DAYS_SINCE_LAUNCH,
+        1.0,
+    )
+    sales_estimator = SalesEstimator(
+        products_df,
+        history_df=result["history_df"],
+        days_since_launch=days_since_launch,
+        category_factor=category_factor,
+        as_of=result["captured_at"],
+    )
+
+    st.success("🎉 분석이 완료되었습니다!")
+
+    # 요약 통계
+    # price_analyzer에서 계산된 평균 가격 사용
+    avg_price = price_analyzer.analyze_prices()["basic_stats"]["mean"]
+    total_reviews = products_df["review_count"].sum()
+    if not products_df.empty:
+        rocket_ratio = (products_df["is_rocket"].sum() / len(products_df)) * 100
+    else:
+        rocket_ratio = None
+    display_summary_metrics(len(products_df), avg_price, total_reviews, rocket_ratio)
+    if result["snapshot_diff"] is not None:
+        display_snapshot_diff(result["snapshot_diff"])
+
     # 4행 2열 그리드 대시보드
     st.markdown("---")
     st.markdown("## 📊 상세 분석 대시보드")
@@ -288,7 +577,7 @@ def display_analysis_results(
     # 2행: 상위10 판매량 | 조회수 분석
     col2_1, col2_2 = st.columns(2)
     with col2_1:
-        display_top10_sales_placeholder()
+        display_top10_sales(sales_estimator)
     with col2_2:
         display_view_count_analysis()
 
@@ -308,7 +597,9 @@ def display_analysis_results(
     with col4_1:
         display_search_trends_placeholder()
     with col4_2:
-        display_review_analysis_placeholder()
+        display_review_analysis(
+            result["review_text_analyzer"], result["review_analysis"]
+        )
 
     st.markdown("---")
 
@@ -316,56 +607,206 @@ def display_analysis_results(
     st.markdown("## 📋 상품 목록")
     st.dataframe(products_df, use_container_width=True)
 
+    display_parser_metrics()
+
+
+def analysis_signature(search_html, product_html, search_dir, backend, keyword):
+    """분석 입력 식별값 (업로드 파일 이름/크기, 폴더, 백엔드, 키워드)
 
-def analyze_data(search_html, product_html, wings_html, ads_html, trends_html):
-    """메인 분석 실행 함수"""
+    세션에 보관된 결과가 지금 입력으로 만든 것인지 확인하는 데 사용합니다.
+    """
+
+    def files(uploaded_files):
+        return tuple((f.name, f.size) for f in uploaded_files or [])
+
+    return (files(search_html), files(product_html), search_dir, backend, keyword)
+
+
+def analyze_data(
+    search_html,
+    product_html,
+    wings_html,
+    ads_html,
+    trends_html,
+    backend="html.parser",
+    debug_options=None,
+    search_dir=None,
+    sales_options=None,
+    keyword=None,
+    save_snapshot=True,
+    signature=None,
+):
+    """메인 분석 실행 함수
+
+    search_html/product_html은 업로드된 파일 목록(페이지 순서)이며,
+    search_dir가 주어지면 해당 폴더의 HTML 파일을 대신 사용합니다.
+    sales_options: (출시 후 경과일, 카테고리 계수) 튜플 (판매량 추정)
+    keyword가 없으면 검색 결과 HTML에서 감지하며, 키워드별 스냅샷 이력은
+    판매량 추정에 사용하고 save_snapshot이면 이번 결과를 새 스냅샷으로 저장합니다.
+    파싱/분석 단계는 DagExecutor로 선행 관계에 따라 동시에 실행하고 진행 표시줄은
+    끝난 단계 비율로 갱신합니다. 분석 결과(분석기, 리뷰 분석, 스냅샷 비교)는
+    signature와 함께 세션에 보관되어 이후 다시 실행될 때는 파싱/분석 없이
+    대시보드만 그립니다.
+    """
 
     progress_bar = st.progress(0, text="분석 준비 중...")
+    # 단계가 끝날 때마다 실제 완료 비율로 갱신 (마지막 10%는 결과 시각화)
+    progress = {"value": 0}
+
+    def report_progress(text):
+        progress_bar.progress(progress["value"], text=text)
+
+    def on_stage_done(stage, fraction):
+        progress["value"] = int(fraction * 90)
+        report_progress(f"✅ {stage.label} 완료")
 
     try:
-        # 1단계: HTML 파싱
-        progress_bar.progress(20, text="📄 HTML 파일 파싱 중...")
-        search_content = read_html_file(search_html)
-        product_content = read_html_file(product_html)
-
-        # 2단계: 데이터 추출
-        progress_bar.progress(40, text="🔍 상품 데이터 추출 중...")
-        products_df = parse_coupang_search(search_content)
-        product_details = parse_product_detail(product_content)
-
-        # --- 디버깅 로그 추가 ---
-        if (
-            not products_df.empty
-            and "name" in products_df.columns
-            and "price" in products_df.columns
-        ):
-            logging.info(
-                f"PriceAnalyzer로 전달될 DataFrame:\n{products_df[['name', 'price']].to_string()}"
-            )
-        else:
-            logging.warning(
-                "PriceAnalyzer로 전달될 DataFrame이 비어있거나 필수 컬럼이 없습니다."
+        search_contents = [read_html_file(f) for f in search_html or []]
+        product_contents = [read_html_file(f) for f in product_html or []]
+        keyword = keyword or extract_search_keyword(
+            search_contents[0] if search_contents else None
+        )
+        captured_at = pd.Timestamp.now()
+        # 단일 페이지는 파싱되는 대로 요약 지표와 가격 분포를 갱신 (화면을 그리므로
+        # 풀 대신 이 스레드에서 실행)
+        streaming = not search_dir and len(search_contents) <= 1
+
+        def parse_search():
+            # 여러 페이지는 병렬 파싱 후 listing_id 기준 중복 제거
+            if search_dir:
+                return parse_coupang_search_dir(search_dir, backend)
+            if len(search_contents) > 1:
+                return parse_coupang_search_pages(tuple(search_contents), backend)
+            return stream_coupang_search(
+                search_contents[0], report_progress, backend, debug_options
             )
-        # --------------------
 
-        # 3단계: 데이터 분석
-        progress_bar.progress(60, text="📊 데이터 분석 중...")
-        price_analyzer = PriceAnalyzer(products_df)
-        review_analyzer = ReviewAnalyzer(products_df)  # ReviewAnalyzer 초기화
-        delivery_analyzer = DeliveryAnalyzer(products_df)  # DeliveryAnalyzer 초기화
+        def build_table(products_df):
+            # --- 디버깅 로그 추가 ---
+            if (
+                not products_df.empty
+                and "name" in products_df.columns
+                and "price" in products_df.columns
+            ):
+                logging.info(
+                    f"PriceAnalyzer로 전달될 DataFrame:\n{products_df[['name', 'price']].to_string()}"
+                )
+            else:
+                logging.warning(
+                    "PriceAnalyzer로 전달될 DataFrame이 비어있거나 필수 컬럼이 없습니다."
+                )
+            # --------------------
+            # 분석기들은 정리된 상품 테이블 하나를 복사 없이 공유
+            return ProductTable(products_df)
+
+        def analyze_prices(product_table):
+            price_analyzer = PriceAnalyzer(product_table)
+            price_analyzer.analyze_prices()
+            return price_analyzer
+
+        def analyze_reviews(product_table):
+            review_analyzer = ReviewAnalyzer(product_table)
+            review_analyzer.analyze_reviews()
+            return review_analyzer
+
+        def analyze_review_texts(product_details):
+            review_text_analyzer = ReviewTextAnalyzer(
+                product_details["reviews"] if product_details else None
+            )
+            # 리뷰 키워드 추출은 비싸므로 분석 시 한 번만 계산해 보관
+            review_analysis = (
+                review_text_analyzer.analyze(top_n=15)
+                if len(review_text_analyzer.contents)
+                else None
+            )
+            return review_text_analyzer, review_analysis
+
+        def compare_snapshots(products_df):
+            snapshot_store = get_snapshot_store()
+            history_df = snapshot_store.history_frame(keyword) if keyword else None
+            # 같은 키워드의 직전 스냅샷과 비교 (저장 전에 조회)
+            previous_df = snapshot_store.latest(keyword) if keyword else None
+            snapshot_diff = (
+                SnapshotDiff(previous_df, products_df)
+                if previous_df is not None and not products_df.empty
+                else None
+            )
+            if keyword and save_snapshot and not products_df.empty:
+                snapshot_store.append(keyword, products_df, captured_at=captured_at)
+            return history_df, snapshot_diff
+
+        # 검색/상세 파싱, 세 분석기, 리뷰 텍스트 분석, 스냅샷 비교는 서로 독립이면
+        # 동시에 실행 (풀 스레드에도 Streamlit 실행 문맥을 연결해 캐시 사용 가능)
+        ctx = get_script_run_ctx()
+        pipeline = DagExecutor(
+            initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+        )
+        pipeline.add(
+            "products_df", parse_search, label="검색 결과 파싱", weight=3, inline=streaming
+        )
+        pipeline.add(
+            "product_details",
+            lambda: parse_product_detail(product_contents),
+            label="상세/리뷰 페이지 파싱",
+            weight=2,
+        )
+        pipeline.add(
+            "product_table", build_table, deps=("products_df",), label="상품 테이블"
+        )
+        pipeline.add(
+            "price_analyzer", analyze_prices, deps=("product_table",), label="가격 분석"
+        )
+        pipeline.add(
+            "review_analyzer",
+            analyze_reviews,
+            deps=("product_table",),
+            label="리뷰수 분석",
+        )
+        pipeline.add(
+            "delivery_analyzer",
+            lambda product_table: DeliveryAnalyzer(product_table),
+            deps=("product_table",),
+            label="판매형태 분석",
+        )
+        pipeline.add(
+            "review_texts",
+            analyze_review_texts,
+            deps=("product_details",),
+            label="리뷰 텍스트 분석",
+            weight=2,
+        )
+        pipeline.add(
+            "snapshots",
+            compare_snapshots,
+            deps=("products_df",),
+            label="스냅샷 비교/저장",
+        )
+        stages = pipeline.run(on_progress=on_stage_done)
+        review_text_analyzer, review_analysis = stages["review_texts"]
+        history_df, snapshot_diff = stages["snapshots"]
+
+        # 세션 상태에 결과 저장 (다른 위젯 조작으로 다시 실행돼도 재사용)
+        result = {
+            "signature": signature,
+            "product_table": stages["product_table"],
+            "price_analyzer": stages["price_analyzer"],
+            "review_analyzer": stages["review_analyzer"],
+            "delivery_analyzer": stages["delivery_analyzer"],
+            "review_text_analyzer": review_text_analyzer,
+            "review_analysis": review_analysis,
+            "history_df": history_df,
+            "captured_at": captured_at,
+            "snapshot_diff": snapshot_diff,
+        }
+        st.session_state[ANALYSIS_STATE_KEY] = result
+        st.session_state["analysis_complete"] = True
 
         # 4단계: 결과 시각화
-        progress_bar.progress(80, text="📈 결과 시각화 중...")
-        display_analysis_results(
-            products_df, price_analyzer, review_analyzer, delivery_analyzer
-        )  # review_analyzer, delivery_analyzer 전달
+        report_progress("📈 결과 시각화 중...")
+        display_analysis_results(result, sales_options)
 
         progress_bar.progress(100, text="✅ 분석 완료!")
 
-        # 세션 상태에 결과 저장
-        st.session_state["analysis_complete"] = True
-        st.session_state["products_df"] = products_df
-
     except Exception as e:
         st.error(f"❌ 분석 중 오류가 발생했습니다: {str(e)}")
         logging.error(f"분석 중 오류: {e}", exc_info=True)
@@ -377,11 +818,26 @@ with st.sidebar:
     st.header("📁 파일 업로드")
 
     search_html = st.file_uploader(
-        "쿠팡 검색 결과 HTML (필수)", type=["html", "htm"], key="search_html"
+        "쿠팡 검색 결과 HTML (필수, 여러 페이지 선택 가능)",
+        type=["html", "htm"],
+        key="search_html",
+        accept_multiple_files=True,
     )
 
+    search_dir = st.text_input(
+        "또는 검색 결과 HTML 폴더 경로",
+        key="search_dir",
+        help="폴더 안의 .html 파일을 파일명 순서(페이지 순서)로 모두 파싱합니다.",
+    ).strip()
+    if search_dir and not os.path.isdir(search_dir):
+        st.warning("폴더를 찾을 수 없습니다.")
+        search_dir = ""
+
     product_html = st.file_uploader(
-        "상품 상세 페이지 HTML (필수)", type=["html", "htm"], key="product_html"
+        "상품 상세/리뷰 페이지 HTML (필수, 여러 페이지 선택 가능)",
+        type=["html", "htm"],
+        key="product_html",
+        accept_multiple_files=True,
     )
 
     wings_html = st.file_uploader(
@@ -396,9 +852,79 @@ with st.sidebar:
         "네이버 트렌드 HTML (선택)", type=["html", "htm"], key="trends_html"
     )
 
+    st.header("⚙️ 파싱 설정")
+    parser_backend = st.selectbox(
+        "파싱 백엔드",
+        PARSER_BACKENDS,
+        index=PARSER_BACKENDS.index("lxml-native"),
+        help="lxml-native는 BeautifulSoup 없이 lxml로 직접 파싱하여 가장 빠릅니다.",
+    )
+
+    with st.expander("🐞 디버그 캡처", expanded=False):
+        debug_enabled = st.checkbox(
+            "상품 HTML 캡처 (logs/product_items.html)", value=False
+        )
+        debug_first_n = st.number_input(
+            "최대 캡처 상품 수 (0 = 제한 없음)", min_value=0, value=20, step=10
+        )
+        debug_only_fallback = st.checkbox(
+            "대체 경로/추출 실패 상품만 캡처", value=True
+        )
+    debug_options = (
+        (int(debug_first_n) or None, debug_only_fallback) if debug_enabled else None
+    )
+
+    st.header("🗂️ 스냅샷")
+    search_keyword = st.text_input(
+        "검색 키워드",
+        key="search_keyword",
+        help="비워두면 검색 결과 HTML의 검색창 값에서 자동으로 감지합니다.",
+    ).strip()
+    save_snapshot = st.checkbox(
+        "분석 결과를 스냅샷으로 저장 (data/snapshots)", value=True
+    )
+
+    with st.expander("📈 판매량 추정", expanded=False):
+        sales_days = st.number_input(
+            "출시 후 경과일 (가정)",
+            min_value=1,
+            value=DEFAULT_DAYS_SINCE_LAUNCH,
+            step=30,
+            help="검색 결과에는 출시일이 없어 모든 상품에 같은 경과일을 가정합니다.",
+        )
+        sales_factor = st.number_input(
+            "카테고리 계수", min_value=0.1, value=1.0, step=0.1
+        )
+
 # 분석 시작 버튼
-if search_html and product_html:
+sales_options = (int(sales_days), float(sales_factor))
+signature = analysis_signature(
+    search_html, product_html, search_dir, parser_backend, search_keyword or None
+)
+previous_result = st.session_state.get(ANALYSIS_STATE_KEY)
+if (search_html or search_dir) and product_html:
     if st.button("🚀 분석 시작", type="primary"):
-        analyze_data(search_html, product_html, wings_html, ads_html, trends_html)
+        analyze_data(
+            search_html,
+            product_html,
+            wings_html,
+            ads_html,
+            trends_html,
+            backend=parser_backend,
+            debug_options=debug_options,
+            search_dir=search_dir,
+            sales_options=sales_options,
+            keyword=search_keyword or None,
+            save_snapshot=save_snapshot,
+            signature=signature,
+        )
+    elif previous_result is not None:
+        # 다른 위젯 조작으로 다시 실행된 경우: 파싱/분석 없이 보관된 결과로 표시
+        if previous_result["signature"] != signature:
+            st.info(
+                "입력이 바뀌었습니다. 아래는 이전 분석 결과이며, "
+                "🚀 분석 시작을 누르면 새로 분석합니다."
+            )
+        display_analysis_results(previous_result, sales_options)
 else:
     st.info("🔺 필수 파일(검색 결과 + 상품 상세)을 업로드해주세요")
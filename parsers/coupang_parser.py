@@ -1,216 +1,225 @@
-from bs4 import BeautifulSoup
+from functools import lru_cache
 import pandas as pd
+from parsers.extraction_plan import ProductExtractionPlan
+from parsers.product_columns import (
+    PRODUCT_COLUMNS,
+    ProductColumnBuffer,
+    empty_products_frame,
+)
+from parsers.parser_metrics import PARSER_METRICS
+from time import perf_counter
+import html
 import re
 import logging
-import os
+
+# 사용 가능한 파싱 백엔드
+# - "html.parser": 순수 파이썬 파서 (BeautifulSoup 기본)
+# - "lxml": BeautifulSoup + lxml 트리 빌더
+# - "lxml-native": BeautifulSoup 없이 lxml XPath로 직접 추출 (가장 빠름)
+PARSER_BACKENDS = ("html.parser", "lxml", "lxml-native")
+
+# scoped 모드에서 트리로 만들 상품 li 노드 (나머지 스크립트/내비게이션은 건너뜀)
+# (파싱 시점에는 class 값이 분리되지 않은 문자열일 수 있어 토큰 정규식으로 매칭)
+PRODUCT_ITEM_CLASS_PATTERN = re.compile(r"(^|\s)ProductUnit_productUnit__Qd6sv(\s|$)")
+
+
+@lru_cache(maxsize=None)
+def product_item_strainer():
+    """상품 li만 트리로 만드는 SoupStrainer (bs4는 BeautifulSoup 백엔드에서만 로드)"""
+    from bs4 import SoupStrainer
+
+    return SoupStrainer("li", class_=PRODUCT_ITEM_CLASS_PATTERN)
+
+# 검색창 input에 남아 있는 검색 키워드 (<input name="q" value="...">)
+_SEARCH_KEYWORD = re.compile(r'name="q"\s+value="([^"]*)"')
+
+
+def extract_search_keyword(html_content):
+    """검색 결과 HTML에서 검색 키워드 추출 (트리를 만들지 않고 정규식으로 탐색)"""
+    if not html_content:
+        return None
+    match = _SEARCH_KEYWORD.search(html_content)
+    if not match:
+        return None
+    return html.unescape(match.group(1)).strip() or None
 
 
 class CoupangParser:
+    def __init__(
+        self,
+        backend="html.parser",
+        scoped=False,
+        debug_capture=None,
+        metrics=PARSER_METRICS,
+    ):
+        """CoupangParser 초기화
+
+        Args:
+            backend (str): 파싱 백엔드 ("html.parser", "lxml", "lxml-native")
+            scoped (bool): True면 상품 li 서브트리만 트리로 생성 (메모리/시간 절감)
+            debug_capture (DebugCapture): 상품 HTML 디버그 캡처 (None이면 비활성)
+            metrics (ParserMetrics): 핫패스 메트릭 수집기 (기본값: 프로세스 전역,
+                None이면 수집 안 함)
+        """
+        if backend not in PARSER_BACKENDS:
+            raise ValueError(
+                f"지원하지 않는 파싱 백엔드입니다: {backend} (가능한 값: {PARSER_BACKENDS})"
+            )
+        self.backend = backend
+        self.scoped = scoped
+        self.extraction_plan = ProductExtractionPlan()
+        self.debug_capture = debug_capture
+        self.metrics = metrics
+
     def parse_search_html(self, html_content):
         """쿠팡 검색 결과 HTML에서 상품 정보 추출"""
         if not html_content:
             logging.warning("HTML 컨텐츠가 비어있어 파싱을 중단합니다.")
             return pd.DataFrame()
 
-        soup = BeautifulSoup(html_content, "html.parser")  # lxml -> html.parser로 변경
-        products = []
+        # 상품 행을 dict 없이 컬럼 버퍼에 바로 누적
+        buffer = ProductColumnBuffer()
+        for row in self._iter_products(html_content):
+            buffer.append(row)
+        return self._build_products_df(buffer)
+
+    def iter_products(self, html_content, chunk_size=None):
+        """상품을 파싱되는 대로 반환하는 제너레이터
+
+        Args:
+            html_content (str): 검색 결과 HTML (lxml-native 백엔드는 파일 객체도 가능)
+            chunk_size (int): None이면 상품 dict를 하나씩, 정수면 최대 chunk_size개씩
+                묶은 압축 dtype DataFrame을 반환
+
+        lxml-native + scoped 조합에서는 문서를 조각 단위로 읽으면서 닫힌 상품 li만
+        처리하므로, 페이지가 아무리 커도 트리 메모리가 상품 하나 크기로 제한됩니다.
+        """
+        if not html_content:
+            logging.warning("HTML 컨텐츠가 비어있어 파싱을 중단합니다.")
+            return
+
+        rows = self._iter_products(html_content)
+        if chunk_size is None:
+            for row in rows:
+                yield dict(zip(PRODUCT_COLUMNS, row))
+            return
+
+        chunk = ProductColumnBuffer(capacity=chunk_size)
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk.to_frame()
+                chunk = ProductColumnBuffer(capacity=chunk_size)
+        if len(chunk):
+            yield chunk.to_frame()
+
+    def _iter_products(self, html_content):
+        """백엔드별로 상품 li를 찾아 추출한 상품 행 튜플을 차례로 반환"""
+        # 메트릭의 파싱 시간은 소비자가 yield 사이에 쓴 시간을 제외하고 측정
+        resumed = perf_counter()
+        busy = 0.0
+        count = 0
+        if self.backend == "lxml-native":
+            product_items, extract, markup = self._find_items_lxml(html_content)
+        else:
+            product_items = self._find_items_bs4(html_content)
+            extract, markup = self.extraction_plan.extract_bs4, str
+
+        for product in self._extract_products(product_items, extract, markup):
+            count += 1
+            busy += perf_counter() - resumed
+            yield product
+            resumed = perf_counter()
+
+        busy += perf_counter() - resumed
+        if self.metrics is not None:
+            self.metrics.record_parse(self.backend, count, busy)
+
+    def _find_items_bs4(self, html_content):
+        """BeautifulSoup 백엔드: 상품 li 목록 반환"""
+        from bs4 import BeautifulSoup
+
+        if self.scoped:
+            soup = BeautifulSoup(
+                html_content, self.backend, parse_only=product_item_strainer()
+            )
+        else:
+            soup = BeautifulSoup(html_content, self.backend)
 
         # --- 디버깅 로그 수정 ---
         logging.info(f"BeautifulSoup 파싱 성공: HTML 구조 확인됨")
-        if soup.body:
-            logging.info(f"body 태그 발견: {soup.body.text[:100]}...")
-        else:
+        if self.scoped:
+            logging.info("scoped 모드: 상품 li 서브트리만 파싱")
+        elif not soup.body:
             logging.info("body 태그 없음 (SPA 또는 특수 구조)")
+        elif logging.getLogger().isEnabledFor(logging.DEBUG):
+            # body 전체 텍스트 생성은 비용이 커서 DEBUG 레벨에서만 기록
+            logging.debug(f"body 태그 발견: {soup.body.text[:100]}...")
         # --------------------
 
         # 상품 목록 파싱 (수정된 선택자)
         product_items = soup.find_all("li", class_="ProductUnit_productUnit__Qd6sv")
 
         logging.info(f"발견된 상품 수: {len(product_items)}")
+        return product_items
 
-        # HTML 구조는 logs/product_items.html 파일에서 확인 가능
-
-        # --- 디버깅 로그 강화: 모든 상품의 HTML 구조를 기록 ---
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        with open(
-            os.path.join(log_dir, "product_items.html"), "w", encoding="utf-8"
-        ) as f:
-            for i, item in enumerate(product_items):
-                f.write(f"<!-- 상품 번호: {i+1} -->\n")
-                f.write(item.prettify())
-                f.write("\n\n")
-        logging.info(
-            "모든 상품의 HTML 구조를 logs/product_items.html 파일에 저장했습니다."
-        )
-        # -----------------------------------------------
-
-        for item in product_items:
+    def _find_items_lxml(self, html_content):
+        """lxml-native 백엔드: BeautifulSoup 트리를 만들지 않고 lxml로 상품 li 탐색"""
+        from parsers.lxml_backend import LxmlProductExtractor
+
+        extractor = LxmlProductExtractor(self.extraction_plan)
+        if self.scoped:
+            # 상품 li가 닫힐 때마다 하나씩 받아 처리
+            product_items = extractor.iter_product_items(html_content)
+        else:
+            product_items = extractor.find_product_items(html_content)
+            logging.info(f"발견된 상품 수 (lxml-native): {len(product_items)}")
+        return product_items, extractor.extract_product, extractor.markup
+
+    def _extract_products(self, product_items, extract, markup):
+        """상품 li마다 필드를 추출하고 디버그 캡처/메트릭 기록 (제너레이터)"""
+        # HTML 구조는 debug_capture 사용 시 logs/product_items.html 파일에서 확인 가능
+        capture = self.debug_capture
+        metrics = self.metrics
+        if capture:
+            capture.begin()
+
+        for index, item in enumerate(product_items):
             try:
-                product = {
-                    "product_id": item.get("data-product-id"),
-                    "name": self._extract_name(item),
-                    "price": self._extract_price(item),
-                    "original_price": self._extract_original_price(item),
-                    "discount_rate": self._extract_discount_rate(item),
-                    "review_count": self._extract_review_count(item),
-                    "rating": self._extract_rating(item),
-                    "is_rocket": self._is_rocket_delivery(item),
-                    "delivery_type": self._extract_delivery_type(item),
-                    "seller": self._extract_seller(item),
-                    "image_url": self._extract_image_url(item),
-                    "product_url": self._extract_product_url(item),
-                }
-                products.append(product)
+                # 상품 서브트리를 한 번만 순회하며 모든 필드 추출
+                trace = {}
+                timings = {} if metrics is not None else None
+                product = extract(item, trace, timings)
+                if metrics is not None:
+                    metrics.record_item(trace, timings)
+                # lxml scoped 모드에서는 다음 상품으로 넘어가면 노드가 비워지므로 즉시 직렬화
+                if capture and capture.should_capture(trace):
+                    capture.capture(index, markup(item), trace)
             except Exception as e:
                 # streamlit 앱에서는 st.warning을 사용하겠지만, 여기서는 print로 대체
                 logging.error(f"상품 파싱 중 오류: {e}")
+                if metrics is not None:
+                    metrics.record_error()
                 continue
+            yield product
 
-        products_df = pd.DataFrame(products)
-        logging.info(f"파싱 완료. 총 {len(products)}개의 상품 데이터를 반환합니다.")
-        if not products_df.empty and "review_count" in products_df.columns:
+        if capture:
+            capture.end()
+
+    def _build_products_df(self, buffer):
+        """컬럼 버퍼를 DataFrame으로 변환하고 요약 로그 기록"""
+        if not len(buffer):
+            logging.info("파싱 완료. 추출된 상품이 없습니다.")
+            return empty_products_frame()
+
+        products_df = buffer.to_frame()
+        logging.info(f"파싱 완료. 총 {len(products_df)}개의 상품 데이터를 반환합니다.")
+        if "review_count" in products_df.columns:
             logging.info("--- 파싱 직후 review_count 컬럼 요약 ---")
             logging.info(products_df["review_count"].describe())
             logging.info("-------------------------------------")
-        if not products_df.empty and "delivery_type" in products_df.columns:
+        if "delivery_type" in products_df.columns:
             logging.info("--- 파싱 직후 delivery_type 컬럼 요약 ---")
             logging.info(products_df["delivery_type"].value_counts())
             logging.info("-------------------------------------")
         return products_df
-
-    def _extract_name(self, item):
-        """상품명 추출 (img 태그의 alt 속성에서)"""
-        name_elem = item.find("img")
-        return name_elem.get("alt", "").strip() if name_elem else None
-
-    def _extract_price(self, item):
-        """가격 추출 (실제 HTML 구조 기반)"""
-        # 1순위: 할인가 (빨간색 텍스트)
-        price_elem = item.find("div", class_=re.compile(r"fw-text-red-700"))
-        if price_elem and "원" in price_elem.get_text():
-            price_text = price_elem.get_text(strip=True)
-            price_digits = re.sub(r"[^\d]", "", price_text)
-            if price_digits and len(price_digits) >= 3:
-                logging.info(f"가격 추출 성공 (할인가): {price_digits}")
-                return int(price_digits)
-
-        # 2순위: 일반가 (회색 텍스트)
-        price_elem = item.find("div", class_=re.compile(r"fw-text-bluegray-900"))
-        if price_elem and "원" in price_elem.get_text():
-            price_text = price_elem.get_text(strip=True)
-            price_digits = re.sub(r"[^\d]", "", price_text)
-            if price_digits and len(price_digits) >= 3:
-                logging.info(f"가격 추출 성공 (일반가): {price_digits}")
-                return int(price_digits)
-
-        # 3순위: fw-font-bold와 원이 포함된 모든 div 태그
-        price_elems = item.find_all("div", class_=re.compile(r"fw-font-bold"))
-        for elem in price_elems:
-            if "원" in elem.get_text():
-                price_text = elem.get_text(strip=True)
-                price_digits = re.sub(r"[^\d]", "", price_text)
-                if price_digits and len(price_digits) >= 3:
-                    logging.info(f"가격 추출 성공 (대체 방법): {price_digits}")
-                    return int(price_digits)
-
-        # 실패 시 디버깅 정보 로그
-        logging.warning(
-            f"가격 추출 실패. 상품 내 '원' 포함 텍스트: {[elem.get_text(strip=True) for elem in item.find_all(string=re.compile(r'원'))]}"
-        )
-        return 0
-
-    def _extract_original_price(self, item):
-        """원가 추출 (실제 HTML 구조 기반)"""
-        # del 태그에서 원가 찾기
-        original_price_elem = item.find("del", class_=re.compile(r"fw-line-through"))
-        if original_price_elem and "원" in original_price_elem.get_text():
-            price_text = original_price_elem.get_text(strip=True)
-            price_digits = re.sub(r"[^\d]", "", price_text)
-            if price_digits and len(price_digits) >= 3:
-                logging.info(f"원가 추출 성공: {price_digits}")
-                return int(price_digits)
-        return 0
-
-    def _extract_discount_rate(self, item):
-        """할인율 추출 (실제 HTML 구조 기반)"""
-        # % 기호를 포함한 span 태그 찾기
-        discount_elems = item.find_all("span")
-        for elem in discount_elems:
-            text = elem.get_text(strip=True)
-            if "%" in text:
-                discount_text = text.replace("%", "").strip()
-                if discount_text.isdigit():
-                    logging.info(f"할인율 추출 성공: {discount_text}%")
-                    return int(discount_text)
-        return 0
-
-    def _extract_review_count(self, item):
-        """리뷰 수 추출"""
-        review_elem = item.find("span", class_="ProductRating_ratingCount__R0Vhz")
-        if review_elem:
-            review_text = review_elem.get_text(strip=True)
-            review_digits = re.sub(r"[^\d]", "", review_text)
-            if review_digits:
-                logging.info(f"리뷰 수 추출 성공: {review_digits}")
-                return int(review_digits)
-        logging.warning(
-            f"리뷰 수 추출 실패. HTML 일부: {str(item.find('div', class_='ProductRating_productRating__jjf7W'))[:200]}"
-        )
-        return 0
-
-    def _extract_rating(self, item):
-        """평점 추출"""
-        rating_elem = item.find("em", class_="rating")
-        if rating_elem:
-            rating_text = rating_elem.get_text(strip=True)
-            return float(rating_text) if rating_text else 0.0
-        return 0.0
-
-    def _is_rocket_delivery(self, item):
-        """로켓배송 여부 (특정 클래스 존재 유무로 판단)"""
-        return bool(
-            item.find(
-                lambda tag: tag.has_attr("class")
-                and any("ProductUnit_rocket__" in s for s in tag["class"])
-            )
-        )
-
-    def _extract_delivery_type(self, item):
-        """배송 타입 추출 (로켓배송 / 그로스 / 일반배송)"""
-        # 1순위: 로켓배송 체크 (logo_rocket_large)
-        rocket_img = item.find("img", src=re.compile(r"logo_rocket_large"))
-        if rocket_img:
-            logging.info("배송 타입 추출 성공: 로켓배송")
-            return "로켓배송"
-
-        # 2순위: 그로스(판매자로켓) 체크 (logoRocketMerchant)
-        gross_img = item.find("img", src=re.compile(r"logoRocketMerchant"))
-        if gross_img:
-            logging.info("배송 타입 추출 성공: 그로스")
-            return "그로스"
-
-        # 3순위: 일반배송 (배송 로고 없음)
-        logging.info("배송 타입 추출 성공: 일반배송")
-        return "일반배송"
-
-    def _extract_seller(self, item):
-        return None
-
-    def _extract_image_url(self, item):
-        """이미지 URL 추출 (img 태그의 src 속성에서)"""
-        img_elem = item.find("img")
-        return img_elem.get("src") if img_elem else None
-
-    def _extract_product_url(self, item):
-        """상품 URL 추출 (a 태그의 href 속성에서)"""
-        url_elem = item.find("a")
-        if url_elem:
-            url = url_elem.get("href")
-            # 상대 경로일 경우, coupang.com을 붙여줌
-            if url and not url.startswith("http"):
-                return "https://www.coupang.com" + url
-            return url
-        return None
@@ -0,0 +1,105 @@
+import logging
+import os
+import queue
+import threading
+
+from parsers.extraction_plan import has_fallback
+
+
+class DebugCapture:
+    """상품 HTML 디버그 캡처 (기본 비활성, 샘플링 + 백그라운드 기록)
+
+    파싱 스레드는 선택된 상품의 마크업을 큐에 넣기만 하고, 파일 기록은
+    별도 스레드가 처리합니다. 큐가 가득 차면 기록을 건너뛰어 파싱이
+    디스크 I/O 때문에 멈추지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        path=os.path.join("logs", "product_items.html"),
+        first_n=None,
+        only_fallback=False,
+        max_queue_size=1000,
+    ):
+        """DebugCapture 초기화
+
+        Args:
+            path (str): 캡처 파일 경로 (파싱할 때마다 새로 씀)
+            first_n (int): 파싱 1회당 최대 캡처 상품 수 (None이면 제한 없음)
+            only_fallback (bool): True면 가격/리뷰 수가 대체 경로로 추출되었거나
+                실패한 상품만 캡처
+            max_queue_size (int): 기록 대기 큐 크기 (가득 차면 캡처를 버림)
+        """
+        self.path = path
+        self.first_n = first_n
+        self.only_fallback = only_fallback
+        self.dropped = 0
+        self._captured = 0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def begin(self):
+        """파싱 1회 시작: 캡처 카운터 초기화 및 파일 새로 쓰기 예약"""
+        self._captured = 0
+        self._ensure_writer()
+        self._put(("begin", None))
+
+    def should_capture(self, trace):
+        """현재 상품을 캡처할지 여부 (샘플링 규칙 적용)"""
+        if self.first_n is not None and self._captured >= self.first_n:
+            return False
+        if self.only_fallback and not has_fallback(trace):
+            return False
+        return True
+
+    def capture(self, index, markup, trace):
+        """상품 마크업을 기록 큐에 추가"""
+        self._captured += 1
+        header = f"<!-- 상품 번호: {index + 1} | 추출 경로: {trace} -->\n"
+        self._put(("item", header + markup + "\n\n"))
+
+    def end(self):
+        """파싱 1회 종료: 기록된 내용을 디스크로 flush 예약"""
+        self._put(("end", None))
+        if self.dropped:
+            logging.warning(f"디버그 캡처 큐가 가득 차 {self.dropped}건을 건너뛰었습니다.")
+
+    def flush(self):
+        """대기 중인 기록이 모두 끝날 때까지 대기 (테스트/배치용)"""
+        if self._writer is not None:
+            self._queue.join()
+
+    def _put(self, command):
+        try:
+            self._queue.put_nowait(command)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run, name="debug-capture-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _run(self):
+        """백그라운드 기록 스레드"""
+        f = None
+        while True:
+            command, payload = self._queue.get()
+            try:
+                if command == "begin":
+                    if f is not None:
+                        f.close()
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    f = open(self.path, "w", encoding="utf-8")
+                elif command == "item" and f is not None:
+                    f.write(payload)
+                elif command == "end" and f is not None:
+                    f.flush()
+            except OSError as e:
+                logging.error(f"디버그 캡처 기록 중 오류: {e}")
+            finally:
+                self._queue.task_done()
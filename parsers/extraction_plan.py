@@ -0,0 +1,454 @@
+from functools import lru_cache
+from time import perf_counter
+import re
+import logging
+
+# 상품 li 서브트리에서 찾을 노드 규칙
+# (슬롯 이름, 태그("*"는 모든 태그), 속성, 매칭 방식, 값, 수집 방식)
+# - 매칭 방식 "contains": 속성 문자열에 값 포함 (기존 re.compile 검색과 동일)
+# - 매칭 방식 "token": class 토큰이 값과 정확히 일치 (기존 class_="..." 검색과 동일)
+# - 수집 방식 "first": 문서 순서상 첫 노드만, "all": 모든 노드를 순서대로
+EXTRACTION_RULES = [
+    ("first_img", "img", None, None, None, "first"),
+    ("first_a", "a", None, None, None, "first"),
+    ("price_sale", "div", "class", "contains", "fw-text-red-700", "first"),
+    ("price_regular", "div", "class", "contains", "fw-text-bluegray-900", "first"),
+    ("price_bold", "div", "class", "contains", "fw-font-bold", "all"),
+    ("original_price", "del", "class", "contains", "fw-line-through", "first"),
+    (
+        "review_count",
+        "span",
+        "class",
+        "token",
+        "ProductRating_ratingCount__R0Vhz",
+        "first",
+    ),
+    (
+        "rating_box",
+        "div",
+        "class",
+        "token",
+        "ProductRating_productRating__jjf7W",
+        "first",
+    ),
+    ("rating", "em", "class", "token", "rating", "first"),
+    ("rocket_class", "*", "class", "contains", "ProductUnit_rocket__", "first"),
+    ("rocket_img", "img", "src", "contains", "logo_rocket_large", "first"),
+    ("gross_img", "img", "src", "contains", "logoRocketMerchant", "first"),
+]
+
+
+@lru_cache(maxsize=None)
+def _bs4_node_types():
+    """(Tag, get_text()가 포함하는 문자열 타입) (주석 등은 제외)
+
+    bs4는 BeautifulSoup 백엔드로 추출할 때만 필요하므로 처음 호출할 때 로드합니다.
+    """
+    from bs4 import CData, NavigableString, Tag
+
+    return Tag, (NavigableString, CData)
+
+
+_NON_DIGIT = re.compile(r"[^\d]")
+
+# 상품 URL의 상품 번호 (data-product-id 속성이 없는 현재 마크업용)
+_URL_PRODUCT_ID = re.compile(r"/vp/products/(\d+)")
+
+# 상품 URL 쿼리의 옵션 번호 (li에 data-id 속성이 없을 때 사용)
+_URL_VENDOR_ITEM_ID = re.compile(r"[?&]vendorItemId=(\d+)")
+_URL_ITEM_ID = re.compile(r"[?&]itemId=(\d+)")
+
+# 정수 필드의 최댓값 (product_columns.NUMERIC_DTYPES의 int32 컬럼)
+# 넘는 값은 컬럼 버퍼에 넣을 수 없으므로 추출 단계에서 결측(0)으로 처리
+_INT32_MAX = 2**31 - 1
+
+# 필드별 대체 경로/실패로 간주하는 티어 (trace 값 기준)
+# 일반가("regular")는 할인이 없는 상품의 정상 경로이므로 제외
+FALLBACK_TIERS = {
+    "price": {"bold", "miss"},
+    "review_count": {"miss"},
+}
+
+
+# 필드별 티어 시도 순서 (앞 티어가 실패해야 다음 티어를 시도)
+TIER_ORDER = {
+    "price": ["sale", "regular", "bold"],
+    "original_price": ["hit"],
+    "discount_rate": ["hit"],
+    "review_count": ["hit"],
+    "rating": ["hit"],
+    "delivery_type": ["rocket", "gross", "normal"],
+}
+
+
+def _checked_int(digits, field, trace):
+    """숫자 문자열을 int로 (int32 범위를 넘으면 경고 후 결측(0)과 "miss" 티어)"""
+    value = int(digits)
+    if value > _INT32_MAX:
+        trace[field] = "miss"
+        logging.warning("%s 값이 범위를 벗어나 0으로 처리합니다: %s", field, digits)
+        return 0
+    return value
+
+
+def has_fallback(trace):
+    """추출 trace에 대체 경로나 실패가 포함되어 있는지 여부"""
+    return any(trace.get(field) in tiers for field, tiers in FALLBACK_TIERS.items())
+
+
+def _compile_rules(rules):
+    """규칙 목록을 태그 이름 → [(슬롯, 속성, 매칭 함수, first 여부)] 로 컴파일"""
+    compiled = {}
+    for slot, tag, attr, how, value, mode in rules:
+        if how is None:
+            test = None
+        elif how == "contains":
+            test = lambda s, v=value: v in s
+        elif how == "token":
+            test = lambda s, v=value: v in s.split()
+        else:
+            raise ValueError(f"알 수 없는 매칭 방식: {how}")
+        compiled.setdefault(tag, []).append((slot, attr, test, mode == "first"))
+    return compiled
+
+
+class _FieldTimer:
+    """필드별 값 결정 시간을 timings dict에 누적 (timings가 None이면 측정 생략)"""
+
+    __slots__ = ("timings",)
+
+    def __init__(self, timings):
+        self.timings = timings
+
+    def __call__(self, field, resolver, *args):
+        if self.timings is None:
+            return resolver(*args)
+        start = perf_counter()
+        value = resolver(*args)
+        self.timings[field] = self.timings.get(field, 0.0) + perf_counter() - start
+        return value
+
+
+class _Bs4Adapter:
+    """BeautifulSoup Tag용 텍스트/마크업 접근"""
+
+    @staticmethod
+    def text(elem):
+        return elem.get_text(strip=True)
+
+    @staticmethod
+    def markup(elem):
+        return str(elem)
+
+
+class _LxmlAdapter:
+    """lxml 엘리먼트용 텍스트/마크업 접근"""
+
+    @staticmethod
+    def text(elem):
+        # BeautifulSoup의 get_text(strip=True)와 동일한 결과
+        return "".join(s.strip() for s in elem.itertext() if s.strip())
+
+    @staticmethod
+    def markup(elem):
+        if elem is None:
+            return "None"
+        from lxml import etree
+
+        return etree.tostring(elem, encoding="unicode", with_tail=False)
+
+
+class ProductExtractionPlan:
+    """상품 li 서브트리를 한 번만 순회하며 모든 필드를 채우는 추출 계획
+
+    필드마다 서브트리를 다시 검색하던 방식(O(필드 수 × 노드 수)) 대신,
+    EXTRACTION_RULES를 태그별로 컴파일해 두고 한 번의 순회(O(노드 수))에서
+    필요한 노드를 모두 수집한 뒤 기존 우선순위대로 값을 결정합니다.
+
+    extract_* 는 PRODUCT_COLUMNS 순서의 튜플을 반환합니다.
+    dict를 trace로 넘기면 필드별로 어떤 티어에서 값을 얻었는지
+    (예: {"price": "sale", "review_count": "miss"}) 기록하고, timings로 넘기면
+    서브트리 순회("walk")와 필드별 값 결정에 걸린 시간(초)을 누적합니다.
+    """
+
+    def __init__(self, rules=EXTRACTION_RULES):
+        self._rules = _compile_rules(rules)
+        self._wildcard_rules = self._rules.get("*", [])
+
+    def extract_bs4(self, item, trace=None, timings=None):
+        """BeautifulSoup 상품 li에서 필드 추출"""
+        start = perf_counter() if timings is not None else None
+        Tag, text_types = _bs4_node_types()
+        slots = {}
+        order = {}  # span 노드의 문서 순서
+        percent_spans = {}
+        won_texts = []
+        for idx, node in enumerate(item.descendants):
+            if isinstance(node, Tag):
+                if node.name == "span":
+                    order[id(node)] = idx
+                classes = node.get("class")
+                if classes is None:
+                    classes = ""
+                elif not isinstance(classes, str):
+                    classes = " ".join(classes)
+                self._match(node.name, classes, node.get, node, slots)
+            elif type(node) in text_types:
+                if "%" in node:
+                    # 이 문자열을 포함하는 span만 할인율 후보
+                    for parent in node.parents:
+                        if parent is item:
+                            break
+                        if parent.name == "span":
+                            percent_spans[id(parent)] = parent
+                if "원" in node:
+                    won_texts.append(node.get_text(strip=True))
+
+        candidates = sorted(percent_spans.values(), key=lambda s: order[id(s)])
+        if timings is not None:
+            timings["walk"] = timings.get("walk", 0.0) + perf_counter() - start
+        return self._resolve(
+            item.get, slots, candidates, won_texts, _Bs4Adapter, trace, timings
+        )
+
+    def extract_lxml(self, item, trace=None, timings=None):
+        """lxml 상품 li에서 필드 추출"""
+        start = perf_counter() if timings is not None else None
+        slots = {}
+        order = {}
+        percent_spans = {}
+        won_texts = []
+
+        def add_percent_spans(elem):
+            while elem is not None and elem is not item:
+                if elem.tag == "span":
+                    percent_spans[elem] = True
+                elem = elem.getparent()
+
+        for idx, elem in enumerate(item.iterdescendants()):
+            tail = elem.tail
+            if tail:
+                # tail 텍스트는 부모 노드에 속함
+                if "%" in tail:
+                    add_percent_spans(elem.getparent())
+                if "원" in tail:
+                    won_texts.append(tail.strip())
+            tag = elem.tag
+            if not isinstance(tag, str):
+                continue  # 주석/처리 명령
+            if tag == "span":
+                order[elem] = idx
+            text = elem.text
+            if text:
+                if "%" in text:
+                    add_percent_spans(elem)
+                if "원" in text:
+                    won_texts.append(text.strip())
+            self._match(tag, elem.get("class") or "", elem.get, elem, slots)
+
+        candidates = sorted(percent_spans, key=order.__getitem__)
+        if timings is not None:
+            timings["walk"] = timings.get("walk", 0.0) + perf_counter() - start
+        return self._resolve(
+            item.get, slots, candidates, won_texts, _LxmlAdapter, trace, timings
+        )
+
+    def _match(self, tag, classes, get_attr, node, slots):
+        """노드 하나에 대해 해당 태그의 규칙을 적용하여 슬롯 채우기"""
+        for rules in (self._rules.get(tag), self._wildcard_rules):
+            if not rules:
+                continue
+            for slot, attr, test, first in rules:
+                if first and slot in slots:
+                    continue
+                if test is not None:
+                    value = classes if attr == "class" else get_attr(attr)
+                    if not value or not test(value):
+                        continue
+                if first:
+                    slots[slot] = node
+                else:
+                    slots.setdefault(slot, []).append(node)
+
+    def _resolve(
+        self, get_attr, slots, percent_spans, won_texts, adapter, trace, timings
+    ):
+        """수집된 노드로 기존 _extract_* 우선순위에 맞춰 필드 값 결정"""
+        if trace is None:
+            trace = {}
+        timed = _FieldTimer(timings)
+        first_img = slots.get("first_img")
+        product_url = self._resolve_product_url(slots)
+        product_id = self._resolve_product_id(get_attr, product_url)
+        # PRODUCT_COLUMNS 순서의 튜플 (행마다 dict를 만들지 않음)
+        return (
+            product_id,
+            self._resolve_listing_id(get_attr, product_url, product_id),
+            first_img.get("alt", "").strip() if first_img is not None else None,
+            timed("price", self._resolve_price, slots, won_texts, adapter, trace),
+            timed(
+                "original_price", self._resolve_original_price, slots, adapter, trace
+            ),
+            timed(
+                "discount_rate",
+                self._resolve_discount_rate,
+                percent_spans,
+                adapter,
+                trace,
+            ),
+            timed("review_count", self._resolve_review_count, slots, adapter, trace),
+            timed("rating", self._resolve_rating, slots, adapter, trace),
+            "rocket_class" in slots,
+            timed("delivery_type", self._resolve_delivery_type, slots, trace),
+            None,  # seller
+            first_img.get("src") if first_img is not None else None,
+            product_url,
+        )
+
+    @staticmethod
+    def _price_digits(elem, adapter):
+        """'원'이 포함된 가격 노드에서 3자리 이상 숫자 문자열 반환"""
+        if elem is None:
+            return None
+        price_text = adapter.text(elem)
+        if "원" not in price_text:
+            return None
+        price_digits = _NON_DIGIT.sub("", price_text)
+        if price_digits and len(price_digits) >= 3:
+            return price_digits
+        return None
+
+    # 필드별 성공 로그는 상품마다 여러 줄이 생기므로 DEBUG 레벨로 남기고,
+    # 포맷팅은 로그가 실제로 출력될 때만 하도록 % 인자를 사용합니다.
+    def _resolve_price(self, slots, won_texts, adapter, trace):
+        # 1순위: 할인가 (빨간색 텍스트)
+        price_digits = self._price_digits(slots.get("price_sale"), adapter)
+        if price_digits:
+            trace["price"] = "sale"
+            logging.debug("가격 추출 성공 (할인가): %s", price_digits)
+            return _checked_int(price_digits, "price", trace)
+
+        # 2순위: 일반가 (회색 텍스트)
+        price_digits = self._price_digits(slots.get("price_regular"), adapter)
+        if price_digits:
+            trace["price"] = "regular"
+            logging.debug("가격 추출 성공 (일반가): %s", price_digits)
+            return _checked_int(price_digits, "price", trace)
+
+        # 3순위: fw-font-bold와 원이 포함된 모든 div 태그
+        for elem in slots.get("price_bold", []):
+            price_digits = self._price_digits(elem, adapter)
+            if price_digits:
+                trace["price"] = "bold"
+                logging.debug("가격 추출 성공 (대체 방법): %s", price_digits)
+                return _checked_int(price_digits, "price", trace)
+
+        trace["price"] = "miss"
+        logging.warning("가격 추출 실패. 상품 내 '원' 포함 텍스트: %s", won_texts)
+        return 0
+
+    def _resolve_original_price(self, slots, adapter, trace):
+        price_digits = self._price_digits(slots.get("original_price"), adapter)
+        if price_digits:
+            trace["original_price"] = "hit"
+            logging.debug("원가 추출 성공: %s", price_digits)
+            return _checked_int(price_digits, "original_price", trace)
+        trace["original_price"] = "miss"
+        return 0
+
+    @staticmethod
+    def _resolve_discount_rate(percent_spans, adapter, trace):
+        for elem in percent_spans:
+            text = adapter.text(elem)
+            if "%" in text:
+                discount_text = text.replace("%", "").strip()
+                if discount_text.isdigit():
+                    trace["discount_rate"] = "hit"
+                    logging.debug("할인율 추출 성공: %s%%", discount_text)
+                    return _checked_int(discount_text, "discount_rate", trace)
+        trace["discount_rate"] = "miss"
+        return 0
+
+    @staticmethod
+    def _resolve_review_count(slots, adapter, trace):
+        review_elem = slots.get("review_count")
+        if review_elem is not None:
+            review_digits = _NON_DIGIT.sub("", adapter.text(review_elem))
+            if review_digits:
+                trace["review_count"] = "hit"
+                logging.debug("리뷰 수 추출 성공: %s", review_digits)
+                return _checked_int(review_digits, "review_count", trace)
+        trace["review_count"] = "miss"
+        if logging.getLogger().isEnabledFor(logging.WARNING):
+            logging.warning(
+                "리뷰 수 추출 실패. HTML 일부: %s",
+                adapter.markup(slots.get("rating_box"))[:200],
+            )
+        return 0
+
+    @staticmethod
+    def _resolve_rating(slots, adapter, trace):
+        rating_elem = slots.get("rating")
+        if rating_elem is not None:
+            rating_text = adapter.text(rating_elem)
+            trace["rating"] = "hit" if rating_text else "miss"
+            return float(rating_text) if rating_text else 0.0
+        trace["rating"] = "miss"
+        return 0.0
+
+    @staticmethod
+    def _resolve_delivery_type(slots, trace):
+        # 1순위: 로켓배송 (logo_rocket_large), 2순위: 그로스 (logoRocketMerchant)
+        if "rocket_img" in slots:
+            trace["delivery_type"] = "rocket"
+            logging.debug("배송 타입 추출 성공: 로켓배송")
+            return "로켓배송"
+        if "gross_img" in slots:
+            trace["delivery_type"] = "gross"
+            logging.debug("배송 타입 추출 성공: 그로스")
+            return "그로스"
+        # 3순위: 일반배송 (배송 로고 없음)
+        trace["delivery_type"] = "normal"
+        logging.debug("배송 타입 추출 성공: 일반배송")
+        return "일반배송"
+
+    @staticmethod
+    def _resolve_product_id(get_attr, product_url):
+        # 1순위: data-product-id 속성, 2순위: 상품 URL의 /vp/products/<번호>
+        product_id = get_attr("data-product-id")
+        if product_id:
+            return product_id
+        if product_url:
+            match = _URL_PRODUCT_ID.search(product_url)
+            if match:
+                return match.group(1)
+        return None
+
+    @staticmethod
+    def _resolve_listing_id(get_attr, product_url, product_id):
+        # 같은 상품 번호를 색상/사이즈 옵션과 광고/일반 노출이 함께 쓰므로
+        # 검색 결과 행은 옵션 번호(vendorItemId)로 구분
+        # 1순위: li의 data-id 속성, 2순위: URL의 vendorItemId,
+        # 3순위: 상품 번호 + URL의 itemId, 4순위: 상품 번호
+        listing_id = get_attr("data-id")
+        if listing_id:
+            return listing_id
+        if product_url:
+            match = _URL_VENDOR_ITEM_ID.search(product_url)
+            if match:
+                return match.group(1)
+            match = _URL_ITEM_ID.search(product_url)
+            if match and product_id:
+                return f"{product_id}-{match.group(1)}"
+        return product_id
+
+    @staticmethod
+    def _resolve_product_url(slots):
+        url_elem = slots.get("first_a")
+        if url_elem is not None:
+            url = url_elem.get("href")
+            # 상대 경로일 경우, coupang.com을 붙여줌
+            if url and not url.startswith("http"):
+                return "https://www.coupang.com" + url
+            return url
+        return None
@@ -0,0 +1,94 @@
+from lxml import etree
+from lxml import html as lxml_html
+from parsers.extraction_plan import ProductExtractionPlan
+
+PRODUCT_ITEM_CLASS = "ProductUnit_productUnit__Qd6sv"
+
+# scoped 모드에서 파서에 한 번에 넣는 문서 조각 크기 (문자 수)
+FEED_CHUNK_SIZE = 64 * 1024
+
+# BeautifulSoup의 class_ 검색과 동일하게 동작하도록 만든 XPath 조각
+PRODUCT_ITEM_XPATH = (
+    "//li[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' ProductUnit_productUnit__Qd6sv ')]"
+)
+
+
+class LxmlProductExtractor:
+    """BeautifulSoup 없이 lxml 트리에서 직접 상품 정보를 추출하는 백엔드
+
+    필드 추출은 BeautifulSoup 경로와 같은 ProductExtractionPlan을 사용하므로
+    우선순위/반환값이 동일합니다.
+    """
+
+    def __init__(self, extraction_plan=None):
+        self.extraction_plan = extraction_plan or ProductExtractionPlan()
+
+    def find_product_items(self, html_content):
+        """검색 결과 HTML에서 상품 li 엘리먼트 목록 반환"""
+        if hasattr(html_content, "read"):
+            html_content = html_content.read()
+        if isinstance(html_content, str):
+            # 인코딩 선언이 포함된 문자열도 처리할 수 있도록 bytes로 전달
+            html_content = html_content.encode("utf-8")
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        root = lxml_html.fromstring(html_content, parser=parser)
+        return root.xpath(PRODUCT_ITEM_XPATH)
+
+    def iter_product_items(self, html_content, chunk_size=FEED_CHUNK_SIZE):
+        """상품 li 엘리먼트를 하나씩 반환하는 스코프 파싱 (scoped 모드)
+
+        HTMLPullParser에 문서를 조각 단위로 흘려보내면서 상품 li 서브트리만 유지하고,
+        나머지 노드는 닫히는 즉시 비워 트리 메모리가 상품 영역 크기로 제한됩니다.
+        html_content는 문자열 또는 read()를 지원하는 파일 객체일 수 있습니다.
+        반환된 엘리먼트는 다음 항목을 요청하기 전에 사용해야 합니다.
+        """
+        parser = etree.HTMLPullParser(events=("start", "end"))
+        product_depth = 0  # 상품 li 내부 깊이 (중첩 li 대비)
+        for piece in self._iter_pieces(html_content, chunk_size):
+            if piece is None:
+                parser.close()
+            else:
+                parser.feed(piece)
+            for event, elem in parser.read_events():
+                is_product = elem.tag == "li" and PRODUCT_ITEM_CLASS in (
+                    elem.get("class") or ""
+                ).split()
+                if event == "start":
+                    if is_product or product_depth:
+                        product_depth += 1
+                    continue
+
+                if product_depth:
+                    product_depth -= 1
+                    if not is_product or product_depth:
+                        # 상품 서브트리 내부 노드는 li가 닫힐 때까지 유지
+                        continue
+                    yield elem
+                elem.clear()
+                # 이미 처리된 형제 노드 제거
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+
+    @staticmethod
+    def _iter_pieces(html_content, chunk_size):
+        """문자열/파일 객체를 chunk_size 조각으로 나누고 마지막에 None 반환"""
+        if hasattr(html_content, "read"):
+            while True:
+                piece = html_content.read(chunk_size)
+                if not piece:
+                    break
+                yield piece
+        else:
+            for start in range(0, len(html_content), chunk_size):
+                yield html_content[start : start + chunk_size]
+        yield None
+
+    def extract_product(self, item, trace=None, timings=None):
+        """상품 li 엘리먼트에서 CoupangParser와 동일한 스키마의 dict 생성"""
+        return self.extraction_plan.extract_lxml(item, trace, timings)
+
+    def markup(self, item):
+        """디버그 캡처용 상품 li 마크업"""
+        return etree.tostring(item, encoding="unicode", with_tail=False)
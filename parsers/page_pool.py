@@ -0,0 +1,55 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+# Streamlit 작업 스레드(DagExecutor)에서 fork하면 다른 스레드가 잡고 있던 잠금이
+# 복사되어 교착될 수 있으므로 워커는 spawn으로 시작
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def map_pages(worker, tasks, max_workers=None):
+    """페이지 목록을 프로세스 풀로 병렬 처리 (페이지 순서 유지)"""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tasks)))
+
+    # 페이지가 하나뿐이거나 워커가 1개면 풀 생성 비용 없이 현재 프로세스에서 처리
+    if max_workers == 1:
+        return [worker(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=_MP_CONTEXT
+    ) as executor:
+        return list(executor.map(worker, tasks, chunksize=chunksize))
+
+
+def imap_pages(worker, tasks, max_workers=None, window=None):
+    """페이지 결과를 순서대로 하나씩 반환하는 제너레이터
+
+    executor.map과 달리 동시에 진행 중인 작업을 window개(기본 워커 수의 2배)로
+    제한하므로, 소비자가 결과를 처리하는 속도보다 워커가 빨라도 완료된 결과가
+    메모리에 쌓이지 않습니다.
+    """
+    tasks = iter(tasks)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, max_workers)
+
+    if max_workers == 1:
+        for task in tasks:
+            yield worker(task)
+        return
+
+    window = window or max_workers * 2
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=_MP_CONTEXT
+    ) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(worker, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
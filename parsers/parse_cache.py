@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import os
+import threading
+
+import pandas as pd
+
+from storage.atomic import write_parquet_atomic
+
+# 파서 출력(컬럼, dtype, 추출 규칙)이 바뀌면 올려서 이전 캐시를 무효화
+# (이전 버전 파일은 더 이상 읽히지 않고 LRU로 자연히 밀려남)
+PARSER_VERSION = "2"
+
+PARSE_CACHE_DIR = os.path.join(".cache", "parse")
+
+_SUFFIX = ".parquet"
+
+
+class ParseCache:
+    """HTML 내용 해시 기반 디스크 파싱 캐시 (Parquet, LRU 제거)
+
+    키는 (종류, 파서 버전, HTML의 SHA-256)이며 파일 하나에 DataFrame 하나를
+    Parquet으로 저장합니다. 인덱스 파일 없이 파일 수정 시각을 최근 사용 시각으로
+    쓰므로 여러 세션/프로세스가 같은 디렉터리를 공유해도 안전하고, 재시작 후에도
+    그대로 재사용됩니다. 저장 시 항목 수/전체 크기 한도를 넘으면 가장 오래 쓰지
+    않은 파일부터 지웁니다.
+    """
+
+    def __init__(
+        self, cache_dir=PARSE_CACHE_DIR, max_entries=500, max_bytes=512 * 1024**2
+    ):
+        """ParseCache 초기화
+
+        Args:
+            cache_dir (str): 캐시 파일 디렉터리 (없으면 생성)
+            max_entries (int): 최대 캐시 파일 수
+            max_bytes (int): 최대 캐시 전체 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def content_hash(html_content):
+        """HTML 내용의 SHA-256 (str은 utf-8로 인코딩)"""
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+        return hashlib.sha256(html_content).hexdigest()
+
+    def _path(self, kind, digest):
+        return os.path.join(
+            self.cache_dir, f"{kind}-v{PARSER_VERSION}-{digest}{_SUFFIX}"
+        )
+
+    def get(self, kind, digest):
+        """캐시된 DataFrame 반환 (없거나 읽을 수 없으면 None)"""
+        path = self._path(kind, digest)
+        try:
+            products_df = pd.read_parquet(path)
+            # 최근 사용 시각 갱신 (LRU)
+            os.utime(path)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except Exception as e:
+            # 다른 프로세스가 제거 중이거나 손상된 파일은 캐시 미스로 처리
+            logging.warning(f"파싱 캐시 읽기 실패 ({path}): {e}")
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        return products_df
+
+    def put(self, kind, digest, products_df):
+        """DataFrame을 캐시에 저장하고 한도를 넘으면 LRU 제거"""
+        path = self._path(kind, digest)
+        try:
+            write_parquet_atomic(products_df, path)
+        except Exception as e:
+            logging.warning(f"파싱 캐시 저장 실패 ({path}): {e}")
+            return
+        self._evict()
+
+    def get_or_parse(self, kind, html_content, parse):
+        """캐시에 있으면 읽고, 없으면 parse(html_content) 결과를 저장 후 반환"""
+        digest = self.content_hash(html_content)
+        cached = self.get(kind, digest)
+        if cached is not None:
+            return cached
+        products_df = parse(html_content)
+        if products_df is not None:
+            self.put(kind, digest, products_df)
+        return products_df
+
+    def _entries(self):
+        """(최근 사용 시각, 크기, 경로) 목록"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        """항목 수/전체 크기 한도를 넘는 만큼 오래된 파일부터 제거"""
+        entries = sorted(self._entries())
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+        while entries and (
+            len(entries) > self.max_entries or total_bytes > self.max_bytes
+        ):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            removed += 1
+        if removed:
+            logging.info(f"파싱 캐시 LRU 제거: {removed}개 (남은 {len(entries)}개)")
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """캐시 항목 수, 전체 크기, 프로세스 내 hit/miss 카운트"""
+        entries = self._entries()
+        with self._lock:
+            return {
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        """캐시 파일 전체 삭제"""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,119 @@
+import threading
+from collections import Counter, defaultdict
+
+import pandas as pd
+
+from parsers.extraction_plan import TIER_ORDER
+
+
+class ParserMetrics:
+    """파서 핫패스 메트릭 (프로세스 내 누적)
+
+    - 필드별 값 결정 시간과 서브트리 순회("walk") 시간
+    - 필드별로 어떤 선택자 티어에서 값을 얻었는지 (hit/miss 카운트)
+    - 파싱한 상품 수와 초당 처리량
+
+    쿠팡 마크업이 바뀌어 가격이 대체 티어로만 추출되거나 리뷰 수 추출이
+    실패하기 시작하면 tier_stats()에서 바로 드러납니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """누적된 메트릭 초기화"""
+        with self._lock:
+            self.items = 0
+            self.errors = 0
+            self.parses = 0
+            self.parse_seconds = 0.0
+            self.last_parse = None
+            self.field_seconds = defaultdict(float)
+            self.final_tiers = defaultdict(Counter)
+
+    def record_item(self, trace, timings):
+        """상품 1건의 추출 trace/timings 누적"""
+        with self._lock:
+            self.items += 1
+            for field, seconds in timings.items():
+                self.field_seconds[field] += seconds
+            for field, tier in trace.items():
+                self.final_tiers[field][tier] += 1
+
+    def record_error(self):
+        """상품 파싱 예외 1건 기록"""
+        with self._lock:
+            self.errors += 1
+
+    def record_parse(self, backend, item_count, seconds):
+        """parse_search_html 1회 호출 결과 기록"""
+        with self._lock:
+            self.parses += 1
+            self.parse_seconds += seconds
+            self.last_parse = {
+                "backend": backend,
+                "items": item_count,
+                "seconds": seconds,
+                "items_per_sec": item_count / seconds if seconds > 0 else 0.0,
+            }
+
+    def snapshot(self):
+        """현재 메트릭을 dict로 반환 (파이썬에서 직접 조회용)"""
+        with self._lock:
+            return {
+                "items": self.items,
+                "errors": self.errors,
+                "parses": self.parses,
+                "parse_seconds": self.parse_seconds,
+                "items_per_sec": (
+                    self.items / self.parse_seconds if self.parse_seconds > 0 else 0.0
+                ),
+                "last_parse": dict(self.last_parse) if self.last_parse else None,
+                "field_seconds": dict(self.field_seconds),
+                "final_tiers": {f: dict(c) for f, c in self.final_tiers.items()},
+            }
+
+    def field_timing_stats(self):
+        """필드별 누적/평균 추출 시간 DataFrame"""
+        snap = self.snapshot()
+        rows = [
+            {
+                "field": field,
+                "total_ms": seconds * 1000,
+                "avg_us": seconds / snap["items"] * 1e6 if snap["items"] else 0.0,
+            }
+            for field, seconds in snap["field_seconds"].items()
+        ]
+        return pd.DataFrame(rows, columns=["field", "total_ms", "avg_us"])
+
+    def tier_stats(self):
+        """필드/티어별 시도, hit, miss 카운트 DataFrame
+
+        티어는 TIER_ORDER 순서로 시도되므로, 최종 티어 분포로부터 각 티어의
+        시도 횟수(이전 티어가 모두 실패한 건수)와 hit/miss를 계산합니다.
+        """
+        snap = self.snapshot()
+        rows = []
+        for field, counts in snap["final_tiers"].items():
+            remaining = sum(counts.values())
+            for tier in TIER_ORDER.get(field, []):
+                hits = counts.get(tier, 0)
+                rows.append(
+                    {
+                        "field": field,
+                        "tier": tier,
+                        "attempts": remaining,
+                        "hits": hits,
+                        "misses": remaining - hits,
+                        "hit_rate": hits / remaining if remaining else 0.0,
+                    }
+                )
+                remaining -= hits
+        return pd.DataFrame(
+            rows, columns=["field", "tier", "attempts", "hits", "misses", "hit_rate"]
+        )
+
+
+# 프로세스 전역 메트릭 (CoupangParser 기본값)
+PARSER_METRICS = ParserMetrics()
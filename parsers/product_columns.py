@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# ProductExtractionPlan.extract_* 가 반환하는 튜플의 컬럼 순서
+# (product_id는 상품 번호로 옵션/광고 노출끼리 겹칠 수 있고, 검색 결과 행은
+#  옵션 번호 listing_id(vendorItemId)로 구분합니다)
+PRODUCT_COLUMNS = (
+    "product_id",
+    "listing_id",
+    "name",
+    "price",
+    "original_price",
+    "discount_rate",
+    "review_count",
+    "rating",
+    "is_rocket",
+    "delivery_type",
+    "seller",
+    "image_url",
+    "product_url",
+)
+
+# delivery_type 카테고리 (코드 순서 고정)
+DELIVERY_TYPES = ("로켓배송", "그로스", "일반배송")
+
+# 숫자/불리언 컬럼의 압축 dtype (가격/개수는 int32, 평점은 float32)
+NUMERIC_DTYPES = {
+    "price": np.int32,
+    "original_price": np.int32,
+    "discount_rate": np.int32,
+    "review_count": np.int32,
+    "rating": np.float32,
+    "is_rocket": np.bool_,
+}
+
+_DELIVERY_CODES = {name: code for code, name in enumerate(DELIVERY_TYPES)}
+_INITIAL_CAPACITY = 64
+
+
+class ProductColumnBuffer:
+    """상품 행을 컬럼별 배열에 바로 누적하는 버퍼
+
+    행마다 dict를 만들지 않고 숫자 컬럼은 미리 할당한 numpy 배열(용량 부족 시
+    2배씩 확장)에, 문자열 컬럼은 리스트에 담아 to_frame()에서 한 번에
+    DataFrame으로 조립합니다. delivery_type은 int8 코드로 저장했다가
+    categorical 컬럼으로 변환합니다.
+    """
+
+    def __init__(self, capacity=_INITIAL_CAPACITY):
+        """ProductColumnBuffer 초기화
+
+        Args:
+            capacity (int): 초기 할당 행 수 (예상 상품 수를 알면 미리 지정)
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._numeric = {
+            column: np.zeros(capacity, dtype=dtype)
+            for column, dtype in NUMERIC_DTYPES.items()
+        }
+        self._delivery = np.zeros(capacity, dtype=np.int8)
+        self._objects = {
+            column: []
+            for column in PRODUCT_COLUMNS
+            if column not in NUMERIC_DTYPES and column != "delivery_type"
+        }
+
+    def __len__(self):
+        return self._size
+
+    def append(self, row):
+        """PRODUCT_COLUMNS 순서의 튜플 1행 추가"""
+        (
+            product_id,
+            listing_id,
+            name,
+            price,
+            original_price,
+            discount_rate,
+            review_count,
+            rating,
+            is_rocket,
+            delivery_type,
+            seller,
+            image_url,
+            product_url,
+        ) = row
+        i = self._size
+        if i == len(self._delivery):
+            self._grow()
+        numeric = self._numeric
+        numeric["price"][i] = price
+        numeric["original_price"][i] = original_price
+        numeric["discount_rate"][i] = discount_rate
+        numeric["review_count"][i] = review_count
+        numeric["rating"][i] = rating
+        numeric["is_rocket"][i] = is_rocket
+        self._delivery[i] = _DELIVERY_CODES.get(delivery_type, -1)
+        objects = self._objects
+        objects["product_id"].append(product_id)
+        objects["listing_id"].append(listing_id)
+        objects["name"].append(name)
+        objects["seller"].append(seller)
+        objects["image_url"].append(image_url)
+        objects["product_url"].append(product_url)
+        self._size = i + 1
+
+    def _grow(self):
+        """배열 용량 2배 확장"""
+        capacity = len(self._delivery) * 2
+        for column, values in self._numeric.items():
+            grown = np.zeros(capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._numeric[column] = grown
+        grown = np.zeros(capacity, dtype=np.int8)
+        grown[: self._size] = self._delivery[: self._size]
+        self._delivery = grown
+
+    def to_frame(self):
+        """누적된 행을 압축 dtype DataFrame으로 변환"""
+        n = self._size
+        columns = {}
+        for column in PRODUCT_COLUMNS:
+            if column in NUMERIC_DTYPES:
+                # 용량만큼 잡힌 배열을 그대로 참조하지 않도록 잘라서 복사
+                columns[column] = self._numeric[column][:n].copy()
+            elif column == "delivery_type":
+                columns[column] = pd.Categorical.from_codes(
+                    self._delivery[:n], categories=list(DELIVERY_TYPES)
+                )
+            else:
+                columns[column] = np.array(self._objects[column], dtype=object)
+        return pd.DataFrame(columns, columns=list(PRODUCT_COLUMNS))
+
+
+def empty_products_frame():
+    """상품이 없을 때 사용하는 컬럼/dtype만 갖춘 빈 DataFrame"""
+    return ProductColumnBuffer(capacity=1).to_frame()
+
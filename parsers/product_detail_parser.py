@@ -1,16 +1,48 @@
-from bs4 import BeautifulSoup
+from functools import lru_cache
 import pandas as pd
 import re
 import logging
 
+REVIEW_ARTICLE_CLASSES = ["sdp-review__article__list", "js_reviewArticleReviewList"]
+
+# scoped 모드에서 트리로 만들 리뷰 article 노드
+# (파싱 시점에는 class 값이 분리되지 않은 문자열일 수 있어 토큰 정규식으로 매칭)
+REVIEW_ARTICLE_CLASS_PATTERN = re.compile(
+    r"(^|\s)(%s)(\s|$)" % "|".join(REVIEW_ARTICLE_CLASSES)
+)
+
+
+@lru_cache(maxsize=None)
+def review_article_strainer():
+    """리뷰 article만 트리로 만드는 SoupStrainer (bs4는 처음 파싱할 때 로드)"""
+    from bs4 import SoupStrainer
+
+    return SoupStrainer("article", class_=REVIEW_ARTICLE_CLASS_PATTERN)
+
 
 class ProductDetailParser:
+    def __init__(self, scoped=False):
+        """ProductDetailParser 초기화
+
+        Args:
+            scoped (bool): True면 리뷰 article 서브트리만 트리로 생성 (메모리/시간 절감).
+                리뷰 외 항목(스펙, 이미지 등)을 추출할 때는 False로 사용해야 합니다.
+        """
+        self.scoped = scoped
+
     def parse_product_detail(self, html_content):
         """상품 상세 페이지에서 리뷰, 스펙 등 추출"""
         if not html_content:
             return {}
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        from bs4 import BeautifulSoup
+
+        if self.scoped:
+            soup = BeautifulSoup(
+                html_content, "html.parser", parse_only=review_article_strainer()
+            )
+        else:
+            soup = BeautifulSoup(html_content, "html.parser")
 
         return {
             "reviews": self._extract_reviews(soup),
@@ -24,10 +56,7 @@ class ProductDetailParser:
         """리뷰 데이터 추출"""
         reviews = []
         # 정확한 선택자로 수정
-        review_items = soup.find_all(
-            "article",
-            class_=["sdp-review__article__list", "js_reviewArticleReviewList"],
-        )
+        review_items = soup.find_all("article", class_=REVIEW_ARTICLE_CLASSES)
 
         logging.info(f"발견된 리뷰 수: {len(review_items)}")
 
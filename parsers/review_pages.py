@@ -0,0 +1,101 @@
+import logging
+import os
+
+import pandas as pd
+
+from parsers.page_pool import imap_pages
+from parsers.parse_cache import ParseCache
+from parsers.product_detail_parser import ProductDetailParser
+
+
+def _parse_review_page(html_content, cache_dir):
+    """리뷰 1페이지 파싱 (cache_dir가 있으면 디스크 캐시 우선)"""
+    parser = ProductDetailParser(scoped=True)
+
+    def parse(html):
+        return parser.parse_product_detail(html).get("reviews")
+
+    if cache_dir is None:
+        return parse(html_content)
+    return ParseCache(cache_dir).get_or_parse("detail", html_content, parse)
+
+
+def _parse_review_content(args):
+    """프로세스 풀 워커: 상세/리뷰 HTML 문자열 1페이지 파싱"""
+    html_content, cache_dir = args
+    return _parse_review_page(html_content, cache_dir)
+
+
+def _parse_review_file(args):
+    """프로세스 풀 워커: 상세/리뷰 HTML 파일 1페이지 파싱"""
+    path, cache_dir = args
+    with open(path, encoding="utf-8") as f:
+        html_content = f.read()
+    return _parse_review_page(html_content, cache_dir)
+
+
+def merge_review_pages(page_dfs):
+    """페이지별 리뷰 DataFrame을 받는 대로 (내용, 평점) 기준 중복 제거 후 병합
+
+    page_dfs는 제너레이터여도 되며, 페이지마다 이미 본 (content, rating) 조합을
+    바로 걸러내므로 중복 리뷰는 누적되지 않습니다. 페이지 번호(page)를 붙이고
+    먼저 나온 리뷰를 남기며, 내용이 없는 리뷰는 중복 판단이 불가능하므로 모두
+    유지합니다.
+    """
+    frames = []
+    seen = set()
+    page_count = review_count = 0
+    for page_no, page_df in enumerate(page_dfs, start=1):
+        page_count += 1
+        if page_df is None or page_df.empty:
+            continue
+        review_count += len(page_df)
+
+        keep = []
+        for content, rating in zip(page_df["content"], page_df["rating"]):
+            if pd.isna(content):
+                keep.append(True)
+                continue
+            key = (content, rating)
+            keep.append(key not in seen)
+            seen.add(key)
+        if any(keep):
+            frames.append(page_df[keep].assign(page=page_no))
+
+    if not frames:
+        return pd.DataFrame()
+
+    merged = pd.concat(frames, ignore_index=True)
+    logging.info(
+        f"리뷰 페이지 병합 완료: {page_count}페이지, 리뷰 {review_count}개 → 중복 제거 후 {len(merged)}개"
+    )
+    return merged
+
+
+def parse_review_pages(html_contents, max_workers=None, cache_dir=None):
+    """여러 상세/리뷰 페이지 HTML 문자열을 병렬 파싱하여 하나의 리뷰 DataFrame으로 병합
+
+    Args:
+        html_contents (list[str]): 페이지 순서대로 정렬된 상세/리뷰 HTML 목록
+        max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+    """
+    tasks = (
+        (html_content, cache_dir) for html_content in html_contents if html_content
+    )
+    return merge_review_pages(imap_pages(_parse_review_content, tasks, max_workers))
+
+
+def parse_review_files(paths, max_workers=None, cache_dir=None):
+    """여러 상세/리뷰 HTML 파일을 병렬 파싱하여 하나의 리뷰 DataFrame으로 병합
+
+    파일은 워커에서 직접 읽고 결과는 페이지 순서대로 받는 즉시 중복 제거하므로,
+    페이지 수가 많아도 HTML 원문이나 중복 리뷰가 메모리에 쌓이지 않습니다.
+
+    Args:
+        paths (list[str]): 페이지 순서대로 정렬된 HTML 파일 경로 목록
+        max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+    """
+    tasks = ((os.fspath(path), cache_dir) for path in paths)
+    return merge_review_pages(imap_pages(_parse_review_file, tasks, max_workers))
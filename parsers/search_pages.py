@@ -0,0 +1,109 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from parsers.coupang_parser import CoupangParser
+from parsers.page_pool import map_pages
+from parsers.parse_cache import ParseCache
+
+
+def _parse_page(html_content, backend, cache_dir):
+    """검색 결과 1페이지 파싱 (cache_dir가 있으면 디스크 캐시 우선)"""
+    parser = CoupangParser(backend=backend, scoped=True)
+    if cache_dir is None:
+        return parser.parse_search_html(html_content)
+    return ParseCache(cache_dir).get_or_parse(
+        "search", html_content, parser.parse_search_html
+    )
+
+
+def _parse_search_content(args):
+    """프로세스 풀 워커: 검색 결과 HTML 문자열 1페이지 파싱"""
+    html_content, backend, cache_dir = args
+    return _parse_page(html_content, backend, cache_dir)
+
+
+def _parse_search_file(args):
+    """프로세스 풀 워커: 검색 결과 HTML 파일 1페이지 파싱
+
+    파일은 워커에서 직접 읽어 큰 HTML 문자열을 프로세스 간에 복사하지 않습니다.
+    """
+    path, backend, cache_dir = args
+    with open(path, encoding="utf-8") as f:
+        html_content = f.read()
+    return _parse_page(html_content, backend, cache_dir)
+
+
+def merge_search_pages(page_dfs):
+    """페이지별 상품 DataFrame 병합 후 listing_id 기준 중복 제거
+
+    페이지 순서대로 전체 순위(rank, 1부터)와 페이지 번호(page)를 붙이고,
+    같은 listing_id(옵션 번호)가 여러 번 나오면(광고/일반 노출, 페이지 간 중복)
+    가장 높은 순위(가장 작은 rank)만 남깁니다. 같은 product_id라도 옵션이 다르면
+    서로 다른 상품으로 유지하며, listing_id가 없는 상품은 모두 유지합니다.
+    """
+    frames = []
+    offset = 0
+    page_no = 0
+    for page_no, page_df in enumerate(page_dfs, start=1):
+        if page_df is None or page_df.empty:
+            continue
+        count = len(page_df)
+        frames.append(
+            page_df.assign(
+                page=page_no, rank=np.arange(offset + 1, offset + count + 1)
+            )
+        )
+        offset += count
+
+    if not frames:
+        return pd.DataFrame()
+
+    merged = pd.concat(frames, ignore_index=True)
+    # rank 오름차순으로 이미 정렬되어 있으므로 첫 등장이 가장 높은 순위
+    key = "listing_id" if "listing_id" in merged.columns else "product_id"
+    duplicated = merged[key].notna() & merged.duplicated(subset=key, keep="first")
+    merged = merged[~duplicated].reset_index(drop=True)
+
+    logging.info(
+        f"검색 페이지 병합 완료: {page_no}페이지, 상품 {offset}개 → 중복 제거 후 {len(merged)}개"
+    )
+    return merged
+
+
+def parse_search_pages(
+    html_contents, backend="lxml-native", max_workers=None, cache_dir=None
+):
+    """여러 검색 결과 페이지 HTML 문자열을 병렬 파싱하여 하나의 DataFrame으로 병합
+
+    Args:
+        html_contents (list[str]): 페이지 순서대로 정렬된 검색 결과 HTML 목록
+        backend (str): CoupangParser 파싱 백엔드
+        max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+    """
+    tasks = [
+        (html_content, backend, cache_dir)
+        for html_content in html_contents
+        if html_content
+    ]
+    if not tasks:
+        return pd.DataFrame()
+    return merge_search_pages(map_pages(_parse_search_content, tasks, max_workers))
+
+
+def parse_search_files(paths, backend="lxml-native", max_workers=None, cache_dir=None):
+    """여러 검색 결과 HTML 파일을 병렬 파싱하여 하나의 DataFrame으로 병합
+
+    Args:
+        paths (list[str]): 페이지 순서대로 정렬된 HTML 파일 경로 목록
+        backend (str): CoupangParser 파싱 백엔드
+        max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+    """
+    tasks = [(os.fspath(path), backend, cache_dir) for path in paths]
+    if not tasks:
+        return pd.DataFrame()
+    return merge_search_pages(map_pages(_parse_search_file, tasks, max_workers))
@@ -0,0 +1,363 @@
+"""저장된 HTML 폴더를 Streamlit 없이 일괄 분석하는 배치 CLI
+
+입력 폴더 레이아웃 (키워드 폴더마다 하나의 작업):
+    <input>/<키워드 폴더>/search/*.html   검색 결과 페이지 (파일명 순 = 페이지 순)
+    <input>/<키워드 폴더>/detail/*.html   상품 상세/리뷰 페이지 (선택)
+
+search/detail 하위 폴더가 없으면 키워드 폴더 바로 아래 HTML 중 파일명에
+"detail" 또는 "review"가 들어간 파일은 상세 페이지, 나머지는 검색 결과
+페이지로 봅니다. 키워드는 검색 결과 HTML의 검색창에서 감지하고, 없으면
+폴더 이름을 씁니다.
+
+출력 (키워드마다):
+    <output>/<키워드>/products.parquet   정리된 상품 테이블
+    <output>/<키워드>/reviews.parquet    중복 제거한 리뷰 (상세 페이지가 있을 때)
+    <output>/<키워드>/report.json        가격/리뷰수/판매형태 통계, 리뷰 감성/키워드
+    <output>/batch_summary.json          작업별 결과와 처리량 (files/sec, products/sec)
+
+사용법:
+    python -m pipeline.batch <input> [--output reports] [--workers 4]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from analyzers.delivery_analyzer import DeliveryAnalyzer
+from analyzers.price_analyzer import PriceAnalyzer
+from analyzers.product_table import ProductTable
+from analyzers.review_analyzer import ReviewAnalyzer
+from analyzers.review_text_analyzer import ReviewTextAnalyzer
+from parsers.coupang_parser import PARSER_BACKENDS, extract_search_keyword
+from parsers.page_pool import map_pages
+from parsers.parse_cache import PARSE_CACHE_DIR
+from parsers.review_pages import parse_review_files
+from parsers.search_pages import parse_search_files
+
+BATCH_OUTPUT_DIR = "reports"
+SUMMARY_FILE = "batch_summary.json"
+
+_HTML_SUFFIXES = (".html", ".htm")
+_DETAIL_MARKERS = ("detail", "review")
+
+
+def _html_files(directory):
+    """폴더 안의 HTML 파일 경로 (파일명 순)"""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(_HTML_SUFFIXES)
+        and os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def _read_keyword(path):
+    """검색 결과 HTML 파일에서 검색 키워드 감지 (없으면 None)"""
+    # 인코딩이 깨진 파일도 키워드 감지는 시도 (파싱 실패는 작업 결과로 기록)
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return extract_search_keyword(f.read())
+
+
+def find_jobs(input_dir):
+    """입력 폴더에서 키워드별 작업 목록 생성
+
+    입력 폴더 자체에 HTML이 있으면 하나의 작업으로, 아니면 하위 폴더마다
+    하나의 작업으로 봅니다. 검색 결과 페이지가 없는 폴더는 건너뜁니다.
+    """
+    directories = [input_dir] if _html_files(input_dir) else []
+    if not directories:
+        directories = sorted(
+            entry.path
+            for entry in os.scandir(input_dir)
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+
+    jobs = []
+    for directory in directories:
+        search_dir = os.path.join(directory, "search")
+        detail_dir = os.path.join(directory, "detail")
+        if os.path.isdir(search_dir) or os.path.isdir(detail_dir):
+            search_paths = _html_files(search_dir) if os.path.isdir(search_dir) else []
+            detail_paths = _html_files(detail_dir) if os.path.isdir(detail_dir) else []
+        else:
+            search_paths, detail_paths = [], []
+            for path in _html_files(directory):
+                name = os.path.basename(path).lower()
+                if any(marker in name for marker in _DETAIL_MARKERS):
+                    detail_paths.append(path)
+                else:
+                    search_paths.append(path)
+
+        if not search_paths:
+            logging.warning(f"검색 결과 HTML이 없어 건너뜁니다: {directory}")
+            continue
+        keyword = _read_keyword(search_paths[0]) or os.path.basename(
+            os.path.normpath(directory)
+        )
+        jobs.append(
+            {
+                "keyword": keyword,
+                "search_paths": search_paths,
+                "detail_paths": detail_paths,
+            }
+        )
+    return jobs
+
+
+def to_jsonable(value):
+    """통계 결과를 JSON으로 쓸 수 있는 값으로 변환 (NaN/inf는 null)"""
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, pd.DataFrame):
+        return [to_jsonable(row) for row in value.to_dict(orient="records")]
+    if isinstance(value, pd.Series):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def build_report(keyword, product_table, reviews_df, top_n=20, max_workers=1):
+    """상품 테이블/리뷰로 키워드 분석 리포트(dict) 생성
+
+    Streamlit 대시보드와 같은 분석기를 사용하되 차트는 만들지 않습니다.
+    """
+    price_analysis = PriceAnalyzer(product_table).analyze_prices()
+    review_analysis = ReviewAnalyzer(product_table).analyze_reviews()
+    delivery_stats = DeliveryAnalyzer(product_table).stats
+
+    report = {
+        "keyword": keyword,
+        "product_count": len(product_table),
+        "price": price_analysis,
+        "review_count": {
+            "basic_stats": review_analysis["basic_stats"],
+            "distribution": review_analysis["distribution"],
+            "top_n": review_analysis["top_n"][
+                ["product_id", "name", "review_count", "rating"]
+            ],
+        },
+        "delivery": delivery_stats,
+        "reviews": None,
+    }
+
+    review_text_analyzer = ReviewTextAnalyzer(reviews_df, max_workers=max_workers)
+    if len(review_text_analyzer.contents):
+        text_analysis = review_text_analyzer.analyze(top_n=top_n)
+        report["reviews"] = {
+            "review_count": text_analysis["review_count"],
+            "sentiment_distribution": text_analysis["sentiment_distribution"],
+            "keywords": text_analysis["keywords"],
+            "tokenizer": text_analysis["tokenizer"],
+        }
+    return to_jsonable(report)
+
+
+def _write_parquet(df, path):
+    """임시 파일에 쓴 뒤 교체 (중간에 실패해도 반쯤 쓰인 리포트가 남지 않도록)"""
+    tmp_path = path + ".tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _write_json(data, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def run_job(job, output_dir, backend, cache_dir=None, max_workers=1, top_n=20):
+    """키워드 작업 1개 실행: 파싱 → 분석 → 리포트 저장, 요약(dict) 반환
+
+    프로세스 풀 워커에서 호출되므로 큰 DataFrame은 워커에서 바로 파일로 쓰고
+    작은 요약만 돌려줍니다. 실패해도 예외 대신 error가 담긴 요약을 반환해
+    다른 키워드 작업은 계속 진행됩니다.
+    """
+    keyword = job["keyword"]
+    file_count = len(job["search_paths"]) + len(job["detail_paths"])
+    summary = {
+        "keyword": keyword,
+        "files": file_count,
+        "products": 0,
+        "reviews": 0,
+        "seconds": 0.0,
+        "output": None,
+        "error": None,
+    }
+    start = time.perf_counter()
+    try:
+        products_df = parse_search_files(
+            job["search_paths"],
+            backend=backend,
+            max_workers=max_workers,
+            cache_dir=cache_dir,
+        )
+        reviews_df = (
+            parse_review_files(
+                job["detail_paths"], max_workers=max_workers, cache_dir=cache_dir
+            )
+            if job["detail_paths"]
+            else None
+        )
+        product_table = ProductTable(products_df)
+        report = build_report(
+            keyword, product_table, reviews_df, top_n=top_n, max_workers=max_workers
+        )
+
+        keyword_dir = os.path.join(output_dir, quote(keyword, safe=""))
+        os.makedirs(keyword_dir, exist_ok=True)
+        _write_parquet(
+            product_table.frame, os.path.join(keyword_dir, "products.parquet")
+        )
+        if reviews_df is not None and not reviews_df.empty:
+            _write_parquet(reviews_df, os.path.join(keyword_dir, "reviews.parquet"))
+        _write_json(report, os.path.join(keyword_dir, "report.json"))
+
+        summary["products"] = len(product_table)
+        summary["reviews"] = 0 if reviews_df is None else len(reviews_df)
+        summary["output"] = keyword_dir
+    except Exception as e:
+        logging.error(f"배치 작업 실패 ({keyword}): {e}", exc_info=True)
+        summary["error"] = f"{type(e).__name__}: {e}"
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def _run_job_task(args):
+    """프로세스 풀 워커: run_job 인자 튜플 풀기"""
+    return run_job(*args)
+
+
+def run_batch(
+    input_dir,
+    output_dir=BATCH_OUTPUT_DIR,
+    backend="lxml-native",
+    max_workers=None,
+    cache_dir=PARSE_CACHE_DIR,
+    top_n=20,
+):
+    """입력 폴더의 모든 키워드 작업을 프로세스 풀로 실행하고 배치 요약 반환
+
+    키워드가 여럿이면 키워드 단위로 프로세스 풀에 나누고(작업 안의 페이지
+    파싱은 워커 안에서 순차), 키워드가 하나뿐이면 그 작업의 페이지 파싱을
+    프로세스 풀로 나눕니다. 중첩 풀을 만들지 않으므로 워커 수를 넘는 프로세스가
+    생기지 않습니다.
+
+    Args:
+        input_dir (str): 키워드 폴더들이 있는 입력 폴더
+        output_dir (str): 리포트 출력 폴더 (없으면 생성)
+        backend (str): CoupangParser 파싱 백엔드
+        max_workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        cache_dir (str): ParseCache 디렉터리 (None이면 캐시 사용 안 함)
+        top_n (int): 리뷰 키워드 상위 개수
+    """
+    start = time.perf_counter()
+    jobs = find_jobs(input_dir)
+    max_workers = max(1, max_workers or os.cpu_count() or 1)
+    job_workers = min(max_workers, len(jobs)) or 1
+    page_workers = 1 if job_workers > 1 else max_workers
+    os.makedirs(output_dir, exist_ok=True)
+    logging.info(
+        f"배치 시작: 키워드 {len(jobs)}개, 키워드 워커 {job_workers}개, "
+        f"페이지 워커 {page_workers}개, 백엔드 {backend}"
+    )
+
+    tasks = [
+        (job, output_dir, backend, cache_dir, page_workers, top_n) for job in jobs
+    ]
+    results = map_pages(_run_job_task, tasks, job_workers) if tasks else []
+
+    elapsed = time.perf_counter() - start
+    succeeded = [result for result in results if result["error"] is None]
+    files = sum(result["files"] for result in succeeded)
+    products = sum(result["products"] for result in succeeded)
+    summary = {
+        "input": os.path.abspath(input_dir),
+        "output": os.path.abspath(output_dir),
+        "backend": backend,
+        "workers": max_workers,
+        "jobs": len(results),
+        "failed": len(results) - len(succeeded),
+        "files": files,
+        "products": products,
+        "reviews": sum(result["reviews"] for result in succeeded),
+        "seconds": elapsed,
+        "files_per_sec": files / elapsed if elapsed else 0.0,
+        "products_per_sec": products / elapsed if elapsed else 0.0,
+        "results": results,
+    }
+    _write_json(to_jsonable(summary), os.path.join(output_dir, SUMMARY_FILE))
+    logging.info(
+        f"배치 완료: 키워드 {len(results)}개 (실패 {summary['failed']}개), "
+        f"파일 {files}개, 상품 {products}개, {elapsed:.2f}s "
+        f"({summary['files_per_sec']:.1f} files/s, "
+        f"{summary['products_per_sec']:.1f} products/s)"
+    )
+    return summary
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("input", help="키워드 폴더들이 있는 입력 폴더")
+    arg_parser.add_argument(
+        "--output", default=BATCH_OUTPUT_DIR, help="리포트 출력 폴더"
+    )
+    arg_parser.add_argument(
+        "--backend",
+        default="lxml-native",
+        choices=PARSER_BACKENDS,
+        help="검색 결과 파싱 백엔드",
+    )
+    arg_parser.add_argument(
+        "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)"
+    )
+    arg_parser.add_argument(
+        "--cache-dir", default=PARSE_CACHE_DIR, help="파싱 캐시 폴더"
+    )
+    arg_parser.add_argument(
+        "--no-cache", action="store_true", help="파싱 캐시를 사용하지 않음"
+    )
+    arg_parser.add_argument("--top-n", type=int, default=20, help="리뷰 키워드 개수")
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    summary = run_batch(
+        args.input,
+        output_dir=args.output,
+        backend=args.backend,
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        top_n=args.top_n,
+    )
+    for result in summary["results"]:
+        status = result["error"] or f"{result['products']}개 상품 → {result['output']}"
+        print(f"{result['keyword']}: {status} ({result['seconds']:.2f}s)")
+    print(
+        f"총 {summary['files']}개 파일, {summary['products']}개 상품, "
+        f"{summary['seconds']:.2f}s "
+        f"({summary['files_per_sec']:.1f} files/s, "
+        f"{summary['products_per_sec']:.1f} products/s)"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+import logging
+import os
+import time
+
+
+class Stage:
+    """파이프라인 단계 (이름, 실행 함수, 선행 단계)"""
+
+    def __init__(self, name, func, deps=(), label=None, weight=1.0, inline=False):
+        """Stage 초기화
+
+        Args:
+            name (str): 단계 이름 (결과 dict의 키, 후속 단계 함수의 인자 이름)
+            func (callable): 선행 단계 결과를 키워드 인자로 받는 함수
+            deps (tuple): 선행 단계 이름
+            label (str): 진행 표시용 이름 (None이면 name)
+            weight (float): 진행률 계산 시 가중치 (예상 소요 시간 비율)
+            inline (bool): 풀 대신 run()을 호출한 스레드에서 실행 (UI를 갱신하는 단계)
+        """
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.label = label or name
+        self.weight = weight
+        self.inline = inline
+
+
+class DagExecutor:
+    """선행 관계를 선언한 단계들을 스레드/프로세스 풀에서 동시에 실행
+
+    선행 단계가 모두 끝난 단계부터 바로 풀에 제출하므로, 서로 독립인 단계
+    (예: 검색 결과 파싱과 상세 페이지 파싱, 가격/리뷰/배송 분석기)는 함께
+    실행되고 전체 시간은 가장 긴 경로(critical path)에 가까워집니다. 단계는
+    add() 순서대로 선언하며 선행 단계는 먼저 추가되어 있어야 하므로 순환이
+    생기지 않습니다.
+    """
+
+    def __init__(self, max_workers=None, use_processes=False, initializer=None):
+        """DagExecutor 초기화
+
+        Args:
+            max_workers (int): 풀 크기 (None이면 min(단계 수, CPU 코어 수 + 4))
+            use_processes (bool): 프로세스 풀 사용 (함수/결과가 pickle 가능해야 함)
+            initializer (callable): 풀 워커 시작 시 호출 (예: 스레드에 실행 문맥 연결)
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.initializer = initializer
+        self.stages = {}
+        self.timings = {}
+
+    def add(self, name, func, deps=(), label=None, weight=1.0, inline=False):
+        """단계 추가 (선행 단계는 이미 추가된 단계여야 함)"""
+        if name in self.stages:
+            raise ValueError(f"이미 추가된 단계입니다: {name}")
+        missing = [dep for dep in deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"'{name}'의 선행 단계가 없습니다: {missing}")
+        self.stages[name] = Stage(name, func, deps, label, weight, inline)
+        return self
+
+    def _pool(self):
+        pool_stages = sum(not stage.inline for stage in self.stages.values())
+        max_workers = self.max_workers or min(
+            max(1, pool_stages), (os.cpu_count() or 1) + 4
+        )
+        pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        return pool_class(max_workers=max_workers, initializer=self.initializer)
+
+    def run(self, on_progress=None):
+        """모든 단계를 실행하고 {단계 이름: 결과} 반환
+
+        on_progress(stage, fraction)는 run()을 호출한 스레드에서 단계가 끝날
+        때마다 호출되며, fraction은 끝난 단계 가중치 합 / 전체 가중치입니다.
+        한 단계라도 실패하면 아직 시작하지 않은 단계는 취소하고 예외를 그대로
+        다시 발생시킵니다.
+        """
+        results = {}
+        remaining = dict(self.stages)
+        total_weight = sum(stage.weight for stage in self.stages.values()) or 1.0
+        done_weight = 0.0
+        started_at = {}
+        running = {}
+        run_start = time.perf_counter()
+
+        def finish(stage, value):
+            nonlocal done_weight
+            results[stage.name] = value
+            self.timings[stage.name] = time.perf_counter() - started_at[stage.name]
+            done_weight += stage.weight
+            if on_progress is not None:
+                on_progress(stage, done_weight / total_weight)
+
+        with self._pool() as pool:
+            try:
+                while remaining or running:
+                    ready = [
+                        stage
+                        for stage in remaining.values()
+                        if all(dep in results for dep in stage.deps)
+                    ]
+                    # 풀 단계를 먼저 제출한 뒤 인라인 단계를 실행해 서로 겹치게 함
+                    for stage in sorted(ready, key=lambda stage: stage.inline):
+                        del remaining[stage.name]
+                        kwargs = {dep: results[dep] for dep in stage.deps}
+                        started_at[stage.name] = time.perf_counter()
+                        if stage.inline:
+                            finish(stage, stage.func(**kwargs))
+                        else:
+                            running[pool.submit(stage.func, **kwargs)] = stage
+                    if any(stage.inline for stage in ready):
+                        # 인라인 단계 결과로 새로 실행 가능한 단계가 생겼을 수 있음
+                        continue
+                    if not running:
+                        continue
+
+                    completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        stage = running.pop(future)
+                        finish(stage, future.result())
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        elapsed = time.perf_counter() - run_start
+        stage_total = sum(self.timings.values())
+        logging.info(
+            f"파이프라인 완료: {len(self.stages)}개 단계, 실제 {elapsed:.3f}s / "
+            f"단계 합계 {stage_total:.3f}s, 단계별 "
+            + ", ".join(f"{name} {t:.3f}s" for name, t in self.timings.items())
+        )
+        return results
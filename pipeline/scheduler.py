@@ -0,0 +1,393 @@
+"""키워드 정기 수집 스케줄러: 수집 → 파싱 → 분석 작업을 영속 큐로 실행
+
+정기 수집 키워드와 작업은 SQLite 작업 큐(storage.job_queue)에 저장되며,
+스케줄러는 제한된 수의 워커로 우선순위가 높은 작업부터 실행합니다.
+
+작업 1개:
+    1. 수집/파싱: PageFetcher로 검색 결과(와 상위 상품 상세) 페이지를 받아 바로 파싱,
+       SnapshotStore에 스냅샷 저장, 리뷰는 ResultStore에 저장 → 체크포인트
+    2. 분석: 프로세스 풀에서 /api/dashboard와 같은 대시보드 JSON을 계산해
+       ResultStore에 저장 (API 서버는 이 결과를 계산 없이 그대로 반환)
+
+같은 키워드의 대기/실행 중 작업은 하나만 유지되고, 스케줄러가 비정상 종료되면
+다음 시작 시(또는 리스 만료 후) 마지막 체크포인트부터 다시 실행합니다.
+
+사용법:
+    python -m pipeline.scheduler add <키워드> [--every 6h] [--pages 2] [--details 5]
+    python -m pipeline.scheduler enqueue <키워드> [--priority 10]
+    python -m pipeline.scheduler remove <키워드>
+    python -m pipeline.scheduler run [--workers 2] [--until-idle] [--rate 1.0]
+    python -m pipeline.scheduler status
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import signal
+import sys
+import time
+
+import pandas as pd
+
+from analyzers.product_table import ProductTable
+from api.service import build_dashboard, encode_payload
+from fetcher.page_fetcher import COUPANG_BASE_URL, VALIDATORS_PATH, PageFetcher
+from parsers.parse_cache import PARSE_CACHE_DIR
+from storage.job_queue import JOB_QUEUE_PATH, JobQueue, worker_id
+from storage.result_store import RESULTS_DIR, ResultStore
+from storage.snapshot_store import SNAPSHOT_DIR, SnapshotStore
+
+DEFAULT_INTERVAL = "6h"
+
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_interval(value):
+    """수집 주기 문자열 (예: "90s", "30m", "6h", "1d", 숫자만 있으면 초) → 초"""
+    value = str(value).strip().lower()
+    unit = _INTERVAL_UNITS.get(value[-1:])
+    number = value[:-1] if unit else value
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise ValueError(f"수집 주기 형식이 잘못되었습니다: {value}")
+    if seconds <= 0:
+        raise ValueError(f"수집 주기는 0보다 커야 합니다: {value}")
+    return seconds
+
+
+def _analyze_task(
+    keyword, snapshot_path, reviews_path, captured_at, store_root, results_root
+):
+    """프로세스 풀 워커: 저장된 스냅샷/리뷰로 대시보드를 계산해 ResultStore에 저장"""
+    store = SnapshotStore(store_root)
+    results = ResultStore(results_root)
+    products_df = store.load_snapshot(snapshot_path)
+    # 스냅샷은 product_id 순으로 저장되므로 검색 순위 순서로 되돌림
+    if "rank" in products_df.columns:
+        products_df = products_df.sort_values("rank", ignore_index=True)
+    products_df = products_df.drop(columns=["captured_at"], errors="ignore")
+    reviews_df = results.load_reviews(reviews_path) if reviews_path else None
+
+    product_table = ProductTable(products_df)
+    body, _ = encode_payload(
+        build_dashboard(keyword, product_table, reviews_df, store, captured_at)
+    )
+    summary = {
+        "keyword": keyword,
+        "captured_at": pd.Timestamp(captured_at).isoformat(),
+        "products": len(product_table),
+        "reviews": 0 if reviews_df is None else len(reviews_df),
+        "snapshot": snapshot_path,
+    }
+    results.save_dashboard(keyword, body, summary)
+    return summary
+
+
+class CrawlScheduler:
+    """작업 큐에서 키워드 작업을 꺼내 제한된 워커로 실행하는 스케줄러"""
+
+    def __init__(
+        self,
+        queue,
+        fetcher,
+        store_root=SNAPSHOT_DIR,
+        results_root=RESULTS_DIR,
+        max_workers=2,
+        analysis_workers=1,
+        poll_interval=1.0,
+        retry_delay=60.0,
+    ):
+        """CrawlScheduler 초기화
+
+        Args:
+            queue (JobQueue): 작업 큐
+            fetcher (PageFetcher): 페이지 수집기 (호스트별 속도 제한은 워커 전체 공유)
+            store_root (str): SnapshotStore 루트
+            results_root (str): ResultStore 루트
+            max_workers (int): 동시에 실행할 작업 수
+            analysis_workers (int): 분석(대시보드 계산) 프로세스 수
+            poll_interval (float): 새 작업/정기 수집 확인 주기 (초)
+            retry_delay (float): 실패한 작업의 첫 재시도 대기 (초, 시도마다 2배)
+        """
+        self.queue = queue
+        self.fetcher = fetcher
+        self.store_root = store_root
+        self.results_root = results_root
+        self.store = SnapshotStore(store_root)
+        self.results = ResultStore(results_root)
+        self.max_workers = max(1, max_workers)
+        self.analysis_workers = max(1, analysis_workers)
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.pool = ProcessPoolExecutor(max_workers=self.analysis_workers)
+        self.completed = 0
+        self.failed = 0
+        self._busy = 0
+        self._stopping = None
+
+    def stop(self):
+        """실행 중인 작업을 큐에 되돌리고 run() 종료"""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self, until_idle=False):
+        """워커를 띄우고 정기 수집을 등록하며 stop()까지 (until_idle이면 큐가 빌 때까지) 실행"""
+        self._stopping = asyncio.Event()
+        recovered = await asyncio.to_thread(self.queue.recover)
+        if recovered:
+            logging.info(f"중단된 작업 {len(recovered)}개를 다시 대기열에 넣었습니다.")
+        workers = [
+            asyncio.create_task(self._worker(worker_id(index)))
+            for index in range(self.max_workers)
+        ]
+        try:
+            while not self._stopping.is_set():
+                created = await asyncio.to_thread(self.queue.enqueue_due)
+                if created:
+                    logging.info(f"정기 수집 작업 {len(created)}개 등록")
+                if until_idle and not self._busy:
+                    counts = await asyncio.to_thread(self.queue.counts)
+                    if not counts.get("queued") and not counts.get("running"):
+                        break
+                await self._sleep(self.poll_interval)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _sleep(self, seconds):
+        """seconds초 대기 (stop()이 호출되면 바로 반환)"""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _worker(self, worker):
+        while not self._stopping.is_set():
+            job = await asyncio.to_thread(self.queue.claim, worker)
+            if job is None:
+                await self._sleep(self.poll_interval)
+                continue
+            await self.run_job(job, worker)
+
+    async def _heartbeat(self, job_id, worker):
+        """리스의 1/3마다 연장"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            if not await asyncio.to_thread(self.queue.heartbeat, job_id, worker):
+                return
+
+    async def run_job(self, job, worker):
+        """작업 1개 실행 (체크포인트가 있으면 그 단계부터)"""
+        job_id, keyword = job["id"], job["keyword"]
+        resumed = " (체크포인트에서 재개)" if job["stage"] else ""
+        logging.info(f"작업 {job_id} 시작: '{keyword}' {job['attempts']}회차{resumed}")
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker))
+        self._busy += 1
+        start = time.perf_counter()
+        try:
+            state = job["state"]
+            if job["stage"] != "analyze":
+                state = await self._crawl(job)
+                # 조건부 요청 검증자는 이벤트 루프에서만 바뀌므로 여기서 저장
+                self.fetcher.validators.save()
+                owned = await asyncio.to_thread(
+                    self.queue.checkpoint, job_id, worker, "analyze", state
+                )
+                if not owned:
+                    return
+            summary = await asyncio.get_running_loop().run_in_executor(
+                self.pool,
+                _analyze_task,
+                keyword,
+                state["snapshot"],
+                state["reviews"],
+                state["captured_at"],
+                self.store_root,
+                self.results_root,
+            )
+            summary["seconds"] = round(time.perf_counter() - start, 3)
+            await asyncio.to_thread(self.queue.complete, job_id, worker, summary)
+            self.completed += 1
+            logging.info(
+                f"작업 {job_id} 완료: '{keyword}' 상품 {summary['products']}개, "
+                f"리뷰 {summary['reviews']}개, {summary['seconds']:.2f}s"
+            )
+        except asyncio.CancelledError:
+            # 종료 요청: 시도 횟수를 되돌려 다음 실행 때 체크포인트부터 재개
+            self.queue.release(job_id, worker)
+            raise
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                logging.error("분석 프로세스 풀이 손상되어 다시 만듭니다.")
+                self.pool = ProcessPoolExecutor(max_workers=self.analysis_workers)
+            logging.error(f"작업 {job_id} 실패 ('{keyword}'): {e}", exc_info=True)
+            self.failed += 1
+            await asyncio.to_thread(
+                self.queue.fail,
+                job_id,
+                worker,
+                f"{type(e).__name__}: {e}",
+                self.retry_delay,
+            )
+        finally:
+            heartbeat.cancel()
+            self._busy -= 1
+
+    async def _crawl(self, job):
+        """검색/상세 페이지 수집 → 스냅샷/리뷰 저장 → 체크포인트 상태(dict)"""
+        keyword = job["keyword"]
+        products_df, _ = await self.fetcher.fetch_search_pages(keyword, job["pages"])
+        if products_df.empty:
+            raise ValueError(f"검색 결과에서 상품을 찾지 못했습니다: {keyword}")
+        captured_at = pd.Timestamp.now()
+
+        reviews_df = None
+        if job["details"]:
+            # 상세 페이지는 상품 번호 단위 (같은 상품의 옵션은 한 번만)
+            product_ids = products_df["product_id"].dropna().drop_duplicates()
+            product_ids = product_ids.head(job["details"])
+            if len(product_ids):
+                reviews_df, _ = await self.fetcher.fetch_reviews(list(product_ids))
+
+        snapshot_path = await asyncio.to_thread(
+            self.store.append, keyword, products_df, captured_at
+        )
+        reviews_path = None
+        if reviews_df is not None and not reviews_df.empty:
+            reviews_path = await asyncio.to_thread(
+                self.results.save_reviews, keyword, reviews_df, captured_at
+            )
+        return {
+            "captured_at": captured_at.isoformat(),
+            "snapshot": snapshot_path,
+            "reviews": reviews_path,
+        }
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def _run(args):
+    queue = JobQueue(args.queue)
+    fetcher = PageFetcher(
+        base_url=args.base_url,
+        rate=args.rate,
+        burst=args.burst,
+        max_per_host=args.per_host,
+        cache_dir=args.cache_dir,
+        validators_path=args.validators,
+    )
+    scheduler = CrawlScheduler(
+        queue,
+        fetcher,
+        store_root=args.store,
+        results_root=args.results,
+        max_workers=args.workers,
+        analysis_workers=args.analysis_workers,
+        poll_interval=args.poll,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, scheduler.stop)
+        except NotImplementedError:  # Windows
+            pass
+    try:
+        await scheduler.run(until_idle=args.until_idle)
+    finally:
+        scheduler.close()
+        fetcher.close()
+    print(f"완료 {scheduler.completed}개, 실패 {scheduler.failed}개, {queue.counts()}")
+
+
+def _print_status(queue):
+    print(f"작업 상태: {queue.counts()}")
+    now = time.time()
+    for schedule in queue.schedules():
+        print(
+            f"  정기 수집 '{schedule['keyword']}': "
+            f"{schedule['interval_seconds'] / 3600:g}시간마다, "
+            f"다음 실행까지 {max(0.0, schedule['next_run'] - now) / 60:.0f}분, "
+            f"우선순위 {schedule['priority']}"
+        )
+    for job in queue.jobs(limit=20):
+        detail = job["error"] or job["result"] or ""
+        print(
+            f"  #{job['id']:<5} {job['status']:<8} p{job['priority']:<3} "
+            f"'{job['keyword']}' 시도 {job['attempts']} {detail}"
+        )
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--queue", default=JOB_QUEUE_PATH, help="작업 큐 SQLite 파일")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="정기 수집 키워드 등록/변경")
+    add.add_argument("keyword")
+    add.add_argument("--every", default=DEFAULT_INTERVAL, help="수집 주기 (예: 30m, 6h)")
+    add.add_argument("--priority", type=int, default=0)
+    add.add_argument("--pages", type=int, default=1, help="검색 결과 페이지 수")
+    add.add_argument("--details", type=int, default=0, help="리뷰를 받을 상위 상품 수")
+
+    enqueue = commands.add_parser("enqueue", help="키워드를 지금 한 번 수집")
+    enqueue.add_argument("keyword")
+    enqueue.add_argument("--priority", type=int, default=10)
+    enqueue.add_argument("--pages", type=int, default=1)
+    enqueue.add_argument("--details", type=int, default=0)
+
+    remove = commands.add_parser("remove", help="정기 수집 키워드 삭제")
+    remove.add_argument("keyword")
+
+    commands.add_parser("status", help="작업/정기 수집 상태")
+
+    run = commands.add_parser("run", help="스케줄러 실행")
+    run.add_argument("--workers", type=int, default=2, help="동시 작업 수")
+    run.add_argument("--analysis-workers", type=int, default=1, help="분석 프로세스 수")
+    run.add_argument("--until-idle", action="store_true", help="큐가 비면 종료")
+    run.add_argument("--poll", type=float, default=1.0, help="큐 확인 주기 (초)")
+    run.add_argument("--base-url", default=COUPANG_BASE_URL)
+    run.add_argument("--rate", type=float, default=1.0, help="호스트별 초당 요청 수")
+    run.add_argument("--burst", type=int, default=1)
+    run.add_argument("--per-host", type=int, default=2, help="호스트별 동시 요청 수")
+    run.add_argument("--store", default=SNAPSHOT_DIR, help="스냅샷 저장소 폴더")
+    run.add_argument("--results", default=RESULTS_DIR, help="분석 결과 폴더")
+    run.add_argument("--cache-dir", default=PARSE_CACHE_DIR, help="파싱 캐시 폴더")
+    run.add_argument("--validators", default=VALIDATORS_PATH, help="검증자 파일")
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    queue = JobQueue(args.queue)
+    if args.command == "add":
+        queue.add_schedule(
+            args.keyword,
+            parse_interval(args.every),
+            priority=args.priority,
+            pages=args.pages,
+            details=args.details,
+        )
+        print(f"정기 수집 등록: '{args.keyword}' ({args.every}마다)")
+    elif args.command == "enqueue":
+        job_id, created = queue.enqueue(
+            args.keyword, priority=args.priority, pages=args.pages, details=args.details
+        )
+        print(f"작업 #{job_id} " + ("등록" if created else "이미 대기/실행 중 (병합)"))
+    elif args.command == "remove":
+        removed = queue.remove_schedule(args.keyword)
+        print(f"정기 수집 삭제: '{args.keyword}'" if removed else "등록되지 않은 키워드")
+    elif args.command == "status":
+        _print_status(queue)
+    else:
+        asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+
+def write_atomic(path, write):
+    """같은 폴더의 임시 파일에 write(f)로 쓴 뒤 교체 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_parquet_atomic(df, path):
+    """DataFrame을 parquet으로 원자적으로 저장"""
+    write_atomic(path, lambda f: df.to_parquet(f, index=False))
@@ -0,0 +1,407 @@
+from contextlib import closing, contextmanager
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+
+JOB_QUEUE_PATH = os.path.join("data", "jobs.sqlite3")
+
+# 작업 상태: queued(대기) → running(실행 중) → done(완료) / failed(최종 실패)
+ACTIVE_STATUSES = ("queued", "running")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    pages INTEGER NOT NULL DEFAULT 1,
+    details INTEGER NOT NULL DEFAULT 0,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    stage TEXT,
+    state TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_after REAL NOT NULL,
+    worker TEXT,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    error TEXT,
+    result TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_active_keyword
+    ON jobs(keyword) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS jobs_ready
+    ON jobs(status, priority DESC, run_after, id);
+CREATE TABLE IF NOT EXISTS schedules (
+    keyword TEXT PRIMARY KEY,
+    interval_seconds REAL NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    pages INTEGER NOT NULL DEFAULT 1,
+    details INTEGER NOT NULL DEFAULT 0,
+    next_run REAL NOT NULL
+);
+"""
+
+
+def worker_id(index=0):
+    """작업 소유자 표시 (호스트:PID:워커 번호)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+def _process_alive(worker):
+    """같은 호스트의 워커 프로세스가 살아 있는지 (다른 호스트면 알 수 없어 True)"""
+    host, _, rest = (worker or "").partition(":")
+    pid = rest.partition(":")[0]
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _row_to_job(row):
+    if row is None:
+        return None
+    job = dict(row)
+    for key in ("state", "result"):
+        job[key] = json.loads(job[key]) if job[key] else None
+    return job
+
+
+class JobQueue:
+    """SQLite 기반 영속 작업 큐 (우선순위, 진행 중 작업 중복 제거, 리스 기반 재개)
+
+    작업 하나는 키워드 하나의 수집 → 파싱 → 분석이며, 같은 키워드의 대기/실행 중
+    작업은 하나만 존재합니다(부분 유니크 인덱스). 워커는 claim()으로 우선순위가
+    높은 작업을 리스와 함께 가져가고 heartbeat()로 연장합니다. 워커가 죽어 리스가
+    만료되거나 같은 호스트의 워커 프로세스가 없어진 작업은 다시 대기 상태가 되며,
+    checkpoint()로 남긴 단계(stage)와 상태(state)부터 이어서 실행합니다.
+
+    모든 변경은 BEGIN IMMEDIATE 트랜잭션으로 처리하므로 여러 프로세스가 같은
+    파일을 함께 써도 같은 작업을 두 번 가져가지 않습니다.
+    """
+
+    def __init__(
+        self, path=JOB_QUEUE_PATH, lease_seconds=300.0, max_attempts=3, timeout=30.0
+    ):
+        """JobQueue 초기화
+
+        Args:
+            path (str): SQLite 파일 경로 (없으면 생성)
+            lease_seconds (float): claim/heartbeat 후 작업을 점유하는 시간 (초)
+            max_attempts (int): 이 횟수만큼 실패하면 최종 실패(failed) 처리
+            timeout (float): 다른 프로세스의 잠금을 기다리는 시간 (초)
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        """호출마다 새 연결 (스레드/프로세스 간 공유하지 않음)"""
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return closing(conn)
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # --- 등록 ---
+
+    def enqueue(self, keyword, priority=0, pages=1, details=0, run_after=None):
+        """작업 등록 → (작업 ID, 새로 만들었는지)
+
+        같은 키워드의 대기/실행 중 작업이 있으면 새로 만들지 않고 그 작업 ID를
+        돌려주며, 대기 중이면 우선순위/페이지 수는 큰 쪽, 실행 시각은 이른 쪽으로
+        합칩니다.
+        """
+        if not keyword:
+            raise ValueError("작업 등록에는 검색 키워드가 필요합니다.")
+        now = time.time()
+        run_after = now if run_after is None else run_after
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, status FROM jobs WHERE keyword = ? "
+                "AND status IN ('queued', 'running')",
+                (keyword,),
+            ).fetchone()
+            if row is not None:
+                if row["status"] == "queued":
+                    conn.execute(
+                        "UPDATE jobs SET priority = MAX(priority, ?), "
+                        "pages = MAX(pages, ?), details = MAX(details, ?), "
+                        "run_after = MIN(run_after, ?), updated_at = ? WHERE id = ?",
+                        (priority, pages, details, run_after, now, row["id"]),
+                    )
+                return row["id"], False
+            cursor = conn.execute(
+                "INSERT INTO jobs (keyword, pages, details, priority, run_after, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (keyword, pages, details, priority, run_after, now, now),
+            )
+            return cursor.lastrowid, True
+
+    def add_schedule(self, keyword, interval_seconds, priority=0, pages=1, details=0):
+        """키워드를 interval_seconds마다 다시 수집하도록 등록 (있으면 갱신)"""
+        if interval_seconds <= 0:
+            raise ValueError(f"수집 주기는 0보다 커야 합니다: {interval_seconds}")
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO schedules (keyword, interval_seconds, priority, pages, "
+                "details, next_run) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(keyword) DO UPDATE SET "
+                "interval_seconds = excluded.interval_seconds, "
+                "priority = excluded.priority, pages = excluded.pages, "
+                "details = excluded.details",
+                (keyword, interval_seconds, priority, pages, details, time.time()),
+            )
+
+    def remove_schedule(self, keyword):
+        with self._transaction() as conn:
+            return conn.execute(
+                "DELETE FROM schedules WHERE keyword = ?", (keyword,)
+            ).rowcount > 0
+
+    def schedules(self):
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM schedules ORDER BY keyword").fetchall()
+        return [dict(row) for row in rows]
+
+    def enqueue_due(self, now=None):
+        """실행 시각이 된 정기 수집을 작업으로 등록하고 새로 만든 작업 ID 목록 반환
+
+        다음 실행 시각은 이전 예정 시각 기준으로 당기되, 오래 멈춰 있었더라도
+        밀린 횟수만큼 몰아서 등록하지 않고 한 번만 등록합니다.
+        """
+        now = time.time() if now is None else now
+        created = []
+        with self._transaction() as conn:
+            due = conn.execute(
+                "SELECT * FROM schedules WHERE next_run <= ?", (now,)
+            ).fetchall()
+            for schedule in due:
+                interval = schedule["interval_seconds"]
+                missed = int((now - schedule["next_run"]) // interval) + 1
+                conn.execute(
+                    "UPDATE schedules SET next_run = ? WHERE keyword = ?",
+                    (schedule["next_run"] + missed * interval, schedule["keyword"]),
+                )
+                active = conn.execute(
+                    "SELECT 1 FROM jobs WHERE keyword = ? "
+                    "AND status IN ('queued', 'running')",
+                    (schedule["keyword"],),
+                ).fetchone()
+                if active is not None:
+                    continue
+                cursor = conn.execute(
+                    "INSERT INTO jobs (keyword, pages, details, priority, run_after, "
+                    "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        schedule["keyword"],
+                        schedule["pages"],
+                        schedule["details"],
+                        schedule["priority"],
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                created.append(cursor.lastrowid)
+        return created
+
+    # --- 실행 ---
+
+    def claim(self, worker):
+        """실행할 수 있는 작업 중 우선순위가 가장 높은 작업을 점유해 반환 (없으면 None)
+
+        리스가 만료된 실행 중 작업은 먼저 대기 상태로 되돌립니다.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._expire_leases(conn, now)
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' AND run_after <= ? "
+                "ORDER BY priority DESC, run_after, id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker, now + self.lease_seconds, now, row["id"]),
+            )
+            return _row_to_job(
+                conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            )
+
+    def _expire_leases(self, conn, now):
+        """리스가 만료된 작업을 대기 상태로 (시도 횟수를 다 쓴 작업은 최종 실패)"""
+        expired = conn.execute(
+            "SELECT id, keyword, attempts, worker FROM jobs "
+            "WHERE status = 'running' AND lease_until < ?",
+            (now,),
+        ).fetchall()
+        for row in expired:
+            self._requeue(conn, row, now, "리스 만료")
+
+    def _requeue(self, conn, row, now, reason):
+        if row["attempts"] >= self.max_attempts:
+            logging.warning(f"작업 {row['id']} ({row['keyword']}) 최종 실패: {reason}")
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', worker = NULL, lease_until = NULL, "
+                "error = ?, updated_at = ? WHERE id = ?",
+                (reason, now, row["id"]),
+            )
+            return
+        logging.warning(
+            f"작업 {row['id']} ({row['keyword']}) 재개 대기: {reason} ({row['worker']})"
+        )
+        conn.execute(
+            "UPDATE jobs SET status = 'queued', worker = NULL, lease_until = NULL, "
+            "run_after = ?, updated_at = ? WHERE id = ?",
+            (now, now, row["id"]),
+        )
+
+    def recover(self):
+        """워커 프로세스가 없어진 실행 중 작업을 리스 만료 전에 바로 대기 상태로
+
+        스케줄러가 비정상 종료 후 다시 시작될 때 호출합니다. 같은 호스트의 작업만
+        프로세스 생존을 확인할 수 있고, 다른 호스트 작업은 리스 만료를 기다립니다.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, keyword, attempts, worker FROM jobs "
+                "WHERE status = 'running'"
+            ).fetchall()
+            dead = [row for row in rows if not _process_alive(row["worker"])]
+            for row in dead:
+                self._requeue(conn, row, now, "워커 프로세스 종료")
+        return [row["id"] for row in dead]
+
+    def _update_owned(self, job_id, worker, assignments, params):
+        """worker가 아직 점유 중인 작업만 갱신 (리스를 뺏긴 워커의 늦은 갱신 무시)"""
+        now = time.time()
+        with self._transaction() as conn:
+            updated = conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (*params, now, job_id, worker),
+            ).rowcount
+        if not updated:
+            logging.warning(f"작업 {job_id}의 점유가 풀려 갱신하지 않습니다 ({worker})")
+        return updated > 0
+
+    def heartbeat(self, job_id, worker):
+        """리스 연장 (점유를 잃었으면 False)"""
+        return self._update_owned(
+            job_id, worker, "lease_until = ?", (time.time() + self.lease_seconds,)
+        )
+
+    def checkpoint(self, job_id, worker, stage, state):
+        """다음에 실행할 단계와 그때까지의 결과(JSON) 기록"""
+        return self._update_owned(
+            job_id,
+            worker,
+            "stage = ?, state = ?, lease_until = ?",
+            (stage, json.dumps(state), time.time() + self.lease_seconds),
+        )
+
+    def complete(self, job_id, worker, result=None):
+        return self._update_owned(
+            job_id,
+            worker,
+            "status = 'done', lease_until = NULL, error = NULL, result = ?",
+            (json.dumps(result),),
+        )
+
+    def fail(self, job_id, worker, error, retry_delay=60.0):
+        """실패 기록 후 시도 횟수가 남았으면 retry_delay × 2^(시도-1)초 뒤 재시도"""
+        job = self.get(job_id)
+        if job is None:
+            return False
+        if job["attempts"] >= self.max_attempts:
+            return self._update_owned(
+                job_id,
+                worker,
+                "status = 'failed', worker = NULL, lease_until = NULL, error = ?",
+                (error,),
+            )
+        delay = retry_delay * 2 ** (job["attempts"] - 1)
+        return self._update_owned(
+            job_id,
+            worker,
+            "status = 'queued', worker = NULL, lease_until = NULL, error = ?, "
+            "run_after = ?",
+            (error, time.time() + delay),
+        )
+
+    def release(self, job_id, worker):
+        """종료 요청으로 멈춘 작업을 시도 횟수를 되돌려 바로 대기 상태로"""
+        return self._update_owned(
+            job_id,
+            worker,
+            "status = 'queued', worker = NULL, lease_until = NULL, "
+            "attempts = MAX(attempts - 1, 0), run_after = ?",
+            (time.time(),),
+        )
+
+    # --- 조회 ---
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row)
+
+    def jobs(self, status=None, limit=100):
+        """최근 작업 목록 (status가 주어지면 해당 상태만)"""
+        query = "SELECT * FROM jobs"
+        params = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def counts(self):
+        """상태별 작업 수"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+    def next_wakeup(self):
+        """다음 대기 작업/정기 수집 실행 시각 (epoch 초, 없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(t) AS t FROM ("
+                "SELECT MIN(run_after) AS t FROM jobs WHERE status = 'queued' "
+                "UNION ALL SELECT MIN(next_run) FROM schedules)"
+            ).fetchone()
+        return row["t"]
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from storage.atomic import write_atomic
+
+RESULTS_DIR = os.path.join("data", "results")
+
+_DASHBOARD_FILE = "dashboard.json"
+_SUMMARY_FILE = "summary.json"
+_FILE_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+class ResultStore:
+    """스케줄러가 미리 계산한 키워드별 분석 결과 저장소
+
+    레이아웃:
+        <root>/keyword=<키워드>/dashboard.json   최신 /api/dashboard 응답 JSON
+        <root>/keyword=<키워드>/summary.json     최신 수집 요약 (수집 시각, 상품/리뷰 수)
+        <root>/keyword=<키워드>/reviews/<수집시각>.parquet   수집한 리뷰
+
+    결과 파일은 임시 파일에 쓴 뒤 교체하므로 대시보드는 계산 중에도 항상 완성된
+    이전 결과를 읽습니다. 같은 수집 시각으로 다시 저장해도 같은 파일을 덮어쓰므로
+    재시도/재개된 작업이 결과를 중복으로 남기지 않습니다.
+    """
+
+    def __init__(self, root=RESULTS_DIR):
+        """ResultStore 초기화
+
+        Args:
+            root (str): 결과 루트 디렉터리 (없으면 생성)
+        """
+        self.root = root
+        self._lock = threading.Lock()
+        self._memo = {}  # 경로 → (mtime_ns, 크기, 본문, ETag)
+        os.makedirs(root, exist_ok=True)
+
+    def _keyword_dir(self, keyword):
+        return os.path.join(self.root, "keyword=" + quote(keyword, safe=""))
+
+    # --- 쓰기 ---
+
+    def save_reviews(self, keyword, reviews_df, captured_at):
+        """수집한 리뷰를 수집 시각 파일로 저장하고 경로 반환"""
+        reviews_dir = os.path.join(self._keyword_dir(keyword), "reviews")
+        os.makedirs(reviews_dir, exist_ok=True)
+        file_name = pd.Timestamp(captured_at).strftime(_FILE_TIME_FORMAT)
+        path = os.path.join(reviews_dir, file_name + ".parquet")
+        write_atomic(path, lambda f: reviews_df.to_parquet(f, index=False))
+        return path
+
+    def save_dashboard(self, keyword, body, summary):
+        """대시보드 응답 JSON(bytes)과 수집 요약(dict) 저장"""
+        keyword_dir = self._keyword_dir(keyword)
+        os.makedirs(keyword_dir, exist_ok=True)
+        write_atomic(
+            os.path.join(keyword_dir, _DASHBOARD_FILE), lambda f: f.write(body)
+        )
+        summary_body = json.dumps(summary, ensure_ascii=False).encode("utf-8")
+        write_atomic(
+            os.path.join(keyword_dir, _SUMMARY_FILE), lambda f: f.write(summary_body)
+        )
+
+    # --- 조회 ---
+
+    def keywords(self):
+        """결과가 있는 키워드 목록"""
+        return sorted(
+            unquote(name[len("keyword=") :])
+            for name in os.listdir(self.root)
+            if name.startswith("keyword=")
+            and os.path.exists(os.path.join(self.root, name, _DASHBOARD_FILE))
+        )
+
+    def load_reviews(self, path):
+        return pd.read_parquet(path)
+
+    def dashboard(self, keyword):
+        """(대시보드 JSON bytes, ETag) (없으면 None)
+
+        파일 수정 시각/크기가 그대로면 이전에 읽은 내용을 재사용합니다.
+        """
+        path = os.path.join(self._keyword_dir(keyword), _DASHBOARD_FILE)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            memo = self._memo.get(path)
+        if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+            return memo[2], memo[3]
+        with open(path, "rb") as f:
+            body = f.read()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        with self._lock:
+            self._memo[path] = (stat.st_mtime_ns, stat.st_size, body, etag)
+        return body, etag
+
+    def summary(self, keyword):
+        """최신 수집 요약 (없으면 None)"""
+        path = os.path.join(self._keyword_dir(keyword), _SUMMARY_FILE)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
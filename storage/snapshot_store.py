@@ -0,0 +1,273 @@
+import logging
+import os
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from storage.atomic import write_parquet_atomic
+
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+_INDEX_DIR = "_index"
+_INDEX_COLUMNS = ["product_id", "capture_date", "captured_at", "file"]
+_FILE_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+class SnapshotStore:
+    """검색 결과 스냅샷 저장소 (append-only, 키워드/수집일 파티션, Parquet)
+
+    레이아웃:
+        <root>/keyword=<키워드>/date=<YYYY-MM-DD>/<수집시각>.parquet
+        <root>/keyword=<키워드>/_index/<수집시각>.parquet
+
+    스냅샷 파일은 한 번 쓰면 수정하지 않고, 파일 안의 행은 product_id 순으로
+    정렬해 저장합니다. 스냅샷마다 (product_id, 수집일, 수집시각, 파일) 인덱스
+    조각을 하나씩 새로 쓰므로(기존 인덱스를 읽어 다시 쓰지 않음) 저장 비용이
+    이력 길이와 무관하고, 여러 프로세스가 같은 키워드에 동시에 저장해도 인덱스
+    항목이 사라지지 않습니다. 상품별 이력 조회 시에는 인덱스 조각들을 하나의
+    데이터셋으로 읽어 해당 상품이 들어 있는 파티션 파일만 읽습니다.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        """SnapshotStore 초기화
+
+        Args:
+            root (str): 스냅샷 루트 디렉터리 (없으면 생성)
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    # --- 경로 ---
+
+    def _keyword_dir(self, keyword):
+        return os.path.join(self.root, "keyword=" + quote(keyword, safe=""))
+
+    def _index_dir(self, keyword):
+        return os.path.join(self._keyword_dir(keyword), _INDEX_DIR)
+
+    # --- 쓰기 ---
+
+    def append(self, keyword, products_df, captured_at=None):
+        """파싱된 검색 결과를 새 스냅샷으로 저장하고 파일 경로 반환
+
+        Args:
+            keyword (str): 검색 키워드 (파티션 키)
+            products_df (pd.DataFrame): CoupangParser로 파싱한 상품 데이터
+            captured_at (pd.Timestamp): 수집 시각 (None이면 현재 시각)
+        """
+        if not keyword:
+            raise ValueError("스냅샷 저장에는 검색 키워드가 필요합니다.")
+        captured_at = pd.Timestamp.now() if captured_at is None else captured_at
+        captured_at = pd.Timestamp(captured_at)
+        capture_date = captured_at.strftime("%Y-%m-%d")
+
+        partition_dir = os.path.join(
+            self._keyword_dir(keyword), f"date={capture_date}"
+        )
+        os.makedirs(partition_dir, exist_ok=True)
+        path = os.path.join(
+            partition_dir, captured_at.strftime(_FILE_TIME_FORMAT) + ".parquet"
+        )
+
+        snapshot_df = products_df.assign(captured_at=captured_at)
+        key = "listing_id" if "listing_id" in snapshot_df.columns else "product_id"
+        if key in snapshot_df.columns:
+            # 같은 옵션이 여러 번 노출되면(광고/일반) 가장 높은 순위(첫 등장)만 남김
+            duplicated = snapshot_df[key].notna() & snapshot_df.duplicated(
+                subset=key, keep="first"
+            )
+            snapshot_df = snapshot_df[~duplicated]
+        if "product_id" in snapshot_df.columns:
+            # product_id 순 정렬: row group 통계로 필터 시 읽을 구간이 좁아짐
+            snapshot_df = snapshot_df.sort_values(
+                "product_id", kind="stable", na_position="last"
+            )
+        write_parquet_atomic(snapshot_df, path)
+
+        relative = os.path.relpath(path, self._keyword_dir(keyword))
+        self._write_index(keyword, snapshot_df, capture_date, captured_at, relative)
+        logging.info(f"스냅샷 저장: '{keyword}' {len(snapshot_df)}개 상품 → {path}")
+        return path
+
+    def _write_index(self, keyword, snapshot_df, capture_date, captured_at, file):
+        """새 스냅샷의 product_id 인덱스 조각 저장 (기존 조각은 건드리지 않음)"""
+        if "product_id" not in snapshot_df.columns:
+            return
+        product_ids = snapshot_df["product_id"].dropna().unique()
+        entries = pd.DataFrame(
+            {
+                "product_id": product_ids,
+                "capture_date": capture_date,
+                "captured_at": captured_at,
+                "file": file,
+            },
+            columns=_INDEX_COLUMNS,
+        )
+        index_dir = self._index_dir(keyword)
+        os.makedirs(index_dir, exist_ok=True)
+        name = os.path.basename(file)
+        write_parquet_atomic(entries, os.path.join(index_dir, name))
+
+    # --- 조회 ---
+
+    def keywords(self):
+        """저장된 키워드 목록"""
+        return sorted(
+            unquote(name[len("keyword=") :])
+            for name in os.listdir(self.root)
+            if name.startswith("keyword=")
+        )
+
+    def list_snapshots(self, keyword, start=None, end=None):
+        """키워드의 스냅샷 목록 (captured_at, capture_date, path), 수집 시각 순
+
+        start/end(날짜)가 주어지면 해당 기간의 파티션 디렉터리만 탐색합니다.
+        """
+        keyword_dir = self._keyword_dir(keyword)
+        rows = []
+        if os.path.isdir(keyword_dir):
+            for partition in os.listdir(keyword_dir):
+                if not partition.startswith("date="):
+                    continue
+                capture_date = partition[len("date=") :]
+                if not _in_range(capture_date, start, end):
+                    continue
+                partition_dir = os.path.join(keyword_dir, partition)
+                for name in os.listdir(partition_dir):
+                    if not name.endswith(".parquet"):
+                        continue
+                    rows.append(
+                        {
+                            "captured_at": pd.to_datetime(
+                                name[: -len(".parquet")], format=_FILE_TIME_FORMAT
+                            ),
+                            "capture_date": capture_date,
+                            "path": os.path.join(partition_dir, name),
+                        }
+                    )
+        snapshots = pd.DataFrame(rows, columns=["captured_at", "capture_date", "path"])
+        return snapshots.sort_values("captured_at", ignore_index=True)
+
+    def version(self, keyword):
+        """키워드 스냅샷 파일 목록 (스냅샷이 추가되면 바뀌는 캐시 키용 값)
+
+        list_snapshots와 달리 DataFrame을 만들거나 수집 시각을 해석하지 않고
+        파티션 디렉터리의 파일 이름만 모읍니다.
+        """
+        keyword_dir = self._keyword_dir(keyword)
+        if not os.path.isdir(keyword_dir):
+            return ()
+        files = []
+        with os.scandir(keyword_dir) as partitions:
+            for partition in partitions:
+                if not partition.name.startswith("date=") or not partition.is_dir():
+                    continue
+                files.extend(
+                    partition.name + "/" + name
+                    for name in os.listdir(partition.path)
+                    if name.endswith(".parquet")
+                )
+        return tuple(sorted(files))
+
+    def load_snapshot(self, path, columns=None):
+        """스냅샷 파일 1개 로드"""
+        return pd.read_parquet(path, columns=columns)
+
+    def latest(self, keyword, before=None, columns=None):
+        """가장 최근 스냅샷 (before가 주어지면 그 이전 중 가장 최근). 없으면 None"""
+        snapshots = self.list_snapshots(keyword)
+        if before is not None:
+            snapshots = snapshots[snapshots["captured_at"] < pd.Timestamp(before)]
+        if snapshots.empty:
+            return None
+        return self.load_snapshot(snapshots["path"].iloc[-1], columns=columns)
+
+    def product_history(
+        self,
+        keyword,
+        product_ids,
+        columns=("price", "review_count"),
+        start=None,
+        end=None,
+    ):
+        """상품별 시계열 (product_id, listing_id, captured_at, columns...)
+
+        product_id 인덱스로 해당 상품이 들어 있는 스냅샷 파일만 골라, 필요한
+        컬럼과 상품 행만 읽습니다. 옵션이 여러 개인 상품은 listing_id별로 따로
+        이어지도록 (product_id, listing_id, 수집 시각) 순으로 정렬합니다.
+        """
+        product_ids = list(product_ids)
+        read_columns = ["product_id", "listing_id", "captured_at", *columns]
+        entries = self._read_index(keyword, product_ids) if product_ids else None
+        if entries is None:
+            return pd.DataFrame(columns=read_columns)
+
+        in_range = [_in_range(d, start, end) for d in entries["capture_date"]]
+        files = entries.loc[in_range, "file"].unique()
+
+        keyword_dir = self._keyword_dir(keyword)
+        frames = []
+        for file in files:
+            path = os.path.join(keyword_dir, file)
+            # listing_id가 없는 스냅샷(옵션 구분 없이 저장된 데이터)은 빼고 읽음
+            file_columns = [
+                c for c in read_columns if c != "listing_id" or _has_column(path, c)
+            ]
+            frames.append(
+                pd.read_parquet(
+                    path,
+                    columns=file_columns,
+                    filters=[("product_id", "in", product_ids)],
+                )
+            )
+        if not frames:
+            return pd.DataFrame(columns=read_columns)
+        history = pd.concat(frames, ignore_index=True)
+        sort_columns = [c for c in read_columns[:3] if c in history.columns]
+        return history.sort_values(sort_columns, ignore_index=True)
+
+    def history_frame(self, keyword, columns=("review_count",), start=None, end=None):
+        """기간 내 모든 스냅샷의 (product_id, captured_at, columns...) 결합
+
+        SalesEstimator의 history_df처럼 키워드 전체 이력이 필요할 때 사용하며,
+        기간 밖 파티션과 요청하지 않은 컬럼은 읽지 않습니다.
+        """
+        read_columns = ["product_id", "captured_at", *columns]
+        paths = self.list_snapshots(keyword, start=start, end=end)["path"]
+        frames = [self.load_snapshot(path, columns=read_columns) for path in paths]
+        if not frames:
+            return pd.DataFrame(columns=read_columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def _read_index(self, keyword, product_ids=None):
+        """키워드의 인덱스 조각을 하나의 데이터셋으로 읽기 (없으면 None)
+
+        product_ids가 주어지면 해당 상품의 항목만 읽습니다.
+        """
+        index_dir = self._index_dir(keyword)
+        if not os.path.isdir(index_dir):
+            return None
+        paths = [
+            os.path.join(index_dir, name)
+            for name in sorted(os.listdir(index_dir))
+            if name.endswith(".parquet")
+        ]
+        if not paths:
+            return None
+        filters = None if product_ids is None else [("product_id", "in", product_ids)]
+        return pd.read_parquet(paths, columns=_INDEX_COLUMNS, filters=filters)
+
+
+def _has_column(path, column):
+    """Parquet 파일 스키마에 column이 있는지 (데이터는 읽지 않음)"""
+    return column in pq.read_schema(path).names
+
+
+def _in_range(capture_date, start, end):
+    """YYYY-MM-DD 문자열이 [start, end] 기간 안인지 (경계 None은 제한 없음)"""
+    if start is not None and capture_date < pd.Timestamp(start).strftime("%Y-%m-%d"):
+        return False
+    if end is not None and capture_date > pd.Timestamp(end).strftime("%Y-%m-%d"):
+        return False
+    return True
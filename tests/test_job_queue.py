@@ -0,0 +1,106 @@
+import pytest
+
+from storage import job_queue
+from storage.job_queue import JobQueue
+
+LEASE_SECONDS = 60.0
+
+
+class FakeClock:
+    """job_queue 모듈의 time 대역 (time()만 제공, advance로 시간 이동)"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(job_queue, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"), lease_seconds=LEASE_SECONDS)
+
+
+def test_enqueue_merges_active_keyword(queue):
+    job_id, created = queue.enqueue("키워드", priority=1, pages=1)
+    same_id, created_again = queue.enqueue("키워드", priority=3, pages=2)
+
+    assert created and not created_again
+    assert same_id == job_id
+    job = queue.get(job_id)
+    assert (job["priority"], job["pages"]) == (3, 2)
+
+
+def test_claim_orders_by_priority(queue):
+    queue.enqueue("낮음", priority=0)
+    queue.enqueue("높음", priority=5)
+
+    assert queue.claim("w1")["keyword"] == "높음"
+    assert queue.claim("w1")["keyword"] == "낮음"
+    assert queue.claim("w1") is None
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    """리스가 만료된 작업은 다른 워커가 체크포인트와 함께 다시 가져감"""
+    job_id, _ = queue.enqueue("키워드")
+    job = queue.claim("w1")
+    assert queue.checkpoint(job_id, "w1", "analyze", {"pages": 2})
+    assert queue.claim("w2") is None
+
+    clock.advance(LEASE_SECONDS + 1)
+    reclaimed = queue.claim("w2")
+
+    assert reclaimed["id"] == job["id"]
+    assert reclaimed["worker"] == "w2"
+    assert reclaimed["attempts"] == 2
+    assert (reclaimed["stage"], reclaimed["state"]) == ("analyze", {"pages": 2})
+
+
+def test_stale_worker_cannot_update(queue, clock):
+    """리스를 뺏긴 워커의 늦은 heartbeat/완료는 무시"""
+    job_id, _ = queue.enqueue("키워드")
+    queue.claim("w1")
+    clock.advance(LEASE_SECONDS + 1)
+    queue.claim("w2")
+
+    assert not queue.heartbeat(job_id, "w1")
+    assert not queue.complete(job_id, "w1")
+    assert queue.complete(job_id, "w2", {"products": 1})
+    assert queue.get(job_id)["status"] == "done"
+
+
+def test_heartbeat_extends_lease(queue, clock):
+    job_id, _ = queue.enqueue("키워드")
+    queue.claim("w1")
+    for _ in range(3):
+        clock.advance(LEASE_SECONDS * 0.75)
+        assert queue.heartbeat(job_id, "w1")
+
+    # 처음 리스 기준으로는 만료됐지만 마지막 heartbeat 기준으로는 유효
+    assert queue.claim("w2") is None
+    clock.advance(LEASE_SECONDS + 1)
+    assert queue.claim("w2")["id"] == job_id
+
+
+def test_expired_lease_fails_after_max_attempts(tmp_path, clock):
+    queue = JobQueue(
+        str(tmp_path / "jobs.sqlite3"), lease_seconds=LEASE_SECONDS, max_attempts=1
+    )
+    job_id, _ = queue.enqueue("키워드")
+    queue.claim("w1")
+    clock.advance(LEASE_SECONDS + 1)
+
+    assert queue.claim("w2") is None
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "리스 만료"
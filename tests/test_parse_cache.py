@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+
+from parsers.parse_cache import ParseCache
+
+
+def _products(product_id):
+    return pd.DataFrame({"product_id": [product_id], "price": [1000]})
+
+
+def _set_mtime(cache, kind, digest, mtime):
+    os.utime(cache._path(kind, digest), (mtime, mtime))
+
+
+def test_get_miss_then_hit(tmp_path):
+    """저장 전에는 미스, 저장 후에는 같은 DataFrame으로 히트"""
+    cache = ParseCache(str(tmp_path))
+    digest = ParseCache.content_hash("<html>1</html>")
+
+    assert cache.get("search", digest) is None
+    cache.put("search", digest, _products("1"))
+    cached = cache.get("search", digest)
+
+    pd.testing.assert_frame_equal(cached, _products("1"))
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_or_parse_parses_once(tmp_path):
+    """같은 HTML은 한 번만 파싱"""
+    cache = ParseCache(str(tmp_path))
+    calls = []
+
+    def parse(html_content):
+        calls.append(html_content)
+        return _products("1")
+
+    first = cache.get_or_parse("search", "<html>1</html>", parse)
+    second = cache.get_or_parse("search", "<html>1</html>", parse)
+
+    assert calls == ["<html>1</html>"]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_kind_is_part_of_key(tmp_path):
+    """같은 HTML이라도 종류(kind)가 다르면 다른 항목"""
+    cache = ParseCache(str(tmp_path))
+    digest = ParseCache.content_hash("<html>1</html>")
+    cache.put("search", digest, _products("1"))
+
+    assert cache.get("detail", digest) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """항목 수 한도를 넘으면 가장 오래 쓰지 않은 파일부터 제거"""
+    cache = ParseCache(str(tmp_path), max_entries=2)
+    a, b, c = (ParseCache.content_hash(html) for html in ("a", "b", "c"))
+    cache.put("search", a, _products("a"))
+    cache.put("search", b, _products("b"))
+    _set_mtime(cache, "search", a, 1_000)
+    _set_mtime(cache, "search", b, 2_000)
+    # a를 읽으면 최근 사용 시각이 갱신되어 b가 가장 오래된 항목이 됨
+    assert cache.get("search", a) is not None
+
+    cache.put("search", c, _products("c"))
+
+    assert cache.stats()["entries"] == 2
+    assert cache.get("search", b) is None
+    assert cache.get("search", a) is not None
+    assert cache.get("search", c) is not None
+
+
+def test_evicts_over_byte_limit(tmp_path):
+    """전체 크기 한도를 넘으면 한도 안에 들 때까지 오래된 파일부터 제거"""
+    a, b = (ParseCache.content_hash(html) for html in ("a", "b"))
+    ParseCache(str(tmp_path)).put("search", a, _products("a"))
+    size = ParseCache(str(tmp_path)).stats()["bytes"]
+    cache = ParseCache(str(tmp_path), max_bytes=size * 3 // 2)
+    _set_mtime(cache, "search", a, 1_000)
+
+    cache.put("search", b, _products("b"))
+
+    assert cache.stats()["entries"] == 1
+    assert cache.get("search", a) is None
+    assert cache.get("search", b) is not None
+
+
+def test_clear_removes_entries(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    cache.put("search", ParseCache.content_hash("a"), _products("a"))
+
+    cache.clear()
+
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,83 @@
+import os
+
+import pandas as pd
+
+from parsers.search_pages import merge_search_pages, parse_search_files
+
+DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs")
+
+
+def _page(rows):
+    return pd.DataFrame(rows, columns=["product_id", "listing_id", "name"])
+
+
+def test_merge_keeps_first_listing_across_pages():
+    """페이지 간 같은 listing_id는 가장 높은 순위(첫 등장)만 남김"""
+    page1 = _page([("1", "1-a", "첫 옵션"), ("2", "2-a", "둘째")])
+    page2 = _page([("1", "1-a", "광고 재노출"), ("3", "3-a", "셋째")])
+
+    merged = merge_search_pages([page1, page2])
+
+    assert merged["listing_id"].tolist() == ["1-a", "2-a", "3-a"]
+    assert merged["name"].tolist() == ["첫 옵션", "둘째", "셋째"]
+    assert merged["rank"].tolist() == [1, 2, 4]
+    assert merged["page"].tolist() == [1, 1, 2]
+
+
+def test_merge_accepts_iterator():
+    """페이지 DataFrame을 차례로 내놓는 제너레이터도 병합"""
+    pages = iter([_page([("1", "1-a", "a")]), _page([("2", "2-a", "b")])])
+
+    merged = merge_search_pages(pages)
+
+    assert merged["page"].tolist() == [1, 2]
+
+
+def test_merge_keeps_options_of_same_product():
+    """같은 product_id라도 listing_id(옵션)가 다르면 모두 유지"""
+    page1 = _page([("1", "1-a", "옵션 A"), ("1", "1-b", "옵션 B")])
+
+    merged = merge_search_pages([page1])
+
+    assert merged["listing_id"].tolist() == ["1-a", "1-b"]
+    assert merged["product_id"].tolist() == ["1", "1"]
+
+
+def test_merge_keeps_rows_without_listing_id():
+    """listing_id가 없는 행은 중복 제거 대상에서 제외"""
+    page1 = _page([("1", None, "식별 불가 1"), ("2", None, "식별 불가 2")])
+
+    merged = merge_search_pages([page1, page1])
+
+    assert len(merged) == 4
+
+
+def test_merge_falls_back_to_product_id():
+    """listing_id 컬럼이 없으면 product_id로 중복 제거"""
+    page1 = pd.DataFrame({"product_id": ["1", "2"], "name": ["a", "b"]})
+    page2 = pd.DataFrame({"product_id": ["2", "3"], "name": ["b", "c"]})
+
+    merged = merge_search_pages([page1, page2])
+
+    assert merged["product_id"].tolist() == ["1", "2", "3"]
+
+
+def test_merge_skips_empty_pages():
+    page1 = _page([("1", "1-a", "a")])
+
+    merged = merge_search_pages([pd.DataFrame(), None, page1])
+
+    assert merged["page"].tolist() == [3]
+    assert merged["rank"].tolist() == [1]
+    assert merge_search_pages([None]).empty
+
+
+def test_fixture_listings_are_unique():
+    """픽스처의 광고/일반 중복 노출은 제거되고 listing_id는 유일"""
+    merged = parse_search_files([os.path.join(DOCS_DIR, "coupang.html")], max_workers=1)
+
+    assert len(merged) > 0
+    assert merged["listing_id"].is_unique
+    assert merged["rank"].is_monotonic_increasing
+    # 제거된 중복 노출만큼 마지막 순위가 상품 수보다 큼
+    assert merged["rank"].iloc[-1] > len(merged)
@@ -0,0 +1,103 @@
+import pandas as pd
+
+from analyzers.snapshot_diff import SnapshotDiff, diff_key, summary_stats
+
+
+def _snapshot(rows):
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "product_id",
+            "listing_id",
+            "name",
+            "price",
+            "review_count",
+            "is_rocket",
+        ],
+    )
+
+
+OLD = _snapshot(
+    [
+        ("1", "1-a", "옵션 A", 10_000, 10, True),
+        ("1", "1-b", "옵션 B", 12_000, 5, True),
+        ("2", "2-a", "사라질 상품", 5_000, 3, False),
+    ]
+)
+NEW = _snapshot(
+    [
+        # 같은 상품 번호의 옵션 순서가 바뀌어도 옵션끼리만 비교
+        ("1", "1-b", "옵션 B", 12_000, 8, True),
+        ("1", "1-a", "옵션 A", 9_000, 10, True),
+        ("3", "3-a", "새 상품", 7_000, 0, False),
+    ]
+)
+
+
+def test_diff_key_prefers_listing_id():
+    assert diff_key(OLD, NEW) == "listing_id"
+    assert diff_key(OLD.drop(columns="listing_id"), NEW) == "product_id"
+
+
+def test_appeared_and_disappeared():
+    diff = SnapshotDiff(OLD, NEW)
+
+    assert diff.appeared()["listing_id"].tolist() == ["3-a"]
+    assert diff.disappeared()["listing_id"].tolist() == ["2-a"]
+
+
+def test_price_and_review_changes_match_options():
+    """옵션 순서가 바뀐 것은 변경이 아니고 실제 바뀐 값만 잡힘"""
+    diff = SnapshotDiff(OLD, NEW)
+
+    prices = diff.price_changes()
+    assert prices["listing_id"].tolist() == ["1-a"]
+    assert prices[["old_price", "new_price"]].values.tolist() == [[10_000, 9_000]]
+    assert prices["change_pct"].tolist() == [-10.0]
+
+    gains = diff.review_gains()
+    assert gains["listing_id"].tolist() == ["1-b"]
+    assert gains["gain"].tolist() == [3]
+
+    assert diff.summary() == {
+        "appeared": 1,
+        "disappeared": 1,
+        "price_changed": 1,
+        "review_gained": 1,
+        "review_gain_total": 3,
+    }
+
+
+def test_field_changes_long_format():
+    changes = SnapshotDiff(OLD, NEW).field_changes()
+
+    assert sorted(zip(changes["listing_id"], changes["field"])) == [
+        ("1-a", "price"),
+        ("1-b", "review_count"),
+    ]
+    assert changes.set_index("field").loc["price", "delta"] == -1_000
+
+
+def test_identical_snapshots_have_no_changes():
+    diff = SnapshotDiff(OLD, OLD.iloc[::-1])
+
+    assert diff.field_changes().empty
+    assert diff.price_changes().empty
+    assert diff.summary()["appeared"] == 0
+    assert diff.summary()["disappeared"] == 0
+
+
+def test_duplicate_listings_keep_first():
+    """한 스냅샷 안의 중복 listing_id는 첫 등장(가장 높은 순위)만 비교"""
+    duplicated = pd.concat([NEW, NEW.iloc[[1]].assign(price=1)], ignore_index=True)
+
+    diff = SnapshotDiff(OLD, duplicated)
+
+    assert diff.price_changes()["new_price"].tolist() == [9_000]
+
+
+def test_update_stats_matches_recomputed_stats():
+    """이전 합계를 변경 행만으로 갱신한 값 = 현재 스냅샷에서 다시 계산한 값"""
+    diff = SnapshotDiff(OLD, NEW)
+
+    assert diff.update_stats(summary_stats(OLD)) == summary_stats(NEW)
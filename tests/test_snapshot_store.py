@@ -0,0 +1,71 @@
+import pandas as pd
+
+from storage.snapshot_store import SnapshotStore
+
+
+def _products(rows):
+    return pd.DataFrame(
+        rows, columns=["product_id", "listing_id", "price", "review_count"]
+    )
+
+
+def test_product_history_separates_options(tmp_path):
+    """옵션이 두 개인 상품은 listing_id별 시계열로 구분"""
+    store = SnapshotStore(str(tmp_path))
+    store.append(
+        "키워드",
+        _products([("1", "1-a", 1_000, 3), ("1", "1-b", 5_000, 1), ("2", "2-a", 7, 0)]),
+        captured_at="2024-01-01 09:00",
+    )
+    store.append(
+        "키워드",
+        _products([("1", "1-b", 5_000, 2), ("1", "1-a", 1_100, 4)]),
+        captured_at="2024-01-02 09:00",
+    )
+
+    history = store.product_history("키워드", ["1"])
+
+    assert history["listing_id"].tolist() == ["1-a", "1-a", "1-b", "1-b"]
+    assert history["price"].tolist() == [1_000, 1_100, 5_000, 5_000]
+    assert history["captured_at"].tolist() == [
+        pd.Timestamp("2024-01-01 09:00"),
+        pd.Timestamp("2024-01-02 09:00"),
+    ] * 2
+
+
+def test_product_history_date_range(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    for day, price in (("2024-01-01", 1_000), ("2024-02-01", 900)):
+        store.append("키워드", _products([("1", "1-a", price, 0)]), captured_at=day)
+
+    history = store.product_history("키워드", ["1"], start="2024-01-15")
+
+    assert history["price"].tolist() == [900]
+
+
+def test_product_history_without_listing_id(tmp_path):
+    """listing_id가 없는 스냅샷도 product_id 기준으로 조회"""
+    store = SnapshotStore(str(tmp_path))
+    store.append(
+        "키워드",
+        pd.DataFrame({"product_id": ["1"], "price": [1_000], "review_count": [0]}),
+        captured_at="2024-01-01",
+    )
+
+    history = store.product_history("키워드", ["1"])
+
+    assert history["price"].tolist() == [1_000]
+    assert "listing_id" not in history.columns
+
+
+def test_product_history_unknown_keyword(tmp_path):
+    history = SnapshotStore(str(tmp_path)).product_history("없음", ["1"])
+
+    assert history.empty
+    assert list(history.columns) == [
+        "product_id",
+        "listing_id",
+        "captured_at",
+        "price",
+        "review_count",
+    ]